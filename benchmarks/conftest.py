@@ -0,0 +1,16 @@
+"""Pytest configuration of the benchmarks."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_and_teardown_package(tmp_path_factory):
+    """Use the Agg backend and a temporary cache directory."""
+    import matplotlib as mpl
+
+    from weldx_widgets.cache import CACHE_DIR_ENV_VAR
+
+    mpl.use("Agg", force=True)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CACHE_DIR_ENV_VAR, str(tmp_path_factory.mktemp("cache")))
+        yield
@@ -0,0 +1,26 @@
+"""Benchmarks of importing the package in a fresh interpreter."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "statement",
+    (
+        "pass",  # start-up of the interpreter, as reference.
+        "import weldx_widgets",
+        "from weldx_widgets import WidgetGrooveSelection",  # first use, loading weldx and matplotlib.
+    ),
+)
+def test_import(benchmark, statement):
+    """Run the import statement in a new interpreter, so no module is cached."""
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", statement],),
+        kwargs=dict(check=True),
+        rounds=5,
+        iterations=1,
+        warmup_rounds=1,
+    )
@@ -0,0 +1,49 @@
+"""Benchmarks of the k3d and matplotlib visualizations."""
+
+import k3d
+import matplotlib.pyplot as plt
+import pytest
+
+from benchmarks.util import make_csm, make_surface
+from weldx_widgets.visualization.csm_k3d import CoordinateSystemManagerVisualizerK3D, SpatialDataVisualizer
+from weldx_widgets.visualization.csm_mpl import plot_spatial_data_matplotlib
+
+
+@pytest.mark.parametrize("num_times", (10, 1000))
+@pytest.mark.parametrize("num_lcs", (2, 10))
+def test_csm_k3d_construction(benchmark, num_lcs, num_times):
+    """Create the k3d visualization of N coordinate systems with M time steps."""
+    csm = make_csm(num_lcs, num_times)
+    benchmark(CoordinateSystemManagerVisualizerK3D, csm, show_labels=False)
+
+
+@pytest.mark.parametrize("num_times", (10, 1000))
+@pytest.mark.parametrize("num_lcs", (2, 10))
+def test_csm_k3d_update_time_index(benchmark, num_lcs, num_times):
+    """Step through the time steps of N coordinate systems."""
+    vis = CoordinateSystemManagerVisualizerK3D(make_csm(num_lcs, num_times), show_labels=False)
+    indices = iter(range(10**9))
+    benchmark(lambda: vis.update_time_index(next(indices) % num_times))
+
+
+@pytest.mark.parametrize("num_vertices", (10**3, 10**5, 10**6))
+def test_spatial_data_k3d(benchmark, num_vertices):
+    """Add a triangulated surface of K vertices to a k3d plot."""
+    data = make_surface(num_vertices)
+    plot = k3d.plot()
+    benchmark(SpatialDataVisualizer, data, "surface", "base", plot)
+
+
+@pytest.mark.parametrize("num_vertices", (10**3, 10**4))
+def test_spatial_data_matplotlib(benchmark, num_vertices):
+    """Plot a triangulated surface of K vertices with matplotlib."""
+    data = make_surface(num_vertices)
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="3d")
+
+    def plot():
+        ax.clear()
+        plot_spatial_data_matplotlib(data, axes=ax)
+
+    benchmark(plot)
+    plt.close(fig)
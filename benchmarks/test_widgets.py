@@ -0,0 +1,47 @@
+"""Benchmarks of the widgets."""
+
+import pytest
+
+from weldx import WeldxFile
+from weldx_widgets import WidgetGrooveSelection
+from weldx_widgets.geometry_cache import default_geometry_cache
+from weldx_widgets.synthetic import generate_single_pass_weld
+from weldx_widgets.visualization.decimation import default_pyramid_cache
+from weldx_widgets.widget_evaluate import WidgetEvaluateSinglePassWeld
+
+
+@pytest.mark.parametrize("thumbnail", (False, True))
+def test_groove_update_plot(benchmark, thumbnail):
+    """Re-plot the groove after a parameter changed."""
+    w = WidgetGrooveSelection(thumbnail=thumbnail)
+    root_gap = w.groove_params_dropdowns["root_gap"]
+    values = iter(range(10**9))
+
+    def update():
+        # distinct values, so thumbnails are not taken from the cache.
+        with root_gap.silence_events():
+            root_gap.float_value = 1 + next(values) % 1000 / 100
+        w._update_plot()
+
+    benchmark(update)
+    w.close()
+
+
+@pytest.mark.parametrize("num_samples", (10**3, 10**5, 10**6))
+def test_evaluate_single_pass_weld(benchmark, tmp_path, num_samples):
+    """Open a generated weld file of increasing size and render all tabs, with empty caches."""
+    fn = generate_single_pass_weld(tmp_path / "weld.wx", duration="10 s", sample_rate=f"{num_samples / 10} Hz")
+
+    def setup():
+        default_geometry_cache().clear()
+        default_pyramid_cache().clear()
+        # the widget adds the workpiece geometry to the CSM of the file.
+        return (WeldxFile(fn),), {}
+
+    def evaluate(wx_file):
+        w = WidgetEvaluateSinglePassWeld(wx_file, background=False)
+        for i, _ in enumerate(w.tabs):
+            w.selected_index = i
+        w.close()
+
+    benchmark.pedantic(evaluate, setup=setup, rounds=3)
@@ -0,0 +1,29 @@
+"""Synthetic inputs of the benchmarks."""
+
+import numpy as np
+import pandas as pd
+
+from weldx import Q_, CoordinateSystemManager, SpatialData, Time
+
+
+def make_csm(num_lcs: int, num_times: int) -> CoordinateSystemManager:
+    """Return a CSM with a chain of ``num_lcs`` systems moving along ``num_times`` steps."""
+    csm = CoordinateSystemManager("base")
+    time = Time(pd.to_timedelta(np.linspace(0, 10, num_times), "s"))
+    t = np.linspace(0, 1, num_times)[:, np.newaxis]
+    for i in range(num_lcs):
+        coordinates = np.hstack([t * 100, np.sin(t * (i + 1)), np.cos(t * (i + 1))])
+        csm.create_cs(f"lcs_{i}", "base" if i == 0 else f"lcs_{i - 1}", coordinates=Q_(coordinates, "mm"), time=time)
+    return csm
+
+
+def make_surface(num_vertices: int) -> SpatialData:
+    """Return a triangulated wavy surface of about ``num_vertices`` vertices."""
+    n = max(int(np.sqrt(num_vertices)), 2)
+    x, y = np.meshgrid(np.linspace(0, 100, n), np.linspace(-10, 10, n), indexing="ij")
+    z = np.sin(x / 5) * np.cos(y / 5)
+    points = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+    idx = np.arange(n * n).reshape(n, n)
+    a, b, c, d = idx[:-1, :-1], idx[1:, :-1], idx[:-1, 1:], idx[1:, 1:]
+    triangles = np.concatenate([np.stack([a, b, c], -1), np.stack([b, d, c], -1)]).reshape(-1, 3)
+    return SpatialData(Q_(points, "mm"), triangles=triangles.astype(np.uint32))
@@ -1,21 +1,41 @@
-"""Weldx widgets."""
-from .generic import WidgetSaveButton, WidgetTimeSeries
-from .widget_factory import WidgetFloatWithUnit, WidgetLabeledTextInput
-from .widget_gas import WidgetShieldingGas
-from .widget_gmaw import WidgetGMAW
-from .widget_groove_sel import WidgetGrooveSelection, WidgetGrooveSelectionTCPMovement
-
-__all__ = [
-    WidgetGrooveSelection,
-    WidgetGrooveSelectionTCPMovement,
-    WidgetShieldingGas,
-    WidgetTimeSeries,
-    WidgetLabeledTextInput,
-    WidgetSaveButton,
-    WidgetGMAW,
-    WidgetFloatWithUnit,
-]
-__all__ = map(str, (x.__name__ for x in __all__))
+"""Weldx widgets.
+
+The widgets are imported on first access, so importing the package does not load
+weldx, matplotlib or k3d.
+"""
+
+import importlib
+
+# public name -> module defining it
+_LAZY_IMPORTS = {
+    "WidgetGrooveSelection": ".widget_groove_sel",
+    "WidgetGrooveSelectionTCPMovement": ".widget_groove_sel",
+    "WidgetShieldingGas": ".widget_gas",
+    "WidgetTimeSeries": ".generic",
+    "WidgetLabeledTextInput": ".widget_factory",
+    "WidgetSaveButton": ".generic",
+    "WidgetGMAW": ".widget_gmaw",
+    "WidgetFloatWithUnit": ".widget_factory",
+    "WidgetQuantity": ".widget_factory",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Import public names on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
 
 from importlib.metadata import PackageNotFoundError, version
 
@@ -0,0 +1,99 @@
+"""Helpers for on-disk caches."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+__all__ = [
+    "content_hash",
+    "default_cache_dir",
+    "file_stamp",
+    "get_cache_dir",
+    "source_hash",
+]
+
+CACHE_DIR_ENV_VAR = "WELDX_WIDGETS_CACHE_DIR"
+"""Environment variable overriding the root directory of all on-disk caches."""
+
+_HASH_CHUNK_BYTES = 1 << 24
+
+
+def get_cache_dir(name: str) -> Path:
+    """Return (and create) the cache directory of the given name.
+
+    The root directory is taken from the environment variable
+    ``WELDX_WIDGETS_CACHE_DIR``. It defaults to ``weldx_widgets`` within
+    ``XDG_CACHE_HOME`` or ``~/.cache``.
+
+    Parameters
+    ----------
+    name :
+        Name of the sub-directory, e.g. the kind of cached objects.
+
+    """
+    root = os.environ.get(CACHE_DIR_ENV_VAR)
+    if not root:
+        xdg = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        root = Path(xdg) / "weldx_widgets"
+    path = Path(root) / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def default_cache_dir(name: str) -> Path | None:
+    """Return the cache directory of the given name, if caching to disk is enabled.
+
+    The default caches only write to disk, if the root directory is set by the
+    environment variable ``WELDX_WIDGETS_CACHE_DIR`` and the directory can be
+    created. Otherwise `None` is returned and the caches stay in memory.
+
+    Parameters
+    ----------
+    name :
+        Name of the sub-directory, e.g. the kind of cached objects.
+
+    """
+    if not os.environ.get(CACHE_DIR_ENV_VAR):
+        return None
+    with contextlib.suppress(OSError):
+        return get_cache_dir(name)
+    return None
+
+
+def content_hash(*arrays: np.ndarray) -> str:
+    """Return a hex digest of the contents, shapes and types of the given arrays.
+
+    Large arrays are hashed chunk-wise, so memory-mapped arrays are never fully loaded
+    into memory.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        arr = np.asarray(arr)
+        h.update(f"{arr.dtype.str}{arr.shape}".encode())
+        flat = arr.reshape(-1)
+        step = max(_HASH_CHUNK_BYTES // max(arr.itemsize, 1), 1)
+        for start in range(0, flat.size, step):
+            h.update(np.ascontiguousarray(flat[start : start + step]).data)
+    return h.hexdigest()
+
+
+def file_stamp(filename: str | Path) -> list[int]:
+    """Return the modification time (in ns) and the size of a file, which change with its contents."""
+    stat = os.stat(filename)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def source_hash(filename: str | Path, *parts) -> str:
+    """Return a hex digest identifying data stored in a file, without reading the data.
+
+    The digest changes with the resolved path and the `file_stamp` of the file and the
+    given JSON serializable ``parts``, e.g. the path of a node, its shape and data type.
+    """
+    key = [str(Path(filename).resolve()), *file_stamp(filename), *parts]
+    return hashlib.blake2b(json.dumps(key, default=str).encode(), digest_size=16).hexdigest()
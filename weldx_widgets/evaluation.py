@@ -0,0 +1,222 @@
+"""Numerical helpers for the evaluation of weldx files."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from weldx import CoordinateSystemManager, LocalCoordinateSystem
+
+__all__ = [
+    "TCPDeviation",
+    "compare_tcp",
+    "repair_scan_points",
+]
+
+
+class TCPDeviation:
+    """Deviation of a coordinate system from its design on a common time grid.
+
+    Parameters
+    ----------
+    time :
+        Time steps of the common grid in seconds since the first step.
+    deviation :
+        Design coordinates minus actual coordinates for each time step as array of
+        shape (n, 3) in ``unit``.
+    unit :
+        Length unit of the deviation.
+
+    """
+
+    components = ("x", "y", "z")
+
+    def __init__(self, time: np.ndarray, deviation: np.ndarray, unit: str = "mm"):
+        self.time = time
+        self.deviation = deviation
+        self.unit = unit
+
+    @property
+    def distance(self) -> np.ndarray:
+        """Return the euclidean distance between design and actual coordinates."""
+        return np.linalg.norm(self.deviation, axis=-1)
+
+    def statistics(self, percentiles: Sequence[float] = (50, 95, 99)) -> pd.DataFrame:
+        """Return statistics of the absolute deviation per component and of the distance.
+
+        Parameters
+        ----------
+        percentiles :
+            Percentiles of the absolute deviation to compute.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The maximum, the root-mean-square and the requested percentiles as columns,
+            indexed by the components ``x``, ``y``, ``z`` and ``distance``.
+
+        """
+        values = np.column_stack([np.abs(self.deviation), self.distance])
+        stats = {
+            "max": values.max(axis=0),
+            "rms": np.sqrt(np.mean(values**2, axis=0)),
+        }
+        if len(percentiles):
+            for p, row in zip(percentiles, np.percentile(values, percentiles, axis=0)):
+                stats[f"p{p:g}"] = row
+        return pd.DataFrame(stats, index=[*self.components, "distance"]).rename_axis(f"deviation / {self.unit}")
+
+
+def _time_and_coordinates(lcs: LocalCoordinateSystem, unit: str) -> tuple[np.ndarray | None, np.ndarray]:
+    """Return the time steps as int64 nanoseconds and the coordinates in ``unit``."""
+    coordinates = np.asarray(lcs.coordinates.data.to(unit).m, dtype=float)
+    if lcs.time is None:
+        return None, coordinates.reshape(1, 3)
+    index = lcs.time.as_pandas_index()
+    return index.asi8, coordinates.reshape(len(index), 3)
+
+
+def _interp(grid: np.ndarray, time: np.ndarray | None, coordinates: np.ndarray) -> np.ndarray:
+    if time is None:
+        return np.broadcast_to(coordinates, (len(grid), 3))
+    return np.column_stack([np.interp(grid, time, coordinates[:, i]) for i in range(3)])
+
+
+def compare_tcp(
+    csm: CoordinateSystemManager,
+    design: str = "TCP design",
+    actual: str = "TCP",
+    reference_system: str = "workpiece",
+    unit: str = "mm",
+) -> TCPDeviation:
+    """Compare a coordinate system with its design.
+
+    Only the two coordinate systems are transformed into the reference system. Both are
+    put on the union of their time steps by linear interpolation, holding the first and
+    last values outside their time range.
+
+    Parameters
+    ----------
+    csm :
+        The coordinate system manager containing both coordinate systems.
+    design :
+        Name of the designed coordinate system.
+    actual :
+        Name of the actual coordinate system.
+    reference_system :
+        Name of the system both are compared in.
+    unit :
+        Length unit of the returned deviation.
+
+    """
+    t_design, c_design = _time_and_coordinates(csm.get_cs(design, reference_system), unit)
+    t_actual, c_actual = _time_and_coordinates(csm.get_cs(actual, reference_system), unit)
+
+    times = [t for t in (t_design, t_actual) if t is not None]
+    grid = np.unique(np.concatenate(times)) if times else np.zeros(1, dtype=np.int64)
+
+    deviation = _interp(grid, t_design, c_design) - _interp(grid, t_actual, c_actual)
+    time = (grid - grid[0]) / 1e9
+    return TCPDeviation(time, deviation, unit)
+
+
+def _first_valid_points(view: np.ndarray, valid_func, chunk_size: int) -> np.ndarray:
+    """Return the first valid point of each profile, NaN for profiles without one."""
+    head = np.full(view.shape[:-2] + (3,), np.nan, dtype=view.dtype)
+    found = np.zeros(view.shape[:-2], dtype=bool)
+    for start in range(0, view.shape[-2], chunk_size):
+        block = view[..., start : start + chunk_size, :]
+        valid = valid_func(block)
+        new = valid.any(axis=-1) & ~found
+        if new.any():
+            sel = np.nonzero(new)
+            first = valid[sel].argmax(axis=-1)
+            head[sel] = block[(*sel, first)]
+            found |= new
+        if found.all():
+            break
+    return head
+
+
+def _repair_block(block: np.ndarray, valid: np.ndarray, carry: np.ndarray) -> int:
+    """Fill invalid points of a block in place from their last valid predecessor.
+
+    Invalid points without a valid predecessor in the block are set to ``carry``,
+    the last valid point of the preceding blocks or the first valid point of the profile.
+    """
+    invalid = np.nonzero(~valid)
+    if not len(invalid[0]):
+        return 0
+    n = valid.shape[-1]
+    index_type = np.int32 if n < 2**31 else np.intp
+    # index of the last valid point up to each position, -1 if there is none.
+    previous = np.where(valid, np.arange(n, dtype=index_type), index_type(-1))
+    np.maximum.accumulate(previous, axis=-1, out=previous)
+
+    source = previous[invalid]
+    in_block = source >= 0
+    dst = tuple(i[in_block] for i in invalid)
+    block[dst] = block[(*dst[:-1], source[in_block])]
+
+    profiles = tuple(i[~in_block] for i in invalid[:-1])
+    dst = tuple(i[~in_block] for i in invalid)
+    block[dst] = carry[profiles]
+    return int(in_block.sum() + np.isfinite(carry[profiles]).all(axis=-1).sum())
+
+
+def _positive_z(block: np.ndarray) -> np.ndarray:
+    return block[..., 2] > 0
+
+
+def repair_scan_points(points: np.ndarray, axis: int = -2, chunk_size: int = None, valid_func=None) -> int:
+    """Replace invalid points of scan profiles in place.
+
+    Each invalid point is replaced by the last valid point before it along the profile
+    axis (forward fill). Leading invalid points are replaced by the first valid point
+    (backward fill). Points of profiles without any valid point are set to NaN.
+
+    Parameters
+    ----------
+    points :
+        Writable array of points with the coordinates ``x, y, z`` in the last axis, e.g.
+        the float32 magnitude of `weldx.SpatialData.coordinates` or a memory-mapped
+        array opened in ``r+`` mode.
+    axis :
+        The profile axis, along which the points are filled.
+    chunk_size :
+        If given, process at most this many points per profile at once, so the
+        temporary memory stays bounded for memory-mapped arrays bigger than RAM.
+    valid_func :
+        Function returning the boolean mask of valid points for a block of points.
+        By default, points with a positive z-coordinate are valid, which also rules
+        out NaN points.
+
+    Returns
+    -------
+    int
+        The number of repaired points.
+
+    """
+    if points.shape[-1] != 3:
+        raise ValueError("the last axis has to hold the three coordinates of each point.")
+    if axis % points.ndim == points.ndim - 1:
+        raise ValueError("the profile axis must not be the coordinate axis.")
+    if not points.flags.writeable:
+        raise ValueError("points have to be writable to be repaired in place.")
+    if valid_func is None:
+        valid_func = _positive_z
+
+    # views only, so all assignments below write into ``points``.
+    view = np.moveaxis(points, axis % points.ndim, -2)[np.newaxis]
+    n = view.shape[-2]
+    chunk_size = n if chunk_size is None else max(int(chunk_size), 1)
+
+    carry = _first_valid_points(view, valid_func, chunk_size)
+    repaired = 0
+    for start in range(0, n, chunk_size):
+        block = view[..., start : start + chunk_size, :]
+        repaired += _repair_block(block, valid_func(block), carry)
+        carry = np.array(block[..., -1, :])
+    return repaired
@@ -0,0 +1,217 @@
+"""Lifetime management of the matplotlib figures shown by widgets."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from contextlib import contextmanager
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+from matplotlib._pylab_helpers import Gcf
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+__all__ = [
+    "FigureRegistry",
+    "ThumbnailCache",
+    "enable_widget_backend",
+    "figure_registry",
+    "render_png",
+]
+
+_backend_lock = threading.Lock()
+_widget_backend_enabled = False
+
+
+def enable_widget_backend() -> bool:
+    """Switch IPython to the interactive ipympl backend (``%matplotlib widget``) once.
+
+    Later calls return immediately, so widgets can call this on construction. Returns
+    if the backend is enabled, which is never the case outside of IPython.
+    """
+    global _widget_backend_enabled
+    with _backend_lock:
+        if not _widget_backend_enabled:
+            from IPython import get_ipython
+
+            ip = get_ipython()
+            if ip is None:
+                return False
+            if "ipympl" not in mpl.get_backend():
+                ip.run_line_magic("matplotlib", "widget")
+            _widget_backend_enabled = True
+    return True
+
+
+def _is_open(fig: Figure) -> bool:
+    manager = fig.canvas.manager
+    return manager is not None and Gcf.figs.get(manager.num) is manager
+
+
+class FigureRegistry:
+    """Keep track of the pyplot figures of widgets and close them together with the widget.
+
+    pyplot keeps every figure alive until it is closed explicitly, which interactive
+    backends like ipympl never do. Figures are assigned to an owner with `register` or
+    `track` and closed by `release`, which is called automatically when an owning
+    ipywidget is closed. The figures are only referenced weakly and the entry of an
+    owner is dropped when it is released or garbage collected, closing its figures.
+
+    Use the shared instance `figure_registry`.
+    """
+
+    def __init__(self):
+        self._figures: dict[int, weakref.WeakSet[Figure]] = {}
+        self._lock = threading.Lock()
+        self._tracking = threading.local()
+
+    def __len__(self):
+        """Return the number of owners with registered figures."""
+        with self._lock:
+            return len(self._figures)
+
+    def register(self, owner, *figures: Figure):
+        """Assign figures to ``owner``, closing them when the owning widget is closed."""
+        with self._lock:
+            key = id(owner)
+            if key not in self._figures:
+                entry = self._figures[key] = weakref.WeakSet()
+                if hasattr(owner, "comm") and hasattr(owner, "observe"):  # ipywidgets.Widget
+                    owner.observe(self._on_comm_changed, names="comm")
+                # owners which cannot be referenced weakly are only dropped on release.
+                with contextlib.suppress(TypeError):
+                    weakref.finalize(owner, self._drop, key, entry)
+            self._figures[key].update(figures)
+
+    def _drop(self, key, entry):
+        with self._lock:
+            # the id may have been reused by another owner in the meantime.
+            if self._figures.get(key) is entry:
+                del self._figures[key]
+        # nobody can show the figures of a collected owner anymore.
+        for fig in list(entry):
+            if _is_open(fig):
+                plt.close(fig)
+
+    @contextmanager
+    def track(self, owner, replace: bool = False):
+        """Register all pyplot figures created within the block for ``owner``.
+
+        This includes figures created implicitly, e.g. by plot methods of weldx objects.
+        With ``replace``, the figures previously registered for ``owner`` are released
+        first, e.g. when it is rendered again.
+
+        Blocks nested into the block of another owner in the same thread register nothing,
+        the figures belong to the outer owner only. So the figures of widgets created by
+        another widget are closed together with it.
+        """
+        if replace:
+            self.release(owner)
+        if getattr(self._tracking, "owner", None) is not None:
+            yield
+            return
+        before = set(Gcf.figs)
+        self._tracking.owner = owner
+        try:
+            yield
+        finally:
+            self._tracking.owner = None
+            managers = [m for num, m in list(Gcf.figs.items()) if num not in before]
+            self.register(owner, *(m.canvas.figure for m in managers))
+
+    def release(self, owner) -> int:
+        """Close the figures of ``owner`` and return how many were still open."""
+        with self._lock:
+            figures = list(self._figures.pop(id(owner), ()))
+        num_open = 0
+        for fig in figures:
+            if _is_open(fig):
+                num_open += 1
+                plt.close(fig)
+        return num_open
+
+    def _on_comm_changed(self, change):
+        if change["new"] is None:  # the widget was closed.
+            self.release(change["owner"])
+
+    def figures(self, owner=None) -> list[Figure]:
+        """Return the open figures of ``owner`` or of all owners."""
+        with self._lock:
+            if owner is not None:
+                figures = list(self._figures.get(id(owner), ()))
+            else:
+                figures = [fig for figs in self._figures.values() for fig in figs]
+        unique = list({id(fig): fig for fig in figures}.values())
+        return [fig for fig in unique if _is_open(fig)]
+
+    @property
+    def num_figures(self) -> int:
+        """Return the number of open figures of all owners."""
+        return len(self.figures())
+
+
+figure_registry = FigureRegistry()
+
+
+def render_png(plot: Callable[[Axes], object], figsize=(4.0, 3.0), dpi: int = 72) -> bytes:
+    """Call ``plot`` with the axes of a new figure and return the figure as PNG.
+
+    The figure is not managed by pyplot, so no interactive canvas is created and
+    nothing has to be closed.
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    plot(fig.add_subplot())
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+    return buffer.getvalue()
+
+
+class ThumbnailCache:
+    """In-memory LRU cache of PNG thumbnails rendered by `render_png`.
+
+    Parameters
+    ----------
+    maxsize :
+        Maximum number of thumbnails kept.
+    figsize :
+        Size of the thumbnails in inches.
+    dpi :
+        Resolution of the thumbnails.
+
+    """
+
+    def __init__(self, maxsize: int = 128, figsize=(4.0, 3.0), dpi: int = 72):
+        self.maxsize = maxsize
+        self.figsize = figsize
+        self.dpi = dpi
+        self._thumbnails: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of cached thumbnails."""
+        return len(self._thumbnails)
+
+    def get(self, key: Hashable, plot: Callable[[Axes], object]) -> bytes:
+        """Return the thumbnail of ``key``, rendering it with ``plot`` if not cached."""
+        with self._lock:
+            if key in self._thumbnails:
+                self._thumbnails.move_to_end(key)
+                return self._thumbnails[key]
+        png = render_png(plot, self.figsize, self.dpi)
+        with self._lock:
+            self._thumbnails[key] = png
+            while len(self._thumbnails) > self.maxsize:
+                self._thumbnails.popitem(last=False)
+        return png
+
+    def clear(self):
+        """Remove all thumbnails."""
+        with self._lock:
+            self._thumbnails.clear()
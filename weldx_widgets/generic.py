@@ -93,6 +93,8 @@ class WidgetSaveButton(WidgetMyHBox):
 class WidgetTimeSeries(WidgetMyVBox, WeldxImportExport):
     """Preliminary time series editing widget."""
 
+    snapshot_fields = ("base_data", "base_unit", "time_data", "time_unit")
+
     # TODO: handle math-expr
     def __init__(self, base_unit, time_unit="s", base_data="0", time_data="0", title=""):
         layout_prefilled_text = copy_layout(textbox_layout)
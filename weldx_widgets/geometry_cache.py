@@ -0,0 +1,207 @@
+"""Content-addressed cache for rasterized workpiece geometries."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pint
+
+from weldx import Q_, Geometry, LinearHorizontalTraceSegment, SpatialData, Trace
+from weldx.welding.groove.iso_9692_1 import IsoBaseGroove
+from weldx_widgets.cache import default_cache_dir
+
+__all__ = [
+    "GeometryCache",
+    "default_geometry_cache",
+    "rasterize_workpiece",
+    "workpiece_key",
+]
+
+
+def _format_quantity(value) -> str:
+    if isinstance(value, pint.Quantity):
+        value = value.to_base_units()
+        return f"{value.m!r} {value.u:~}"
+    return repr(value)
+
+
+def workpiece_key(
+    groove: IsoBaseGroove,
+    seam_length: pint.Quantity,
+    profile_width: pint.Quantity,
+    profile_raster_width: pint.Quantity,
+    trace_raster_width: pint.Quantity,
+) -> str:
+    """Return a hash identifying the rasterized geometry of a linear workpiece."""
+    params = dict(groove.parameters())
+    params["code_number"] = getattr(groove, "code_number", None)
+    parts = [type(groove).__name__]
+    parts += [f"{k}={_format_quantity(params[k])}" for k in sorted(params)]
+    parts += [
+        _format_quantity(q)
+        for q in (
+            Q_(seam_length),
+            Q_(profile_width),
+            Q_(profile_raster_width),
+            Q_(trace_raster_width),
+        )
+    ]
+    return hashlib.blake2b(";".join(parts).encode(), digest_size=16).hexdigest()
+
+
+class GeometryCache:
+    """Cache of rasterized workpiece geometries keyed by their defining parameters.
+
+    Rasterized geometries are kept in an in-memory LRU cache. If a ``directory`` is
+    given, they are additionally stored as ``.npz`` files, so re-opening files of the
+    same specimen series skips the rasterization in new sessions as well. Geometries
+    which cannot be written to the directory, e.g. as it is read-only or full, are only
+    kept in memory.
+
+    Parameters
+    ----------
+    maxsize :
+        Maximum number of geometries kept in memory.
+    directory :
+        Directory of the on-disk layer. If `None`, only the in-memory layer is used.
+
+    """
+
+    def __init__(self, maxsize: int = 32, directory: str | Path = None):
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        self._memory: OrderedDict[str, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of geometries kept in memory."""
+        return len(self._memory)
+
+    def get(self, key: str, rasterize) -> SpatialData:
+        """Return the geometry stored under ``key``, calling ``rasterize`` on a miss.
+
+        Parameters
+        ----------
+        key :
+            The key identifying the geometry, see `workpiece_key`.
+        rasterize :
+            Function without arguments returning the rasterized `weldx.SpatialData`.
+
+        """
+        with self._lock:
+            arrays = self._memory.get(key)
+            if arrays is not None:
+                self._memory.move_to_end(key)
+        if arrays is None:
+            arrays = self._load(key)
+        if arrays is None:
+            data = rasterize()
+            arrays = self._to_arrays(data)
+            self._store(key, arrays)
+        self._remember(key, arrays)
+        coordinates, triangles = arrays
+        return SpatialData(Q_(coordinates, "mm"), triangles)
+
+    @staticmethod
+    def _to_arrays(data: SpatialData) -> tuple[np.ndarray, np.ndarray]:
+        # copies, as the arrays are shared by all returned geometries and frozen.
+        coordinates = np.array(data.coordinates.data.to("mm").m)
+        triangles = np.array(data.triangles)
+        for arr in (coordinates, triangles):
+            arr.setflags(write=False)
+        return coordinates, triangles
+
+    def _remember(self, key, arrays):
+        with self._lock:
+            self._memory[key] = arrays
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+    def _load(self, key) -> tuple[np.ndarray, np.ndarray] | None:
+        if self.directory is None:
+            return None
+        try:
+            with np.load(self.directory / f"{key}.npz") as f:
+                coordinates, triangles = f["coordinates"], f["triangles"]
+        except (OSError, KeyError, ValueError):
+            return None
+        for arr in (coordinates, triangles):
+            arr.setflags(write=False)
+        return coordinates, triangles
+
+    def _store(self, key, arrays):
+        if self.directory is None:
+            return
+        coordinates, triangles = arrays
+        tmp = self.directory / f".{key}.{threading.get_ident()}.npz"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            np.savez(tmp, coordinates=coordinates, triangles=triangles)
+            tmp.replace(self.directory / f"{key}.npz")
+        except OSError:  # e.g. a read-only or full cache directory, keep the geometry in memory only.
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
+
+    def clear(self):
+        """Remove all cached geometries from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+        if self.directory is not None:
+            for f in self.directory.glob("*.npz"):
+                f.unlink(missing_ok=True)
+
+
+@lru_cache(None)
+def default_geometry_cache() -> GeometryCache:
+    """Return the process-wide geometry cache.
+
+    Geometries are only kept in memory, unless the cache root directory is set by the
+    environment variable ``WELDX_WIDGETS_CACHE_DIR``. They are then also stored in its
+    ``geometry`` directory (see `weldx_widgets.cache.default_cache_dir`).
+    """
+    return GeometryCache(directory=default_cache_dir("geometry"))
+
+
+def rasterize_workpiece(
+    groove: IsoBaseGroove,
+    seam_length: pint.Quantity,
+    profile_width: pint.Quantity,
+    profile_raster_width: pint.Quantity,
+    trace_raster_width: pint.Quantity,
+    cache: GeometryCache = None,
+) -> SpatialData:
+    """Rasterize a workpiece with a linear seam, reusing cached results.
+
+    Parameters
+    ----------
+    groove :
+        The groove shape of the workpiece.
+    seam_length :
+        Length of the linear weld seam.
+    profile_width :
+        Width of the profile passed to `IsoBaseGroove.to_profile`.
+    profile_raster_width :
+        Target distance between the individual points of a profile.
+    trace_raster_width :
+        Target distance between the individual profiles on the trace.
+    cache :
+        The cache to use. Defaults to `default_geometry_cache`.
+
+    """
+    if cache is None:
+        cache = default_geometry_cache()
+
+    def rasterize():
+        trace = Trace(LinearHorizontalTraceSegment(seam_length))
+        geometry = Geometry(groove.to_profile(width_default=profile_width), trace)
+        return geometry.spatial_data(profile_raster_width, trace_raster_width)
+
+    key = workpiece_key(groove, seam_length, profile_width, profile_raster_width, trace_raster_width)
+    return cache.get(key, rasterize)
@@ -0,0 +1,627 @@
+"""Opt-in profiling of the stages, trait observers and frontend traffic of expensive widgets."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import pint
+import traitlets
+
+__all__ = [
+    "CommMeter",
+    "ObserverProfiler",
+    "StageProfiler",
+    "payload_nbytes",
+]
+
+
+def payload_nbytes(obj) -> int:
+    """Return the number of bytes held by the arrays of an object.
+
+    Supported are numpy arrays, quantities, xarray objects, mappings and sequences of
+    those, `weldx.SpatialData` and k3d plots and objects. Other objects count zero bytes.
+    """
+    return _nbytes(obj, set())
+
+
+def _nbytes(obj, seen: set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, pint.Quantity):
+        return _nbytes(obj.magnitude, seen)
+    if isinstance(obj, dict):
+        return sum(_nbytes(v, seen) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(_nbytes(v, seen) for v in obj)
+    if hasattr(obj, "variable"):  # xarray.DataArray
+        return _nbytes(obj.variable.data, seen)
+    if hasattr(obj, "coordinates") and hasattr(obj, "triangles"):  # weldx.SpatialData
+        return _nbytes(obj.coordinates, seen) + _nbytes(obj.triangles, seen)
+    if hasattr(obj, "objects") and hasattr(obj, "camera"):  # k3d.Plot
+        return _nbytes(list(obj.objects), seen)
+    if hasattr(obj, "trait_names") and hasattr(obj, "model_matrix"):  # k3d objects
+        return sum(_nbytes(getattr(obj, name), seen) for name in obj.trait_names())
+    return 0
+
+
+_tracing_lock = threading.Lock()
+_tracing_stages = 0
+_tracing_started = False
+
+
+def _start_tracing():
+    """Start `tracemalloc` for a stage, unless it is already running."""
+    global _tracing_stages, _tracing_started
+    with _tracing_lock:
+        if _tracing_stages == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_started = True
+        _tracing_stages += 1
+
+
+def _stop_tracing():
+    """Stop `tracemalloc` after the last running stage, if it was started for stages."""
+    global _tracing_stages, _tracing_started
+    with _tracing_lock:
+        _tracing_stages -= 1
+        if _tracing_stages == 0 and _tracing_started:
+            tracemalloc.stop()
+            _tracing_started = False
+
+
+class _Stage:
+    """Measurement of a single stage, see `StageProfiler.stage`."""
+
+    __slots__ = ("name", "payload_bytes")
+
+    def __init__(self, name):
+        self.name = name
+        self.payload_bytes = None
+
+    def payload(self, obj):
+        """Add the array bytes held by ``obj`` to the payload of the stage."""
+        self.payload_bytes = (self.payload_bytes or 0) + payload_nbytes(obj)
+        return obj
+
+
+class StageProfiler:
+    """Record the wall time, peak memory and payload bytes of named stages.
+
+    Stages are measured with the `stage` context manager. A disabled profiler does not
+    measure anything, so code can be instrumented unconditionally.
+
+    The peak memory is measured with `tracemalloc`, which is started while stages are
+    running if necessary and slows down allocations noticeably. It is the peak of traced
+    memory during the stage minus the traced memory at its start. Allocations of other
+    threads running at the same time are included. Pass ``trace_memory=False`` to only
+    measure times and payloads.
+
+    Parameters
+    ----------
+    enabled :
+        Record stages.
+    trace_memory :
+        Measure the peak memory of stages.
+
+    """
+
+    columns = ("stage", "wall_time_s", "peak_memory_bytes", "payload_bytes", "thread")
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = True):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.records: list[dict] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __bool__(self):
+        """Return if the profiler is enabled."""
+        return self.enabled
+
+    def _memory_stack(self) -> list[list[int]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure the enclosed code as stage of the given name.
+
+        Stages may be nested. The yielded object has a ``payload`` method to record the
+        size of the data produced by the stage::
+
+            with profiler.stage("rasterize") as stage:
+                data = stage.payload(geometry.spatial_data(...))
+
+        """
+        stage = _Stage(name)
+        if not self.enabled:
+            yield stage
+            return
+
+        stack = None
+        if self.trace_memory:
+            _start_tracing()
+            stack = self._memory_stack()
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:  # keep the peak of the enclosing stage, before resetting it.
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            stack.append([current, current])
+
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            wall_time = time.perf_counter() - start
+            peak_delta = None
+            if stack is not None:
+                baseline, peak = stack.pop()
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                peak_delta = peak - baseline
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], peak)
+                _stop_tracing()
+            record = dict(
+                stage=name,
+                wall_time_s=wall_time,
+                peak_memory_bytes=peak_delta,
+                payload_bytes=stage.payload_bytes,
+                thread=threading.current_thread().name,
+            )
+            with self._lock:
+                self.records.append(record)
+
+    def as_dict(self) -> dict[str, dict]:
+        """Return the summed wall times and payloads and the maximum peak memory per stage."""
+        result = {}
+        with self._lock:
+            records = list(self.records)
+        for r in records:
+            s = result.setdefault(
+                r["stage"],
+                dict(count=0, wall_time_s=0.0, peak_memory_bytes=None, payload_bytes=None),
+            )
+            s["count"] += 1
+            s["wall_time_s"] += r["wall_time_s"]
+            if r["peak_memory_bytes"] is not None:
+                s["peak_memory_bytes"] = max(s["peak_memory_bytes"] or 0, r["peak_memory_bytes"])
+            if r["payload_bytes"] is not None:
+                s["payload_bytes"] = (s["payload_bytes"] or 0) + r["payload_bytes"]
+        return result
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return all recorded stages in the order they finished."""
+        with self._lock:
+            return pd.DataFrame(self.records, columns=list(self.columns))
+
+    def reset(self):
+        """Remove all records."""
+        with self._lock:
+            self.records.clear()
+
+
+def _handler_name(handler) -> str:
+    """Return the qualified name of an observer, lambdas with their line number."""
+    func = getattr(handler, "__func__", handler)
+    name = getattr(func, "__qualname__", None) or type(handler).__name__
+    if name.endswith("<lambda>"):
+        name += f":{func.__code__.co_firstlineno}"
+    return name
+
+
+class _TimedHandler:
+    """Observer recording its calls in an `ObserverProfiler`.
+
+    It compares equal to the wrapped observer, so it is found by ``unobserve``. Handlers
+    defined with ``@observe`` by the class are called as the bound method ``func``.
+    """
+
+    __slots__ = ("func", "handler", "name", "profiler")
+
+    def __init__(self, handler, profiler: ObserverProfiler, func=None):
+        self.handler = handler
+        self.func = func if func is not None else handler
+        self.name = _handler_name(self.func)
+        self.profiler = profiler
+
+    @property
+    def __wrapped__(self):
+        return self.handler
+
+    def __call__(self, change):
+        profiler = self.profiler
+        if not profiler.enabled:
+            return self.func(change)
+        stack = profiler._call_stack()
+        stack.append(0.0)  # wall time of nested observers
+        start = time.perf_counter()
+        try:
+            return self.func(change)
+        finally:
+            wall_time = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += wall_time
+            profiler._record(self.name, change, wall_time, wall_time - nested)
+
+    def __eq__(self, other):
+        if isinstance(other, _TimedHandler):
+            other = other.handler
+        return self.handler == other
+
+    def __hash__(self):
+        return hash(self.handler)
+
+
+class ObserverProfiler:
+    """Record the calls of the trait observers of a widget tree.
+
+    Observers registered with ``observe`` on an instrumented widget or its descendants
+    (reached through ``children``, also those added later) and the handlers defined
+    with ``@observe`` by their classes are timed when they are called. The last
+    ``capacity`` calls are kept, the call count, total and maximum wall time per
+    observer are accumulated over all calls. Calls taking longer than ``threshold_s``
+    are flagged as slow. The self time of a call excludes the observers it triggered by
+    changing other traits.
+
+    Instrumenting a widget costs nothing until its traits change. A disabled profiler
+    calls the observers without timing them::
+
+        profiler = ObserverProfiler()
+        profiler.instrument(widget)
+        ...  # interact with the widget
+        profiler.to_dataframe()
+
+    See also `WidgetBase.profile_observers`.
+
+    Parameters
+    ----------
+    threshold_s :
+        Wall time in seconds, above which calls are flagged as slow.
+    capacity :
+        Number of calls to keep.
+    enabled :
+        Record calls.
+
+    """
+
+    columns = ("handler", "trait", "owner", "wall_time_s", "self_time_s", "slow", "thread")
+
+    def __init__(self, threshold_s: float = 0.1, capacity: int = 1000, enabled: bool = True):
+        self.threshold_s = threshold_s
+        self.enabled = enabled
+        self.records: deque[dict] = deque(maxlen=capacity)
+        self._stats: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __bool__(self):
+        """Return if the profiler is enabled."""
+        return self.enabled
+
+    def _call_stack(self) -> list[float]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def instrument(self, widget):
+        """Time the observers of the widget and its descendants and return the widget."""
+        from weldx_widgets.widget_base import _descendants
+
+        for w in _descendants(widget):
+            if "_notify_observers" in w.__dict__:  # already instrumented
+                continue
+            w._notify_observers = self._notify_hook(w, w._notify_observers)
+        return widget
+
+    def _notify_hook(self, widget, notify):
+        def _notify_observers(event):
+            self._wrap_observers(widget, event["name"])
+            notify(event)
+            if event["name"] == "children":
+                self.instrument(widget)
+
+        return _notify_observers
+
+    def _wrap_observers(self, widget, name):
+        """Replace the observers of the trait by timed ones, right before they are called."""
+        for key in (name, traitlets.All):
+            for kind in widget._trait_notifiers.get(key, {}).values():
+                for i, handler in enumerate(kind):
+                    if isinstance(handler, _TimedHandler):
+                        continue
+                    if isinstance(handler, traitlets.EventHandler):  # defined by the class
+                        kind[i] = _TimedHandler(handler, self, getattr(widget, handler.name))
+                    else:
+                        kind[i] = _TimedHandler(handler, self)
+
+    def _record(self, name, change, wall_time, self_time):
+        slow = wall_time > self.threshold_s
+        record = dict(
+            handler=name,
+            trait=change["name"],
+            owner=type(change["owner"]).__name__,
+            wall_time_s=wall_time,
+            self_time_s=self_time,
+            slow=slow,
+            thread=threading.current_thread().name,
+        )
+        with self._lock:
+            self.records.append(record)
+            s = self._stats.setdefault(name, dict(count=0, total_s=0.0, self_s=0.0, max_s=0.0, slow=0))
+            s["count"] += 1
+            s["total_s"] += wall_time
+            s["self_s"] += self_time
+            s["max_s"] = max(s["max_s"], wall_time)
+            s["slow"] += slow
+
+    def as_dict(self) -> dict[str, dict]:
+        """Return the call count, total, self and maximum time and slow calls per observer."""
+        with self._lock:
+            return {name: dict(s) for name, s in self._stats.items()}
+
+    def slow_handlers(self) -> list[str]:
+        """Return the observers with slow calls, slowest first."""
+        stats = self.as_dict()
+        return sorted((name for name, s in stats.items() if s["slow"]), key=lambda name: -stats[name]["max_s"])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the kept calls in the order they finished."""
+        with self._lock:
+            return pd.DataFrame(list(self.records), columns=list(self.columns))
+
+    def reset(self):
+        """Remove all records and statistics."""
+        with self._lock:
+            self.records.clear()
+            self._stats.clear()
+
+
+_meter_lock = threading.Lock()
+_active_meters: list[CommMeter] = []
+_original_widget_methods = {}
+_message_ids = itertools.count()
+_opening = threading.local()
+# major versions of ipywidgets, whose internals patched by `CommMeter` are known.
+_METERED_IPYWIDGETS_VERSIONS = (7, 8)
+
+
+def _json_nbytes(value) -> int:
+    # like the kernel session, which uses the default separators.
+    return len(json.dumps(value, default=str, ensure_ascii=False).encode("utf8", errors="surrogateescape"))
+
+
+def _message_sizes(msg: dict, buffers) -> dict[str, list[int]]:
+    """Return the JSON and buffer bytes per trait of a message to the frontend."""
+    buffers = buffers or []
+    if "state" not in msg:  # custom message
+        content = msg.get("content", msg)
+        return {"<custom>": [_json_nbytes(content), sum(memoryview(b).nbytes for b in buffers)]}
+    sizes = {name: [_json_nbytes(value), 0] for name, value in msg["state"].items()}
+    for path, buffer in zip(msg.get("buffer_paths", []), buffers):
+        sizes.setdefault(path[0], [0, 0])[1] += memoryview(buffer).nbytes
+    return sizes
+
+
+def _feature(widget) -> str:
+    """Return the visualizer feature of a widget, e.g. "vectors" of a k3d object named "TCP (vectors)"."""
+    name = getattr(widget, "name", None)
+    if isinstance(name, str) and name:
+        head, _, tail = name.rpartition(" (")
+        return tail.rstrip(")") if head else name
+    return type(widget).__name__
+
+
+def _dispatch(widget, method: str, msg: dict, buffers):
+    with _meter_lock:
+        meters = list(_active_meters)
+    if not meters:
+        return
+    sizes = _message_sizes(msg, buffers)
+    message = next(_message_ids)
+    for meter in meters:
+        meter._record(widget, method, message, sizes)
+
+
+def _metered_send(self, msg, buffers=None):
+    _original_widget_methods["_send"](self, msg, buffers=buffers)
+    if self.comm is not None:
+        _dispatch(self, msg.get("method", "update"), msg, buffers)
+
+
+def _metered_open(self):
+    if self.comm is not None:
+        return _original_widget_methods["open"](self)
+    previous = getattr(_opening, "serialized", None)
+    _opening.serialized = []
+    try:
+        _original_widget_methods["open"](self)
+        serialized = _opening.serialized
+    finally:
+        _opening.serialized = previous
+    if serialized and self.comm is not None:
+        # the first state serialized by ``open`` is the one sent.
+        state, buffer_paths, buffers = serialized[0]
+        _dispatch(self, "open", dict(state=state, buffer_paths=buffer_paths), buffers)
+    return None
+
+
+def _metered_remove_buffers(state):
+    result = _original_widget_methods["_remove_buffers"](state)
+    serialized = getattr(_opening, "serialized", None)
+    if serialized is not None:
+        serialized.append(result)
+    return result
+
+
+def _patches():
+    import ipywidgets
+    from ipywidgets import Widget
+    from ipywidgets.widgets import widget
+
+    patches = (
+        (Widget, "_send", _metered_send),
+        (Widget, "open", _metered_open),
+        (widget, "_remove_buffers", _metered_remove_buffers),
+    )
+    version = ipywidgets.__version__
+    major = version.partition(".")[0]
+    missing = [name for owner, name, _ in patches if not callable(getattr(owner, name, None))]
+    if not major.isdigit() or int(major) not in _METERED_IPYWIDGETS_VERSIONS or missing:
+        raise RuntimeError(
+            f"CommMeter does not support ipywidgets {version}: it measures the messages by wrapping "
+            "Widget._send, Widget.open and ipywidgets.widgets.widget._remove_buffers, internals of "
+            f"ipywidgets {' and '.join(map(str, _METERED_IPYWIDGETS_VERSIONS))}."
+        )
+    return patches
+
+
+def _start_metering(meter: CommMeter):
+    """Patch the widgets to report their messages, unless they already do."""
+    with _meter_lock:
+        if not _active_meters:
+            for owner, name, metered in _patches():
+                # still patched, if others patched the function on top of the meter meanwhile.
+                if name not in _original_widget_methods:
+                    _original_widget_methods[name] = getattr(owner, name)
+                    setattr(owner, name, metered)
+        _active_meters.append(meter)
+
+
+def _stop_metering(meter: CommMeter):
+    """Restore the widgets after the last meter stopped."""
+    with _meter_lock:
+        _active_meters.remove(meter)
+        if not _active_meters:
+            for owner, name, metered in _patches():
+                # functions patched on top of the meter are kept, it records nothing without meters.
+                if getattr(owner, name) is metered:
+                    setattr(owner, name, _original_widget_methods.pop(name))
+
+
+class CommMeter:
+    """Count the messages and bytes sent by widgets to the frontend, per model and trait.
+
+    While the meter is running, the state of every widget opened and every state update
+    or custom message sent is recorded, including those of k3d plots and objects. The
+    bytes are split into the JSON encoded values and the binary buffers (e.g. the arrays
+    of k3d objects) of each trait. The state sent on opening a widget is measured as
+    serialized by ``open``. The message envelope is not counted.
+
+    Meters may run at the same time and be nested, also with themselves: the widgets
+    are patched while any meter runs and a meter records until its outermost context
+    is left. The messages are measured by wrapping internal methods of ipywidgets 7 and
+    8, other versions are rejected when starting a meter.
+
+    Messages sent within `interaction` are labeled with its name, to compare single
+    interactions, e.g. moving the time slider of a CSM visualization::
+
+        with CommMeter() as meter:
+            vis = CoordinateSystemManagerVisualizerK3D(csm)
+            with meter.interaction("time slider"):
+                vis.update_time_index(10)
+        meter.summary(by=("interaction", "feature"))
+
+    The feature of a message is the part of the model name in parentheses, like
+    "vectors" or "mesh" of the objects created by the k3d visualizers.
+    """
+
+    columns = ("interaction", "message", "method", "model", "name", "feature", "trait", "json_bytes", "buffer_bytes")
+
+    def __init__(self):
+        self.records: list[dict] = []
+        self._depth = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def start(self):
+        """Start recording messages, nested calls have to be matched by `stop`.
+
+        Raises a `RuntimeError`, if the installed ipywidgets version is not supported.
+        """
+        with self._lock:
+            if self._depth == 0:
+                _start_metering(self)
+            self._depth += 1
+        return self
+
+    def stop(self):
+        """Stop recording messages after the outermost `start`."""
+        with self._lock:
+            if self._depth == 0:
+                return
+            self._depth -= 1
+            if self._depth == 0:
+                _stop_metering(self)
+
+    def __enter__(self):
+        """Start recording messages."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop recording messages."""
+        self.stop()
+
+    @contextmanager
+    def interaction(self, name: str):
+        """Label the messages sent by the current thread within the context with ``name``."""
+        previous = getattr(self._local, "interaction", None)
+        self._local.interaction = name
+        try:
+            yield
+        finally:
+            self._local.interaction = previous
+
+    def _record(self, widget, method: str, message: int, sizes: dict[str, list[int]]):
+        cls = type(widget)
+        name = getattr(widget, "name", None)
+        common = dict(
+            interaction=getattr(self._local, "interaction", None),
+            message=message,
+            method=method,
+            model=f"{cls.__module__.partition('.')[0]}.{cls.__name__}",
+            name=name if isinstance(name, str) else None,
+            feature=_feature(widget),
+        )
+        records = [dict(common, trait=trait, json_bytes=j, buffer_bytes=b) for trait, (j, b) in sizes.items()]
+        with self._lock:
+            self.records.extend(records)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the bytes of each trait of the recorded messages, in the order they were sent."""
+        with self._lock:
+            return pd.DataFrame(self.records, columns=list(self.columns))
+
+    def summary(self, by=("model", "trait")) -> pd.DataFrame:
+        """Return the number of messages and bytes grouped by the given columns, largest first.
+
+        The ``share`` is the fraction of all bytes recorded.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        df = self.to_dataframe()
+        df["bytes"] = df["json_bytes"] + df["buffer_bytes"]
+        result = df.groupby(by, dropna=False).agg(
+            messages=("message", "nunique"),
+            json_bytes=("json_bytes", "sum"),
+            buffer_bytes=("buffer_bytes", "sum"),
+            bytes=("bytes", "sum"),
+        )
+        result["share"] = result["bytes"] / max(result["bytes"].sum(), 1)
+        return result.sort_values("bytes", ascending=False)
+
+    def reset(self):
+        """Remove all records."""
+        with self._lock:
+            self.records.clear()
@@ -0,0 +1,281 @@
+"""Write static evaluation reports of single pass weld files without a notebook.
+
+Run ``weldx-widgets-report <directory>`` to write one report per ``.wx`` file of the
+directory. The files are evaluated in parallel by a pool of worker processes::
+
+    weldx-widgets-report welds/ --output reports/ --workers 8
+
+Each report is a directory named after the path of the file relative to the searched
+directory, containing a ``report.html`` with the process parameters, the groove, the
+measurements and the TCP deviation as PNG images and a link to a standalone k3d scene.
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import multiprocessing
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+__all__ = [
+    "main",
+    "write_report",
+]
+
+_DPI = 100
+
+_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+img {{ max-width: 100%; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 0.2em 0.6em; text-align: right; }}
+pre.error {{ color: #a00; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{sections}
+</body>
+</html>
+"""
+
+
+def _save_figure(fig, path: Path) -> str:
+    import matplotlib.pyplot as plt
+
+    fig.savefig(path, dpi=_DPI, bbox_inches="tight")
+    plt.close(fig)
+    return f'<img src="{path.name}" alt="{path.stem}">'
+
+
+def _process_section(file, out_dir: Path) -> str:
+    from weldx_widgets.widget_gmaw import plot_gmaw
+
+    t = (file["TCP"].time[[0, -1]]).as_timedelta()
+    fig, _ = plot_gmaw(file["process"]["welding_process"], t)
+    return _save_figure(fig, out_dir / "process.png")
+
+
+def _specimen_section(file, out_dir: Path) -> str:
+    import matplotlib.pyplot as plt
+
+    workpiece = file["workpiece"]
+    fig, ax = plt.subplots()
+    workpiece["geometry"]["groove_shape"].plot(ax=ax)
+    material = workpiece["base_metal"]
+    seam_length = workpiece["geometry"]["seam_length"]
+    text = html.escape(f"{material['common_name']} ({material['standard']}), seam length: {seam_length}")
+    return f"<p>{text}</p>\n" + _save_figure(fig, out_dir / "groove.png")
+
+
+def _measurements_section(file, out_dir: Path) -> str:
+    import matplotlib.pyplot as plt
+
+    from weldx_widgets.widget_measurement import (
+        _DEFAULT_FIGWIDTH,
+        _file_name,
+        default_pyramid_cache,
+        measurement_pyramids,
+        plot_measurements,
+    )
+
+    measurements = file["measurements"]
+    n = len(measurements)
+    fig, axes = plt.subplots(nrows=n, sharex="all", figsize=(_DEFAULT_FIGWIDTH, 2.5 * n), squeeze=False)
+    pyramids = measurement_pyramids(measurements, default_pyramid_cache(), _file_name(file))
+    plot_measurements(measurements, axes=axes[:, 0], pyramids=pyramids)
+    fig.tight_layout()
+    return _save_figure(fig, out_dir / "measurements.png")
+
+
+def _tcp_deviation_section(csm, out_dir: Path) -> str:
+    from weldx_widgets.widget_evaluate import WidgetEvaluateSinglePassWeld
+
+    tcp_deviation = WidgetEvaluateSinglePassWeld._tcp_deviation(csm)
+    if tcp_deviation is None:
+        return "<p>No design TCP in this file.</p>"
+    fig = WidgetEvaluateSinglePassWeld._plot_tcp_deviation(tcp_deviation)
+    table = tcp_deviation.statistics().to_html(float_format="{:.3f}".format)
+    return _save_figure(fig, out_dir / "tcp_deviation.png") + "\n" + table
+
+
+def _scene_section(csm, repaired_scan_points, out_dir: Path) -> str:
+    from weldx_widgets.widget_evaluate import cs_colors
+
+    data_sets = ["welding_wire"]
+    if repaired_scan_points:
+        data_sets.append("scan_0")
+    vis = csm.plot(
+        reference_system="workpiece",
+        coordinate_systems=csm.coordinate_system_names,
+        data_sets=data_sets,
+        colors=cs_colors,
+        show_data_labels=False,
+        backend="k3d",
+    )
+    path = out_dir / "scene.html"
+    path.write_text(vis.plot.get_snapshot(), encoding="utf-8")
+    return f'<p><a href="{path.name}">Open the 3D scene</a></p>'
+
+
+def write_report(
+    file: str | Path, output_dir: str | Path, scene: bool = True, name: str | Path = None
+) -> tuple[Path, list[str]]:
+    """Write the static report of a single pass weld file.
+
+    A failing section is reported within the page, the remaining sections are still written.
+
+    Parameters
+    ----------
+    file :
+        Path of the weldx file.
+    output_dir :
+        Directory the report directory is created in.
+    scene :
+        Write a standalone k3d scene of the coordinate systems and the geometry.
+    name :
+        Path of the report directory relative to ``output_dir``. Defaults to the name of
+        the file without its suffix.
+
+    Returns
+    -------
+    path, errors
+        The path of the ``report.html`` and the titles of all failed sections.
+
+    """
+    from weldx import WeldxFile
+    from weldx_widgets.widget_evaluate import prepare_csm
+
+    file = Path(file)
+    out_dir = Path(output_dir) / (name if name is not None else file.stem)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    sections, errors = [], []
+
+    def section(title, content):
+        sections.append(f"<h2>{html.escape(title)}</h2>\n{content}")
+
+    def failed(title):
+        errors.append(title)
+        section(title, f'<pre class="error">{html.escape(traceback.format_exc())}</pre>')
+
+    def add(title, func, *args):
+        try:
+            content = func(*args)
+        except Exception:
+            failed(title)
+        else:
+            section(title, content)
+
+    with WeldxFile(file, mode="r") as wx:
+        add("Process parameters", _process_section, wx, out_dir)
+        add("Specimen", _specimen_section, wx, out_dir)
+        add("Measurements", _measurements_section, wx, out_dir)
+        try:
+            csm, repaired_scan_points = prepare_csm(wx)
+        except Exception:
+            failed("Coordinate systems")
+        else:
+            add("TCP deviation", _tcp_deviation_section, csm, out_dir)
+            if scene:
+                add("3D scene", _scene_section, csm, repaired_scan_points, out_dir)
+
+    path = out_dir / "report.html"
+    path.write_text(_HTML.format(title=html.escape(file.name), sections="\n".join(sections)), encoding="utf-8")
+    return path, errors
+
+
+def _init_worker():
+    # only called in the worker processes, the backend of the calling process is kept.
+    import matplotlib as mpl
+
+    mpl.use("Agg")
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="weldx-widgets-report",
+        description="Write a static evaluation report for each single pass weld file of a directory.",
+    )
+    parser.add_argument("directory", type=Path, help="directory containing the weldx files")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="directory the reports are written to (default: <directory>/reports)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument("-p", "--pattern", default="*.wx", help="glob pattern of the files (default: *.wx)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="search the directory recursively")
+    parser.add_argument("--no-scene", action="store_true", help="do not write the k3d scenes")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None) -> int:
+    """Run the report command line interface and return its exit code."""
+    args = _parse_args(argv)
+    pattern = f"**/{args.pattern}" if args.recursive else args.pattern
+    files = sorted(args.directory.glob(pattern))
+    if not files:
+        print(f"no files matching {pattern!r} in {args.directory}", file=sys.stderr)  # noqa: T201
+        return 1
+    output = args.output if args.output is not None else args.directory / "reports"
+    workers = max(min(args.workers or 1, len(files)), 1)
+
+    failed = 0
+
+    def name(file):
+        # the path relative to the directory, files of the same name in different sub-directories must not collide.
+        return file.relative_to(args.directory).with_suffix("")
+
+    def report(i, file, result=None, exc=None):
+        nonlocal failed
+        if exc is not None:
+            status = f"failed: {exc!r}"
+        elif result[1]:
+            status = f"written with errors in {', '.join(result[1])}: {result[0]}"
+        else:
+            status = f"written: {result[0]}"
+        failed += exc is not None or bool(result[1])
+        print(f"[{i}/{len(files)}] {file.relative_to(args.directory)} {status}", flush=True)  # noqa: T201
+
+    if workers == 1:
+        for i, file in enumerate(files, 1):
+            try:
+                report(i, file, write_report(file, output, not args.no_scene, name(file)))
+            except Exception as e:
+                report(i, file, exc=e)
+    else:
+        # spawn fresh interpreters, forking would copy the state of threads of the parent.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker) as executor:
+            futures = {
+                executor.submit(write_report, file, output, not args.no_scene, name(file)): file for file in files
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                try:
+                    report(i, futures[future], future.result())
+                except Exception as e:
+                    report(i, futures[future], exc=e)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
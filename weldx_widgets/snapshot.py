@@ -0,0 +1,150 @@
+"""Compact snapshots of widget states to restore forms without reading weldx files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+from weldx_widgets.cache import file_stamp
+from weldx_widgets.widget_base import WeldxImportExport
+
+__all__ = [
+    "SnapshotCache",
+    "dump_snapshot",
+    "load_snapshot",
+    "restore_design",
+]
+
+SNAPSHOT_VERSION = 1
+
+
+def dump_snapshot(widget: WeldxImportExport, **meta) -> str:
+    """Return the state of a widget as compact JSON.
+
+    Parameters
+    ----------
+    widget :
+        The widget, supporting ``to_snapshot``.
+    meta :
+        Additional JSON serializable entries, e.g. to identify the source of the state.
+
+    """
+    snapshot = dict(version=SNAPSHOT_VERSION, widget=type(widget).__name__, state=widget.to_snapshot(), **meta)
+    return json.dumps(snapshot, separators=(",", ":"))
+
+
+def load_snapshot(widget: WeldxImportExport, text: str) -> dict:
+    """Restore the state of a widget from JSON created by `dump_snapshot`.
+
+    Returns the whole snapshot, including the entries passed as ``meta``.
+
+    Raises
+    ------
+    ValueError
+        If the snapshot has another version or was taken from another type of widget.
+
+    """
+    snapshot = json.loads(text)
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version: {snapshot.get('version')}")
+    if snapshot.get("widget") != type(widget).__name__:
+        raise ValueError(f"snapshot of {snapshot.get('widget')} cannot be loaded into {type(widget).__name__}")
+    widget.from_snapshot(snapshot["state"])
+    return snapshot
+
+
+class SnapshotCache:
+    """Snapshots of widgets filled from weldx files, stored next to the notebook.
+
+    A snapshot is only restored while the weldx file it was taken from is unchanged,
+    as judged by its modification time and size.
+
+    Parameters
+    ----------
+    directory :
+        Directory of the snapshot files, defaults to ``.weldx_snapshots`` in the current
+        working directory, which is the directory of the notebook.
+
+    """
+
+    def __init__(self, directory: str | Path = None):
+        if directory is None:
+            directory = Path.cwd() / ".weldx_snapshots"
+        self.directory = Path(directory)
+
+    def path(self, filename: str | Path, widget: WeldxImportExport) -> Path:
+        """Return the snapshot file of the given widget type and weldx file.
+
+        The name holds a hash of the resolved path, so files of the same name in
+        different directories get different snapshots.
+        """
+        filename = Path(filename)
+        key = hashlib.blake2b(str(filename.resolve()).encode(), digest_size=8).hexdigest()
+        return self.directory / f"{filename.name}.{key}.{type(widget).__name__}.json"
+
+    def save(self, filename: str | Path, widget: WeldxImportExport):
+        """Store a snapshot of the widget filled from the weldx file ``filename``."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(filename, widget)
+        text = dump_snapshot(widget, source=str(Path(filename).resolve()), stamp=file_stamp(filename))
+        tmp = path.with_name(f".{path.name}.{threading.get_ident()}")
+        tmp.write_text(text)
+        tmp.replace(path)
+
+    def restore(self, filename: str | Path, widget: WeldxImportExport) -> bool:
+        """Restore the widget from the snapshot of ``filename``, if there is a valid one."""
+        path = self.path(filename, widget)
+        try:
+            snapshot = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return False
+        valid = (
+            snapshot.get("version") == SNAPSHOT_VERSION
+            and snapshot.get("widget") == type(widget).__name__
+            and snapshot.get("source") == str(Path(filename).resolve())
+            and snapshot.get("stamp") == file_stamp(filename)
+        )
+        if not valid:
+            return False
+        widget.from_snapshot(snapshot["state"])
+        return True
+
+    def clear(self):
+        """Remove all snapshots."""
+        for path in self.directory.glob("*.json"):
+            path.unlink()
+
+
+def restore_design(widget: WeldxImportExport, filename: str | Path, cache: SnapshotCache | bool = True):
+    """Fill a widget from a weldx file, using a snapshot of a previous session if valid.
+
+    Parameters
+    ----------
+    widget :
+        The widget to fill.
+    filename :
+        The weldx file.
+    cache :
+        The snapshot cache, by default one next to the notebook. Pass False to always read
+        the file.
+
+    Returns
+    -------
+    bool
+        True, if the widget was restored from a snapshot.
+
+    """
+    if cache is True:
+        cache = SnapshotCache()
+    if cache and cache.restore(filename, widget):
+        return True
+
+    from weldx import WeldxFile
+
+    with WeldxFile(filename, mode="r") as wx_file:
+        widget.from_tree(wx_file)
+    if cache:
+        cache.save(filename, widget)
+    return False
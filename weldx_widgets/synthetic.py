@@ -0,0 +1,237 @@
+"""Generate synthetic single pass weld files of realistic size.
+
+The files follow the single_pass_weld schema like
+`weldx.asdf.cli.welding_schema.single_pass_weld_example`, but with measurements, a
+measured TCP movement and laser scans of configurable size, to profile and test the
+widgets at production scale::
+
+    python -m weldx_widgets.synthetic weld.wx --duration "10 min" --sample-rate "100 kHz" --scan-points 10000000
+
+The large arrays are generated chunk-wise into memory-mapped files and handed to weldx
+as data arrays, which are not copied, so ASDF streams them block-wise into the output.
+The memory use grows with the number of measurement samples, whose time axes weldx
+holds in memory (about 80 bytes per sample while writing), but not with the scans.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+__all__ = [
+    "generate_single_pass_weld",
+    "main",
+]
+
+_CHUNK_SAMPLES = 2**20
+_PROFILE_POINTS = 1000  # points per scanned profile line
+_PROFILE_WIDTH = 40.0  # mm
+_NAN_FRACTION = 1e-3  # fraction of invalid scan points
+
+
+def _fill_memmap(path: Path, shape: tuple[int, ...], dtype, chunk) -> np.ndarray:
+    """Create a memory-mapped array, filling rows ``start:stop`` with ``chunk(start, stop)``."""
+    arr = np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+    for start in range(0, shape[0], _CHUNK_SAMPLES):
+        stop = min(start + _CHUNK_SAMPLES, shape[0])
+        arr[start:stop] = chunk(start, stop)
+    arr.flush()
+    # asdf only serializes plain arrays, the view is still backed by the file.
+    return arr.view(np.ndarray)
+
+
+def _signal(path, num_samples, rate, bias, amplitude, frequency, noise, rng, phase=0.0) -> np.ndarray:
+    def chunk(start, stop):
+        t = np.arange(start, stop) / rate
+        return bias + amplitude * np.sin(2 * np.pi * frequency * t + phase) + noise * rng.standard_normal(stop - start)
+
+    return _fill_memmap(path, (num_samples,), np.float64, chunk)
+
+
+def _scan(path, num_points, seam_length, groove, bead: bool, rng) -> np.ndarray:
+    """Return scanned profile lines across the groove, or across the weld bead."""
+    t = groove.t.to("mm").m
+    half_gap = groove.b.to("mm").m / 2
+    slope = np.tan(groove.alpha.to("rad").m / 2)
+    num_lines = -(-num_points // _PROFILE_POINTS)
+
+    def chunk(start, stop):
+        idx = np.arange(start, stop)
+        x = (idx // _PROFILE_POINTS) * seam_length / max(num_lines - 1, 1)
+        y = (idx % _PROFILE_POINTS / (_PROFILE_POINTS - 1) - 0.5) * _PROFILE_WIDTH
+        depth = np.clip(t - (np.abs(y) - half_gap) / slope, 0, t)
+        z = t - depth if not bead else t + 1.5 * np.clip(1 - (y / (t * slope + half_gap)) ** 2, 0, None)
+        z = z + 0.02 * rng.standard_normal(len(idx))
+        z[rng.random(len(idx)) < _NAN_FRACTION] = np.nan
+        return np.stack([x, y, z], axis=-1)
+
+    return _fill_memmap(path, (num_points, 3), np.float64, chunk)
+
+
+def generate_single_pass_weld(
+    filename: str | Path,
+    duration="60 s",
+    sample_rate="10 kHz",
+    tcp_rate="100 Hz",
+    num_scans: int = 2,
+    scan_points: int = 10**6,
+    num_coordinate_systems: int = 0,
+    seam_length="300 mm",
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic single pass weld file and return its path.
+
+    Parameters
+    ----------
+    filename :
+        The output file.
+    duration :
+        Duration of the weld, e.g. "10 min".
+    sample_rate :
+        Sample rate of the welding current and voltage measurements.
+    tcp_rate :
+        Sample rate of the measured TCP movement (coordinate system "TCP").
+    num_scans :
+        Number of laser scans ("scan_0", "scan_1", ...), alternately of the groove and
+        of the weld bead, with some invalid points.
+    scan_points :
+        Number of points per scan, in profile lines of 1000 points.
+    num_coordinate_systems :
+        Number of additional coordinate systems ("cs_0", ...) attached to the TCP,
+        e.g. of sensors.
+    seam_length :
+        Length of the weld seam.
+    seed :
+        Seed of the random noise.
+
+    """
+    from weldx import Q_, WeldxFile
+    from weldx.asdf.util import get_schema_path
+
+    filename = Path(filename)
+    with tempfile.TemporaryDirectory(dir=filename.parent, ignore_cleanup_errors=True) as tmp:
+        tree = _create_tree(
+            Path(tmp),
+            duration=float(Q_(duration).to("s").m),
+            sample_rate=float(Q_(sample_rate).to("Hz").m),
+            tcp_rate=float(Q_(tcp_rate).to("Hz").m),
+            num_scans=num_scans,
+            scan_points=scan_points,
+            num_coordinate_systems=num_coordinate_systems,
+            seam_length=float(Q_(seam_length).to("mm").m),
+            rng=np.random.default_rng(seed),
+        )
+        schema = get_schema_path("single_pass_weld-0.1.0.yaml")
+        WeldxFile(filename, mode="rw", tree=tree, custom_schema=schema).close()
+        del tree  # release the memory-mapped files.
+    return filename
+
+
+def _create_tree(
+    tmp: Path, duration, sample_rate, tcp_rate, num_scans, scan_points, num_coordinate_systems, seam_length, rng
+) -> dict:
+    import pandas as pd
+    import xarray as xr
+
+    from weldx import Q_, CoordinateSystemManager, LocalCoordinateSystem, SpatialData, TimeSeries
+    from weldx.asdf.cli.welding_schema import single_pass_weld_example
+    from weldx.geometry import LinearHorizontalTraceSegment, Trace
+    from weldx.transformations import WXRotation
+
+    # take process, equipment and workpiece from the example.
+    _, tree = single_pass_weld_example(None)
+    geometry = tree["workpiece"]["geometry"]
+    geometry["seam_length"] = Q_(seam_length, "mm")
+
+    # regular time axes are stored as start, end and frequency.
+    num_samples = int(duration * sample_rate) + 1
+    time = pd.timedelta_range(start="0s", periods=num_samples, freq=pd.Timedelta(seconds=1 / sample_rate))
+    signals = dict(
+        welding_current=(
+            "Calibration current measurement",
+            Q_(_signal(tmp / "current", num_samples, sample_rate, 300, 20, 10, 2, rng), "A"),
+        ),
+        welding_voltage=(
+            "Calibration voltage measurement",
+            Q_(_signal(tmp / "voltage", num_samples, sample_rate, 40, 3, 10, 0.5, rng, phase=0.1), "V"),
+        ),
+    )
+    for (key, (signal_name, data)), measurement in zip(signals.items(), tree["measurements"]):
+        # weldx copies quantities, but takes data arrays as they are.
+        ts = TimeSeries(xr.DataArray(data, dims=["time"], coords={"time": time}))
+        measurement.data = [ts]
+        measurement.measurement_chain.get_signal(signal_name).data = ts
+        tree[key] = ts
+
+    csm = CoordinateSystemManager("base")
+    csm.add_cs("workpiece", "base", Trace(LinearHorizontalTraceSegment(Q_(seam_length, "mm"))).coordinate_system)
+    rot = WXRotation.from_euler("x", 180, degrees=True)
+    start, end = np.array([5.0, 0.0, 2.0]), np.array([seam_length - 5.0, 0.0, 2.0])
+    design = LocalCoordinateSystem(
+        coordinates=Q_(np.stack([start, end]), "mm"),
+        orientation=rot,
+        time=pd.to_timedelta([0, duration], "s"),
+    )
+    csm.add_cs("TCP design", "workpiece", design)
+
+    num_tcp = int(duration * tcp_rate) + 1
+    s = np.linspace(0, 1, num_tcp)[:, np.newaxis]
+    coordinates = start + s * (end - start) + [0, 0.1, 0.1] * rng.standard_normal((num_tcp, 3))
+    tcp = LocalCoordinateSystem(
+        coordinates=Q_(coordinates, "mm"),
+        orientation=rot,
+        time=pd.timedelta_range(start="0s", periods=num_tcp, freq=pd.Timedelta(seconds=1 / tcp_rate)),
+    )
+    csm.add_cs("TCP", "workpiece", tcp)
+    for i in range(num_coordinate_systems):
+        csm.create_cs(f"cs_{i}", "TCP", coordinates=Q_([0.0, 20.0 * np.cos(i), 20.0 * np.sin(i)], "mm"))
+
+    for i in range(num_scans):
+        points = _scan(tmp / f"scan_{i}", scan_points, seam_length, geometry["groove_shape"], i % 2 == 1, rng)
+        coordinates = xr.DataArray(Q_(points, "mm"), dims=["n", "c"], coords={"c": ["x", "y", "z"]})
+        csm.assign_data(SpatialData(coordinates), f"scan_{i}", "workpiece")
+
+    tree["coordinate_systems"] = csm
+    tree["TCP"] = tcp
+    return tree
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m weldx_widgets.synthetic",
+        description="Write a synthetic single pass weld file.",
+    )
+    parser.add_argument("filename", type=Path, help="output file")
+    parser.add_argument("--duration", default="60 s", help="duration of the weld (default: 60 s)")
+    parser.add_argument("--sample-rate", default="10 kHz", help="sample rate of current and voltage (default: 10 kHz)")
+    parser.add_argument("--tcp-rate", default="100 Hz", help="sample rate of the measured TCP (default: 100 Hz)")
+    parser.add_argument("--scans", type=int, default=2, help="number of scans (default: 2)")
+    parser.add_argument("--scan-points", type=int, default=10**6, help="points per scan (default: 1000000)")
+    parser.add_argument("--coordinate-systems", type=int, default=0, help="additional coordinate systems")
+    parser.add_argument("--seam-length", default="300 mm", help="length of the weld seam (default: 300 mm)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random noise")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None) -> int:
+    """Run the command line interface and return its exit code."""
+    args = _parse_args(argv)
+    generate_single_pass_weld(
+        args.filename,
+        duration=args.duration,
+        sample_rate=args.sample_rate,
+        tcp_rate=args.tcp_rate,
+        num_scans=args.scans,
+        scan_points=args.scan_points,
+        num_coordinate_systems=args.coordinate_systems,
+        seam_length=args.seam_length,
+        seed=args.seed,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
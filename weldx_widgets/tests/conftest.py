@@ -4,10 +4,26 @@ import pytest
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_and_teardown_package():
+def setup_and_teardown_package(tmp_path_factory):
     """Set up testing package."""
     import matplotlib as mpl
 
+    from weldx_widgets.cache import CACHE_DIR_ENV_VAR
+
     """Set Agg matplotlib backend for this module."""
     mpl.use("Agg", force=True)
+    # do not pollute the users cache directory.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CACHE_DIR_ENV_VAR, str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close the figures opened by each test, as its widgets are never closed."""
+    import matplotlib.pyplot as plt
+
+    before = set(plt.get_fignums())
     yield
+    for num in set(plt.get_fignums()) - before:
+        plt.close(num)
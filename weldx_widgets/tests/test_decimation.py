@@ -0,0 +1,202 @@
+"""Tests for the decimation of measurement plots."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+import weldx
+from weldx import Q_, TimeSeries
+from weldx.measurement import Signal
+from weldx_widgets.cache import CACHE_DIR_ENV_VAR
+from weldx_widgets.visualization import decimation
+from weldx_widgets.visualization.decimation import (
+    DecimatedLine,
+    MinMaxPyramid,
+    PyramidCache,
+    SecondsAxis,
+    default_pyramid_cache,
+)
+from weldx_widgets.widget_measurement import signal_pyramid
+
+
+@pytest.fixture
+def pyramid():
+    """Create a pyramid of a noisy signal with an odd number of samples."""
+    rng = np.random.default_rng(42)
+    time = np.linspace(0, 10, 100_001)
+    data = np.sin(time) + rng.normal(scale=0.1, size=time.shape)
+    return MinMaxPyramid(time, data, min_level_size=64)
+
+
+def test_levels_keep_extrema(pyramid):
+    """Every level has to preserve the global extrema of the raw data."""
+    assert pyramid.num_levels > 1
+    for t, lo, hi, mean in pyramid.levels:
+        assert len(t) == len(lo) == len(hi) == len(mean)
+        assert lo.min() == pyramid.data.min()
+        assert hi.max() == pyramid.data.max()
+        assert np.all((lo <= mean) & (mean <= hi))
+
+
+@pytest.mark.parametrize("window", [(0, 10), (2.5, 7.5), (4.0, 4.01)])
+def test_query_envelope(pyramid, window):
+    """The envelope of a window is bounded by the raw data and at screen resolution."""
+    num_pixels = 500
+    t, y = pyramid.query(*window, num_pixels)
+    assert len(t) == len(y)
+    assert len(t) <= 4 * num_pixels + 4
+
+    mask = (pyramid.time >= window[0]) & (pyramid.time <= window[1])
+    raw = pyramid.data[mask]
+    inner = (t >= window[0]) & (t <= window[1])
+    assert y[inner].min() >= pyramid.data.min()
+    assert y.max() >= raw.max()
+    assert y.min() <= raw.min()
+
+
+def test_query_raw_when_resolved(pyramid):
+    """Short windows return the raw samples."""
+    t, y = pyramid.query(5.0, 5.001, 500)
+    np.testing.assert_array_equal(np.diff(t) > 0, True)
+    assert set(y) <= set(pyramid.data)
+
+
+def test_invalid_input():
+    """Mismatching shapes are rejected."""
+    with pytest.raises(ValueError):
+        MinMaxPyramid(np.arange(3), np.arange(4))
+
+
+def test_decimated_line_follows_shared_xlim(pyramid):
+    """Zooming one of several shared axes re-decimates lines in all of them."""
+    fig, axes = plt.subplots(nrows=2, sharex="all")
+    lines = [DecimatedLine(ax, pyramid, num_pixels=200) for ax in axes]
+    num_points_full = len(lines[1].line.get_xdata())
+
+    axes[0].set_xlim(5.0, 5.01)
+    for line in lines:
+        x = line.line.get_xdata()
+        assert x.min() < 5.0 < 5.01 < x.max()
+        assert len(x) < num_points_full
+    plt.close(fig)
+
+
+def test_coarse_first_level(pyramid, tmp_path, monkeypatch):
+    """Memory-mapped signals are decimated chunk-wise into levels starting at first_level."""
+    monkeypatch.setattr(decimation, "_CHUNK_SAMPLES", 1000)
+    data = np.lib.format.open_memmap(tmp_path / "data.npy", mode="w+", shape=pyramid.data.shape)
+    data[:] = pyramid.data
+    coarse = MinMaxPyramid(pyramid.time, data, min_level_size=64, first_level=4)
+
+    assert coarse.num_levels == pyramid.num_levels - 3
+    for a, b in zip(coarse.levels, pyramid.levels[3:]):
+        np.testing.assert_array_equal(a[:3], b[:3])
+        np.testing.assert_allclose(a[3], b[3])
+    np.testing.assert_array_equal(coarse.query(0, 10, 200)[1], pyramid.query(0, 10, 200)[1])
+    # windows finer than the first level are served from the raw data.
+    assert coarse.level_for(1600, 200) == 0
+    t, y = coarse.query(4.0, 4.1, 200)
+    assert set(y) <= set(pyramid.data)
+
+
+class _Untouchable(np.ndarray):
+    """Array raising on element access, to ensure raw data is not read."""
+
+    def __getitem__(self, item):
+        raise AssertionError("raw data accessed")
+
+
+def test_pyramid_cache(pyramid, tmp_path):
+    """Cached pyramids are memory-mapped and do not read the raw data when plotting."""
+    cache = PyramidCache(tmp_path, min_level_size=64)
+    first = cache.get(pyramid.time, pyramid.data)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    second = cache.get(pyramid.time, pyramid.data)
+    assert isinstance(second.levels[0], np.memmap)
+    for a, b in zip(first.levels, second.levels):
+        np.testing.assert_array_equal(a, b)
+
+    lazy = MinMaxPyramid.from_levels(pyramid.time, pyramid.data.view(_Untouchable), second.levels)
+    np.testing.assert_array_equal(lazy.query(0, 10, 200)[1], first.query(0, 10, 200)[1])
+    with pytest.raises(AssertionError, match="raw data"):
+        lazy.query(5.0, 5.001, 200)
+
+    cache.clear()
+    assert not tmp_path.exists()
+
+
+def test_pyramid_cache_source(pyramid, tmp_path, monkeypatch):
+    """Signals read from a file are found by the file and node, without reading or hashing them."""
+    source_file = tmp_path / "weld.wx"
+    source_file.write_bytes(b"data")
+    cache = PyramidCache(tmp_path / "cache", min_level_size=64)
+    first = cache.get(pyramid.time, pyramid.data, (source_file, "measurements/0"))
+
+    def content_hash(*arrays):
+        raise AssertionError("raw data hashed")
+
+    monkeypatch.setattr(decimation, "content_hash", content_hash)
+    second = cache.get(pyramid.time, pyramid.data.view(_Untouchable), (source_file, "measurements/0"))
+    assert isinstance(second.levels[0], np.memmap)
+    np.testing.assert_array_equal(first.levels[-1], second.levels[-1])
+    cache.get(pyramid.time, pyramid.data, (source_file, "measurements/1"))
+    assert len(list(cache.directory.iterdir())) == 2
+
+    # modifying the file invalidates its entries.
+    source_file.write_bytes(b"other data")
+    cache.get(pyramid.time, pyramid.data, (source_file, "measurements/0"))
+    assert len(list(cache.directory.iterdir())) == 3
+
+
+def test_pyramid_cache_unwritable(pyramid, tmp_path):
+    """Pyramids are still built, if the cache directory cannot be created."""
+    blocked = tmp_path / "blocked"
+    blocked.write_bytes(b"")
+    cache = PyramidCache(blocked / "pyramids", min_level_size=64)
+    result = cache.get(pyramid.time, pyramid.data)
+    assert result.num_levels == pyramid.num_levels
+
+
+def test_default_pyramid_cache(pyramid, tmp_path, monkeypatch):
+    """The default cache only writes to disk, if a usable cache directory is configured."""
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    cache = default_pyramid_cache()
+    assert cache.directory is None
+    assert cache.get(pyramid.time, pyramid.data).num_levels > 1
+    assert not (tmp_path / "home").exists()
+
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "root"))
+    assert default_pyramid_cache(first_level=6).directory == tmp_path / "root" / "pyramids"
+    (tmp_path / "file").write_bytes(b"")
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "file"))
+    assert default_pyramid_cache().directory is None
+
+
+def test_seconds_axis(pyramid):
+    """Pyramids of a time axis in nanoseconds match those of the times in seconds."""
+    ns = np.round(pyramid.time * 1e9).astype(np.int64)
+    lazy = MinMaxPyramid(SecondsAxis(ns + 7, offset=7), pyramid.data, min_level_size=64)
+    assert lazy.num_levels == pyramid.num_levels
+    for a, b in zip(lazy.levels, pyramid.levels):
+        np.testing.assert_allclose(a, b)
+    for window in [(0, 10), (2.55555, 7.55555), (4.99995, 5.00105)]:
+        for a, b in zip(lazy.query(*window, 200), pyramid.query(*window, 200)):
+            np.testing.assert_allclose(a, b)
+
+
+def test_signal_pyramid_time_axis(monkeypatch):
+    """The time axis of a signal is read in slices, instead of being converted at once."""
+    time = pd.timedelta_range("0s", periods=10_001, freq="1ms")
+    signal = Signal("analog", "V", TimeSeries(Q_(np.sin(np.arange(10_001.0)), "V"), time))
+
+    def as_quantity(*args, **kwargs):
+        raise AssertionError("time axis converted")
+
+    monkeypatch.setattr(weldx.Time, "as_quantity", as_quantity)
+    result = signal_pyramid(signal)
+    assert isinstance(result.time, SecondsAxis)
+    assert result.time[-1] == 10.0
+    np.testing.assert_array_equal(result.query(0, 10, 100_000)[0], np.arange(10_001) / 1000)
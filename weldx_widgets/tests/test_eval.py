@@ -1,12 +1,162 @@
 """Test for WidgetEvaluateSinglePassWeld."""
 
-from weldx import WeldxFile
+import threading
+from concurrent.futures import Future, wait
+
+import numpy as np
+import pytest
+import xarray as xr
+from tqdm.auto import tqdm
+
+from weldx import Q_, SpatialData, WeldxFile
 from weldx.asdf.cli.welding_schema import single_pass_weld_example
-from weldx_widgets.widget_evaluate import WidgetEvaluateSinglePassWeld
+from weldx_widgets.synthetic import generate_single_pass_weld
+from weldx_widgets.visualization.decimation import SecondsAxis
+from weldx_widgets.widget_evaluate import WidgetEvaluateSinglePassWeld, _clean_nans_from_spatial_data
 
 
-def test_evaluate():
+@pytest.mark.parametrize("background", (True, False))
+def test_evaluate(background):
     """Primitive test for exception safety."""
     buff, tree = single_pass_weld_example(None)
     wx = WeldxFile(buff)
-    WidgetEvaluateSinglePassWeld(wx)
+    w = WidgetEvaluateSinglePassWeld(wx, background=background)
+    # only the first tab is rendered initially.
+    assert w._rendered == {"ASDF-header"}
+
+    for i, key in enumerate(w.tabs):
+        w.selected_index = i
+        assert key in w._rendered
+    assert not w._progress
+
+
+def test_evaluate_profile():
+    """The stages of all tabs are recorded and shown in the diagnostics tab."""
+    buff, tree = single_pass_weld_example(None)
+    w = WidgetEvaluateSinglePassWeld(WeldxFile(buff), background=False, profile=True)
+    for i, _ in enumerate(w.tabs):
+        w.selected_index = i
+    assert "Diagnostics" in w.tabs
+
+    stages = w.profiler.as_dict()
+    for stage in ("render: ASDF-header", "prepare: csm", "csm: rasterize workpiece", "k3d: spatial data"):
+        assert stage in stages
+    assert stages["k3d: spatial data"]["payload_bytes"] > 0
+
+
+def test_evaluate_lazy(tmp_path):
+    """Files are opened by path with memory-mapped arrays and decimated coarsely."""
+    buff, _ = single_pass_weld_example(None)
+    path = tmp_path / "single_pass_weld.wx"
+    path.write_bytes(buff.getvalue())
+
+    w = WidgetEvaluateSinglePassWeld(path, background=False, lazy=True)
+    assert w.file._asdffile_kwargs["memmap"]
+    for i, _ in enumerate(w.tabs):
+        w.selected_index = i
+    assert w._rendered == set(w.tabs)
+    assert all(p.first_level == 6 for p in w.measurement_pyramids if p is not None)
+    w.file.close()
+
+
+def test_evaluate_lazy_weldx_file(tmp_path):
+    """Weldx files read from disk are reopened memory-mapped, their data is not converted."""
+    fn = generate_single_pass_weld(tmp_path / "weld.wx", duration="1 s", sample_rate="1 kHz", scan_points=5000)
+    file = WeldxFile(fn)
+    w = WidgetEvaluateSinglePassWeld(file, background=False, lazy=True)
+    assert w.file is not file
+    assert w.file._asdffile_kwargs["memmap"]
+
+    pyramids = [p for p in w.measurement_pyramids if p is not None]
+    assert pyramids
+    assert all(isinstance(p.time, SecondsAxis) for p in pyramids)
+    csm = w.csm
+    assert sum(w.repaired_scan_points.values()) > 0
+    for i in range(2):
+        assert csm.get_data(f"scan_{i}").coordinates.data.m.dtype == np.float64
+    w.file.close()
+    file.close()
+
+
+def test_clean_nans_lazy_memmap(tmp_path):
+    """Read-only memory-mapped scans are repaired in a copy-on-write mapping of their file."""
+    points = np.lib.format.open_memmap(tmp_path / "scan.npy", mode="w+", shape=(2000, 3))
+    points[:] = np.linspace(1, 2, points.size).reshape(points.shape)
+    points[[3, 700, 1999], 2] = np.nan
+    points.flush()
+    del points
+
+    points = np.load(tmp_path / "scan.npy", mmap_mode="r")
+    data = SpatialData(xr.DataArray(Q_(points[:], "mm"), dims=["n", "c"], coords={"c": ["x", "y", "z"]}))
+    assert _clean_nans_from_spatial_data(data, lazy=True) == 3
+
+    repaired = data.coordinates.data.m
+    base = repaired
+    while not isinstance(base, np.memmap):
+        base = base.base
+    assert base.mode == "c"
+    assert not np.isnan(repaired).any()
+    assert repaired.dtype == np.float64
+    # the file is left unchanged.
+    assert np.isnan(np.load(tmp_path / "scan.npy")).sum() == 3
+
+
+class _ThreadRecordingFile(WeldxFile):
+    """Weldx file recording the threads reading it."""
+
+    threads = set()
+
+    def __getitem__(self, key):
+        self.threads.add(threading.current_thread().name)
+        return super().__getitem__(key)
+
+
+def test_evaluate_background_reads_in_main_thread():
+    """The file is only read by the calling thread, the workers get the objects read."""
+    buff, _ = single_pass_weld_example(None)
+    w = WidgetEvaluateSinglePassWeld(_ThreadRecordingFile(buff), background=True)
+    wait(w._futures)
+    assert all(f.exception() is None for f in w._futures)
+    assert _ThreadRecordingFile.threads == {threading.current_thread().name}
+    for i, _ in enumerate(w.tabs):
+        w.selected_index = i
+    assert _ThreadRecordingFile.threads == {threading.current_thread().name}
+
+
+def test_evaluate_prepared_after_rendering():
+    """Preparations finishing after rendering their tab are ignored, failing ones are shown."""
+    buff, _ = single_pass_weld_example(None)
+    w = WidgetEvaluateSinglePassWeld(WeldxFile(buff), background=False)
+    done = Future()
+    done.set_result(None)
+    w._on_prepared("Plots", done)  # not in progress anymore.
+
+    w._progress["Plots"] = tqdm(total=1, disable=True)
+    failed = Future()
+    failed.set_exception(ValueError("broken"))
+    w._on_prepared("Plots", failed)
+    assert "broken" in w.tabs["Plots"].outputs[-1]["text"]
+
+
+def test_evaluate_render_retry(monkeypatch):
+    """A tab failing to render shows the error and is rendered again when selected."""
+    buff, _ = single_pass_weld_example(None)
+    w = WidgetEvaluateSinglePassWeld(WeldxFile(buff), background=False)
+    render = w._renderers["Specimen"]
+    calls = []
+
+    def fail_once(out):
+        calls.append(out)
+        if len(calls) == 1:
+            raise RuntimeError("render failed")
+        render(out)
+
+    w._renderers["Specimen"] = fail_once
+    with pytest.raises(RuntimeError):
+        w.render_tab("Specimen")
+    assert "render failed" in w.tabs["Specimen"].outputs[-1]["text"]
+    assert "Specimen" not in w._rendered
+
+    w.render_tab("Specimen")
+    assert "Specimen" in w._rendered
+    assert len(calls) == 2
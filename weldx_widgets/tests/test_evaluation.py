@@ -0,0 +1,112 @@
+"""Tests for the numerical evaluation helpers."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from weldx import Q_, CoordinateSystemManager, Time
+from weldx_widgets.evaluation import compare_tcp, repair_scan_points
+from weldx_widgets.widget_evaluate import WidgetEvaluateSinglePassWeld
+
+
+@pytest.fixture
+def csm():
+    """Create a CSM with a designed and an actual TCP on different time grids."""
+    csm = CoordinateSystemManager("base", time_ref=pd.Timestamp("2020-01-01"))
+    csm.create_cs("workpiece", "base", coordinates=Q_([1, 0, 0], "mm"))
+    csm.create_cs(
+        "TCP design",
+        "workpiece",
+        coordinates=Q_([[0, 0, 2], [100, 0, 2]], "mm"),
+        time=Time(["0s", "10s"]),
+    )
+    csm.create_cs(
+        "TCP",
+        "workpiece",
+        coordinates=Q_([[0, 0.5, 2], [41, -0.5, 2.1], [90, 0, 1.9]], "mm"),
+        time=Time(["0s", "4s", "9s"]),
+    )
+    csm.create_cs("scanner", "TCP", coordinates=Q_([0, 0, 10], "mm"))
+    return csm
+
+
+def test_compare_tcp(csm):
+    """The deviation matches interpolating the whole CSM."""
+    deviation = compare_tcp(csm)
+
+    csm_interp = csm.interp_time(csm.time_union())
+    expected = (
+        csm_interp.get_cs("TCP design", "workpiece").coordinates - csm_interp.get_cs("TCP", "workpiece").coordinates
+    )
+    np.testing.assert_allclose(deviation.deviation, expected.data.to("mm").m)
+    np.testing.assert_allclose(deviation.time, [0, 4, 9, 10])
+
+    stats = deviation.statistics(percentiles=(50, 95))
+    assert list(stats.columns) == ["max", "rms", "p50", "p95"]
+    assert list(stats.index) == ["x", "y", "z", "distance"]
+    np.testing.assert_allclose(stats.loc["y", "max"], 0.5)
+    np.testing.assert_allclose(stats.loc["x", "max"], 10)
+    assert (stats["rms"] <= stats["max"]).all()
+
+    WidgetEvaluateSinglePassWeld._plot_tcp_deviation(deviation)
+    plt.close("all")
+
+
+def test_compare_static(csm):
+    """Static coordinate systems are broadcast onto the time grid."""
+    deviation = compare_tcp(csm, design="TCP design", actual="workpiece", reference_system="base")
+    assert deviation.deviation.shape == (2, 3)
+    np.testing.assert_allclose(deviation.deviation[:, 0], [0, 100])
+
+
+def _reference_repair(points):
+    """Repair the points like the former xarray based implementation."""
+    arr = xr.DataArray(points, dims=("p", "n", "c"))
+    return arr.where(arr.sel(c=2) > 0).ffill("n").bfill("n").values
+
+
+@pytest.fixture
+def scan():
+    """Create profiles with NaN and non-positive points, including a fully invalid profile."""
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0.1, 10, size=(6, 50, 3)).astype(np.float32)
+    points[rng.random(points.shape[:2]) < 0.3, :] = np.nan
+    points[rng.random(points.shape[:2]) < 0.1, 2] = -1
+    points[:, :3] = np.nan  # leading invalid points are back filled
+    points[2] = np.nan
+    points[3, :, 2] = 0
+    return points
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+def test_repair_scan_points(scan, chunk_size):
+    """The repair matches forward and backward filling, also when done in chunks."""
+    expected = _reference_repair(scan)
+    num_invalid = (~(scan[..., 2] > 0)).sum()
+
+    repaired = repair_scan_points(scan, axis=1, chunk_size=chunk_size)
+
+    np.testing.assert_array_equal(scan, expected)
+    assert repaired == num_invalid - 2 * scan.shape[1]
+    assert repair_scan_points(scan, axis=1) == 0
+
+
+def test_repair_scan_points_memmap(scan, tmp_path):
+    """Memory-mapped points are repaired in place, with the profile axis first."""
+    expected = _reference_repair(scan)[0]
+    points = np.lib.format.open_memmap(tmp_path / "scan.npy", mode="w+", dtype=scan.dtype, shape=(50, 3))
+    points[:] = scan[0]
+    points.flush()
+    del points
+
+    points = np.load(tmp_path / "scan.npy", mmap_mode="r+")
+    assert repair_scan_points(points, axis=0, chunk_size=8) > 0
+    points.flush()
+    np.testing.assert_array_equal(np.load(tmp_path / "scan.npy"), expected)
+
+    with pytest.raises(ValueError):
+        repair_scan_points(np.load(tmp_path / "scan.npy", mmap_mode="r"))
+    with pytest.raises(ValueError):
+        repair_scan_points(scan, axis=-1)
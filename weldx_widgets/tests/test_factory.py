@@ -0,0 +1,104 @@
+"""Tests for the widget factory."""
+
+import pytest
+
+from weldx import Q_
+from weldx_widgets.widget_factory import (
+    WidgetFloatWithUnit,
+    WidgetQuantity,
+    make_float_with_unit,
+    parse_quantity,
+    parse_unit,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("5 mm", Q_(5, "mm")), ("1.2e-3m/s", Q_(1.2e-3, "m/s")), ("-.5 °", Q_(-0.5, "deg")), ("10", Q_(10, ""))],
+)
+def test_parse_quantity(text, expected):
+    """Texts are split into magnitude and unit, units are parsed once."""
+    assert Q_(*parse_quantity(text)) == expected
+    assert parse_unit("mm") is parse_unit("mm")
+    with pytest.raises(ValueError):
+        parse_quantity("mm")
+    with pytest.raises(ValueError):
+        parse_quantity("5 unknown_unit")
+
+
+def test_quantity_widget():
+    """The compact widget behaves like WidgetFloatWithUnit and rejects invalid input."""
+    compact, full = WidgetQuantity("Length", "mm", 5), WidgetFloatWithUnit("Length", "mm", 5)
+    assert compact.quantity == full.quantity == Q_(5, "mm")
+    assert compact.text == full.text == "Length"
+
+    changes = []
+    compact.observe_float_value(changes.append)
+    for w in (compact, full):
+        w.quantity = Q_(2.5, "m/min")
+        w.float_value = 3
+    assert compact.quantity == full.quantity == Q_(3, "m/min")
+    assert compact.value == "3 m / min"
+    assert len(changes) == 2
+
+    compact.value = "invalid"
+    assert compact.quantity == Q_(3, "m/min")
+    compact.value = "-1 m/min"
+    assert compact.quantity == Q_(0, "m/min")
+
+    with compact.silence_events():
+        compact.unit = "mm/s"
+    assert compact.quantity == Q_(0, "mm/s")
+    assert len(changes) == 3
+
+
+def test_quantity_widget_observers():
+    """Observers are only called for changes of their part, the layout is not shared."""
+    w, other = WidgetQuantity("Length", "mm", 5), WidgetQuantity("Width", "mm", 5)
+    values, units, descriptions = [], [], []
+    w.observe_float_value(values.append)
+    w.observe_unit(units.append)
+    w.observe_float_value(descriptions.append, names="description")
+    w.float_value = 6
+    w.unit = "m"
+    w.value = "7 m"
+    w.text = "Depth"
+    assert [c["new"] for c in values] == ["6 mm", "7 m"]
+    assert [c["new"] for c in units] == ["6 m"]
+    assert [c["new"] for c in descriptions] == ["Depth"]
+
+    w.unobserve(values.append, "value")
+    w.float_value = 8
+    assert len(values) == 2
+
+    w.float_value = 2**40
+    assert w.float_value == 2**32
+
+    w.set_visible(False)
+    assert other.layout.visibility != "hidden"
+
+
+def test_quantity_widget_unitless():
+    """Numbers without unit keep the current unit, units of another dimension are rejected."""
+    w = WidgetQuantity("Length", "mm", 5)
+    w.value = "3"
+    assert w.value == "3 mm"
+    w.value = "1e3"
+    assert w.quantity == Q_(1000, "mm")
+    w.value = "2 s"
+    assert w.quantity == Q_(1000, "mm")
+    w.value = "-4"
+    assert w.quantity == Q_(0, "mm")
+
+
+def test_make_float_with_unit():
+    """Compact widgets are opt-in and snapshots of both widgets are interchangeable."""
+    full = make_float_with_unit("Length", "mm", 5)
+    compact = make_float_with_unit("Length", "mm", 5, compact=True)
+    assert type(full) is WidgetFloatWithUnit
+    assert type(compact) is WidgetQuantity
+    assert full.to_snapshot() == compact.value == "5 mm"
+    full.from_snapshot("7 cm")
+    assert full.quantity == Q_(7, "cm")
+    full.from_snapshot("8")
+    assert full.quantity == Q_(8, "cm")
@@ -0,0 +1,131 @@
+"""Tests for the lifetime management of figures."""
+
+import gc
+
+import matplotlib.pyplot as plt
+from ipywidgets import VBox
+
+from weldx import WeldxFile
+from weldx.asdf.cli.welding_schema import single_pass_weld_example
+from weldx_widgets.figures import FigureRegistry, ThumbnailCache, enable_widget_backend, figure_registry
+from weldx_widgets.widget_evaluate import WidgetEvaluateSinglePassWeld
+
+
+def test_track_and_release():
+    """Figures created within a block are closed with their owner, replaced ones on re-render."""
+    registry = FigureRegistry()
+    owner = object()
+    with registry.track(owner):
+        first = plt.figure()
+        plt.subplots(ncols=2)
+    assert len(registry.figures(owner)) == registry.num_figures == 2
+
+    with registry.track(owner, replace=True):
+        plt.figure()
+    assert first not in [plt.figure(num) for num in plt.get_fignums()]
+    assert registry.num_figures == 1
+
+    assert registry.release(owner) == 1
+    assert registry.num_figures == 0
+    assert registry.release(owner) == 0
+
+
+def test_closing_widget_closes_figures():
+    """Closing a widget closes its figures, figures closed elsewhere are not counted."""
+    registry = FigureRegistry()
+    widget = VBox()
+    fig, other = plt.figure(), plt.figure()
+    registry.register(widget, fig, other)
+    plt.close(other)
+    assert registry.figures(widget) == [fig]
+
+    widget.close()
+    assert registry.num_figures == 0
+    assert not plt.fignum_exists(fig.number)
+
+
+def test_evaluate_closes_figures():
+    """All figures of the evaluation tabs are closed with the widget."""
+    buff, _ = single_pass_weld_example(None)
+    w = WidgetEvaluateSinglePassWeld(WeldxFile(buff), background=False)
+    for i, _ in enumerate(w.tabs):
+        w.selected_index = i
+    figures = figure_registry.figures(w)
+    assert figures
+
+    num_open = len(plt.get_fignums())
+    w.close()
+    assert not figure_registry.figures(w)
+    assert len(plt.get_fignums()) == num_open - len(figures)
+
+
+def test_registry_size():
+    """Opening and closing widgets leaves no entries, figures of nested widgets belong to the outer one."""
+    num_owners = len(figure_registry)
+    for _ in range(3):
+        buff, _ = single_pass_weld_example(None)
+        w = WidgetEvaluateSinglePassWeld(WeldxFile(buff), background=False)
+        for i, _ in enumerate(w.tabs):
+            w.selected_index = i
+        assert len(figure_registry) == num_owners + 1
+        w.close()
+        assert len(figure_registry) == num_owners
+
+    class Owner:
+        pass
+
+    registry = FigureRegistry()
+    outer, inner = Owner(), Owner()
+    with registry.track(outer):
+        with registry.track(inner):
+            plt.figure()
+    assert len(registry) == 1
+    assert len(registry.figures(outer)) == 1
+    del outer  # garbage collected owners are dropped.
+    assert len(registry) == 0
+
+
+def test_collected_owner_closes_figures():
+    """The figures of a garbage collected owner are closed, unless closed before."""
+
+    class Owner:
+        pass
+
+    registry = FigureRegistry()
+    owner = Owner()
+    with registry.track(owner):
+        fig, closed = plt.figure(), plt.figure()
+    plt.close(closed)
+    num_open = len(plt.get_fignums())
+    del owner
+    gc.collect()
+    assert len(registry) == 0
+    assert not plt.fignum_exists(fig.number)
+    assert len(plt.get_fignums()) == num_open - 1
+
+
+def test_thumbnail_cache():
+    """Thumbnails are rendered once per key, without pyplot figures, and evicted in LRU order."""
+    cache = ThumbnailCache(maxsize=2)
+    calls = []
+    num_figures = len(plt.get_fignums())
+
+    def plot(ax):
+        calls.append(ax)
+        ax.plot([0, 1], [1, 0])
+
+    first = cache.get("a", plot)
+    assert first.startswith(b"\x89PNG")
+    assert cache.get("a", plot) is first
+    cache.get("b", plot)
+    cache.get("a", plot)
+    cache.get("c", plot)  # evicts "b"
+    cache.get("b", plot)
+    assert len(calls) == 4
+    assert len(cache) == 2
+    assert len(plt.get_fignums()) == num_figures
+
+
+def test_enable_widget_backend_outside_ipython():
+    """Nothing is done outside of IPython."""
+    assert not enable_widget_backend()
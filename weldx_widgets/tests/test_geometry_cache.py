@@ -0,0 +1,80 @@
+"""Tests for the cache of rasterized workpiece geometries."""
+
+import numpy as np
+
+from weldx import Q_, Geometry, LinearHorizontalTraceSegment, Trace, get_groove
+from weldx_widgets.cache import CACHE_DIR_ENV_VAR
+from weldx_widgets.geometry_cache import GeometryCache, default_geometry_cache, rasterize_workpiece, workpiece_key
+
+groove = get_groove(
+    groove_type="VGroove",
+    workpiece_thickness=Q_(5, "mm"),
+    groove_angle=Q_(50, "deg"),
+    root_face=Q_(1, "mm"),
+    root_gap=Q_(1, "mm"),
+)
+args = (groove, Q_(300, "mm"), Q_(10, "mm"), Q_(4, "mm"), Q_(60, "mm"))
+
+
+def test_key():
+    """Equal quantities in different units share a key, other parameters do not."""
+    assert workpiece_key(*args) == workpiece_key(groove, Q_(0.3, "m"), *args[2:])
+    assert workpiece_key(*args) != workpiece_key(groove, Q_(301, "mm"), *args[2:])
+
+
+def test_rasterize_cached(tmp_path):
+    """Cached geometries match direct rasterization, also when loaded from disk."""
+    trace = Trace(LinearHorizontalTraceSegment(args[1]))
+    expected = Geometry(groove.to_profile(width_default=args[2]), trace).spatial_data(*args[3:])
+
+    calls = []
+
+    def count_calls(cache):
+        key = workpiece_key(*args)
+        return cache.get(key, lambda: calls.append(key) or expected)
+
+    cache = GeometryCache(maxsize=1, directory=tmp_path)
+    for _ in range(2):
+        sd = count_calls(cache)
+    assert len(calls) == 1
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    # a new session has to read from disk.
+    sd = count_calls(GeometryCache(directory=tmp_path))
+    assert len(calls) == 1
+    np.testing.assert_allclose(sd.coordinates.data.to("mm").m, expected.coordinates.data.to("mm").m)
+    np.testing.assert_array_equal(sd.triangles, expected.triangles)
+
+    memory_only = GeometryCache(maxsize=1)
+    sd = rasterize_workpiece(*args, cache=memory_only)
+    rasterize_workpiece(groove, Q_(200, "mm"), *args[2:], cache=memory_only)
+    assert len(memory_only) == 1
+    np.testing.assert_allclose(sd.coordinates.data.to("mm").m, expected.coordinates.data.to("mm").m)
+
+
+def test_disk_errors(tmp_path):
+    """Geometries are kept in memory, if the directory cannot be written."""
+    blocked = tmp_path / "blocked"
+    blocked.write_text("not a directory")
+    cache = GeometryCache(directory=blocked / "geometry")
+    sd = rasterize_workpiece(*args, cache=cache)
+    assert len(cache) == 1
+    assert rasterize_workpiece(*args, cache=cache).triangles is sd.triangles
+
+
+def test_caller_arrays_untouched():
+    """The arrays of the rasterized geometry are copied before they are frozen."""
+    trace = Trace(LinearHorizontalTraceSegment(args[1]))
+    data = Geometry(groove.to_profile(width_default=args[2]), trace).spatial_data(*args[3:])
+    cache = GeometryCache()
+    sd = cache.get("key", lambda: data)
+    assert data.triangles.flags.writeable
+    assert not sd.triangles.flags.writeable
+
+
+def test_default_cache_opt_in(tmp_path, monkeypatch):
+    """The default cache only uses the disk, if the cache directory is set."""
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR)
+    assert default_geometry_cache.__wrapped__().directory is None
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    assert default_geometry_cache.__wrapped__().directory == tmp_path / "geometry"
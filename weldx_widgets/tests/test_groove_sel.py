@@ -5,6 +5,8 @@ import pytest
 import weldx
 from weldx.welding.groove.iso_9692_1 import _create_test_grooves
 from weldx_widgets import WidgetGrooveSelection, WidgetGrooveSelectionTCPMovement
+from weldx_widgets.snapshot import dump_snapshot, load_snapshot
+from weldx_widgets.widget_factory import WidgetFloatWithUnit, WidgetQuantity
 
 test_grooves = _create_test_grooves()
 
@@ -53,3 +55,88 @@ def test_groove_linear_sel_tcp_movement_export():
     tree2 = w2.to_tree()
 
     assert tree2 == tree
+
+
+def test_parameter_widgets_on_demand():
+    """Parameter widgets are created when a groove type needs them and reused afterwards."""
+    w = WidgetGrooveSelection()
+    assert set(w.groove_params_dropdowns) == {"workpiece_thickness", "groove_angle", "root_gap", "root_face"}
+    calls = []
+    w.add_parameter_observer(calls.append)
+
+    root_gap = w.groove_params_dropdowns["root_gap"]
+    w.groove_type_dropdown.value = "UGroove"
+    assert "bevel_radius" in w.groove_params_dropdowns
+    assert "groove_angle" not in {c.mapping for c in w.groove_params.children}
+    assert w.groove_params_dropdowns["root_gap"] is root_gap
+    assert type(w.groove_obj).__name__ == "UGroove"
+
+    w.groove_params_dropdowns["bevel_radius"].float_value = 7
+    assert calls
+    assert w.groove_obj.R.m == 7
+
+
+def test_groove_thumbnail():
+    """Thumbnail selectors create no pyplot figures and reuse cached images."""
+    import matplotlib.pyplot as plt
+
+    from weldx_widgets.widget_groove_sel import groove_thumbnails
+
+    groove_thumbnails.clear()
+    num_figures = len(plt.get_fignums())
+    w = WidgetGrooveSelection(thumbnail=True)
+    w2 = WidgetGrooveSelection(thumbnail=True)
+    assert len(plt.get_fignums()) == num_figures
+    assert bytes(w._image.value).startswith(b"\x89PNG")
+    assert bytes(w2._image.value) == bytes(w._image.value)
+    assert len(groove_thumbnails) == 1
+
+    w.groove_params_dropdowns["root_gap"].float_value = 3
+    assert bytes(w._image.value) != bytes(w2._image.value)
+    assert len(groove_thumbnails) == 2
+
+
+def test_from_tree_plots_once():
+    """Loading a stored design updates all parameters and plots each view once."""
+    w = WidgetGrooveSelectionTCPMovement()
+    w.groove_sel.groove_obj = test_grooves["u_groove"][0]
+    tree = w.to_tree()
+
+    w2 = WidgetGrooveSelectionTCPMovement()
+    calls = []
+    for obj, name in ((w2, "create_csm_and_plot"), (w2.groove_sel, "_plot_groove")):
+        method = getattr(obj, name)
+        setattr(obj, name, lambda *args, _m=method, _n=name, **kwargs: (calls.append(_n), _m(*args, **kwargs)))
+    w2.from_tree(tree)
+
+    assert sorted(calls) == ["_plot_groove", "create_csm_and_plot"]
+    assert w2.groove_sel.groove_type_dropdown.value == "UGroove"
+    assert w2.to_tree()["workpiece"] == tree["workpiece"]
+
+
+def test_copy():
+    """Copies keep the constructor arguments and the groove."""
+    w = WidgetGrooveSelection(thumbnail=True)
+    w.groove_obj = test_grooves["u_groove"][0]
+
+    w2 = w.copy()
+    assert w2.thumbnail
+    assert w2.to_tree() == w.to_tree()
+    assert bytes(w2._image.value) == bytes(w._image.value)
+
+
+def test_compact_parameters():
+    """Compact parameter widgets are opt-in, numbers without unit keep the unit of a parameter."""
+    assert all(type(p) is WidgetFloatWithUnit for p in WidgetGrooveSelection().groove_params.children)
+
+    w = WidgetGrooveSelectionTCPMovement(compact=True)
+    assert type(w.seam_length) is WidgetQuantity
+    groove_sel = w.groove_sel
+    assert all(type(p) is WidgetQuantity for p in groove_sel.groove_params.children)
+    groove_sel.groove_params_dropdowns["root_gap"].value = "3"
+    assert groove_sel.groove_obj.b == weldx.Q_(3, "mm")
+
+    # snapshots of compact and default widgets are interchangeable.
+    w2 = WidgetGrooveSelectionTCPMovement()
+    load_snapshot(w2, dump_snapshot(w))
+    assert w2.to_tree()["workpiece"] == w.to_tree()["workpiece"]
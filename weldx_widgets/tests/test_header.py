@@ -0,0 +1,65 @@
+"""Tests for the header browser."""
+
+import numpy as np
+import pytest
+
+from weldx import WeldxFile
+from weldx.asdf.cli.welding_schema import single_pass_weld_example
+from weldx_widgets.widget_header import WidgetHeaderBrowser, _HeaderNode, _LazyNode, load_header, summarize_node
+
+
+@pytest.fixture
+def wx_file(tmp_path):
+    """Create a file with a binary block and a long list."""
+    tree = {"big": np.zeros((1000, 3)), "items": list(range(120))}
+    with WeldxFile(tmp_path / "test.wx", tree=tree, mode="rw"):
+        pass
+    return WeldxFile(tmp_path / "test.wx")
+
+
+def test_summaries(wx_file):
+    """Arrays are summarized by their nodes, without reading blocks."""
+    header = load_header(wx_file)
+    assert summarize_node(header["big"]) == "ndarray float64 (1000, 3), block 0"
+    assert summarize_node(header["items"]) == "[120 items]"
+    assert summarize_node(12) == "12"
+    assert summarize_node("x" * 200).endswith("...")
+
+
+def test_lazy_expansion_and_paging(wx_file):
+    """Children are created on expansion and long lists are paged."""
+    browser = WidgetHeaderBrowser.from_file(wx_file, page_size=50)
+    root = browser.root
+    assert root.expanded
+    nodes = {c.key: c for c in root._children_box.children}
+    items = nodes["items"]
+    assert items._children_box is None
+
+    items.button.click()
+    children = items._children_box.children
+    assert len(children) == 51
+    assert children[-1].description == "show 50 more of 70"
+    children[-1].click()
+    children = items._children_box.children
+    assert len(children) == 101
+    children[-1].click()
+    assert [c.key for c in items._children_box.children] == list(range(120))
+
+    items.button.click()
+    assert not items.expanded
+    assert items.children == (items.button,)
+    assert isinstance(nodes["big"], _HeaderNode) and nodes["big"].button is None
+
+    # subclasses have to define how nodes are summarized and expanded.
+    with pytest.raises(TypeError, match="abstract"):
+        _LazyNode("key", {}, page_size=50)
+
+
+def test_in_memory_file():
+    """The header of files in memory is read without moving the file handle."""
+    buff, _ = single_pass_weld_example(None)
+    wx = WeldxFile(buff)
+    pos = wx.file_handle.tell()
+    browser = WidgetHeaderBrowser.from_file(wx)
+    assert wx.file_handle.tell() == pos
+    assert "TCP" in browser.tree
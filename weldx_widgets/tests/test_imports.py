@@ -0,0 +1,37 @@
+"""Tests for the lazy imports of the package."""
+
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = ("weldx", "matplotlib", "k3d", "pandas", "ipywidgets", "ipyfilechooser")
+
+
+def _modules_after_import(statement: str) -> set[str]:
+    code = f"import sys; {statement}; print(','.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return set(result.stdout.strip().split(","))
+
+
+@pytest.mark.parametrize("package", ["weldx_widgets", "weldx_widgets.visualization"])
+def test_import_is_lazy(package):
+    """Importing the packages does not load weldx, plotting or widget libraries."""
+    modules = _modules_after_import(f"import {package}")
+    assert not modules & set(_HEAVY_MODULES)
+
+
+def test_lazy_names():
+    """Public names are importable and listed, k3d is only loaded by the k3d visualizer."""
+    import weldx_widgets
+    import weldx_widgets.visualization
+
+    for package in (weldx_widgets, weldx_widgets.visualization):
+        assert set(package.__all__) <= set(dir(package))
+        for name in package.__all__:
+            assert getattr(package, name).__name__ == name
+    with pytest.raises(AttributeError):
+        weldx_widgets.NotAWidget  # noqa: B018
+
+    modules = _modules_after_import("from weldx_widgets.visualization import MinMaxPyramid")
+    assert "k3d" not in modules
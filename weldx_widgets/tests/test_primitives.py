@@ -0,0 +1,72 @@
+"""Tests for the primitive meshes."""
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from weldx_widgets.visualization.primitives import (
+    box,
+    cone,
+    cylinder,
+    merge_meshes,
+    nozzle,
+    sphere,
+    to_spatial_data,
+)
+
+
+def _edges(triangles):
+    """Count the directed edges of all triangles."""
+    return Counter(map(tuple, np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])))
+
+
+def _volume(points, triangles):
+    """Signed volume enclosed by a mesh, positive for normals facing outwards."""
+    p = points.astype(float)[triangles]
+    return np.einsum("ij,ij->i", p[:, 0], np.cross(p[:, 1], p[:, 2])).sum() / 6
+
+
+@pytest.mark.parametrize(
+    "mesh, volume",
+    [
+        (cylinder(2.0, 10.0, 64), np.pi * 4 * 10),
+        (cone(2.0, 3.0, 64), np.pi * 4),
+        (nozzle(4.0, 5.0, 20.0, resolution=64), np.pi * 9 * 20),
+        (sphere(1.0, 64), 4 / 3 * np.pi),
+        (box(1.0, 2.0, 3.0), 6.0),
+    ],
+)
+def test_closed_meshes(mesh, volume):
+    """Closed primitives are watertight, oriented consistently and enclose the expected volume."""
+    points, triangles = mesh
+    assert points.dtype == np.float32
+    assert triangles.dtype == np.uint32
+    assert triangles.max() < len(points)
+
+    edges = _edges(triangles)
+    assert all(n == 1 for n in edges.values())
+    assert all((b, a) in edges for a, b in edges)
+    np.testing.assert_allclose(_volume(points, triangles), volume, rtol=0.02)
+
+
+def test_memoized_and_read_only():
+    """Meshes are created once per parameter set and cannot be modified by callers."""
+    points, triangles = cylinder(0.6, 20, 16, capped=False)
+    assert cylinder(0.6, 20, 16, capped=False)[0] is points
+    assert len(points) == 32 and len(triangles) == 32
+    with pytest.raises(ValueError):
+        points[0] = 0
+    with pytest.raises(ValueError):
+        cylinder(1, 1, 2)
+
+
+def test_merge_and_spatial_data():
+    """Merged meshes keep their triangles and can be shifted when converting."""
+    a, b = box(1.0, 1.0, 1.0), sphere(1.0)
+    points, triangles = merge_meshes(a, b)
+    assert len(points) == len(a[0]) + len(b[0])
+    np.testing.assert_array_equal(points[triangles[len(a[1]) :]], b[0][b[1]])
+
+    data = to_spatial_data(a, offset=[0, 0, 10])
+    np.testing.assert_allclose(data.coordinates.data.to("mm").m[:, 2], a[0][:, 2] + 10)
@@ -43,3 +43,17 @@ def test_import_export(kind):
     w2.from_tree(tree)
 
     assert w2.to_tree() == tree
+
+
+def test_copy():
+    """Copies are created from the tree of the widget and do not share process widgets."""
+    w = WidgetGMAW(process_type="UI")
+    w.welding_process.pulse_frequency.float_value = 42
+    w.welding_wire.diameter.float_value = 1.0
+
+    w2 = w.copy()
+    assert w2.to_tree() == w.to_tree()
+    assert w2.welding_process is not w.welding_process
+
+    w2.welding_process.pulse_frequency.float_value = 50
+    assert w.welding_process.pulse_frequency.float_value == 42
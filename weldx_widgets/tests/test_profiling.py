@@ -0,0 +1,209 @@
+"""Tests for the stage profiler."""
+
+import time
+import tracemalloc
+
+import k3d
+import numpy as np
+import pytest
+from ipywidgets import Checkbox, IntSlider, VBox, Widget
+from traitlets import observe
+
+from weldx import Q_, SpatialData
+from weldx_widgets.profiling import CommMeter, ObserverProfiler, StageProfiler, payload_nbytes
+from weldx_widgets.widget_base import WidgetMyVBox, bulk_update
+
+
+def test_stages():
+    """Nested stages record their wall time, peak memory and payload."""
+    profiler = StageProfiler()
+    with profiler.stage("outer"):
+        big = np.ones(1_000_000)
+        del big
+        with profiler.stage("inner") as stage:
+            stage.payload(np.ones(1000))
+    with profiler.stage("inner"):
+        pass
+
+    df = profiler.to_dataframe()
+    assert list(df["stage"]) == ["inner", "outer", "inner"]
+    inner, outer, _ = df.to_dict("records")
+    assert inner["payload_bytes"] == 8000
+    # the peak of the outer stage was reached before the inner stage started.
+    assert outer["peak_memory_bytes"] >= 8_000_000 > inner["peak_memory_bytes"] >= 8000
+
+    summary = profiler.as_dict()
+    assert summary["inner"]["count"] == 2
+    assert summary["inner"]["payload_bytes"] == 8000
+    assert summary["outer"]["payload_bytes"] is None
+
+    profiler.reset()
+    assert profiler.to_dataframe().empty
+
+
+def test_disabled():
+    """A disabled profiler records nothing, but stages still work."""
+    profiler = StageProfiler(enabled=False)
+    with profiler.stage("a") as stage:
+        stage.payload(np.ones(10))
+    assert not profiler
+    assert profiler.records == []
+
+    with pytest.raises(ValueError), StageProfiler(trace_memory=False).stage("failing"):
+        raise ValueError
+
+
+def test_payload_nbytes():
+    """Arrays are found in quantities, containers and spatial data and counted once."""
+    arr = np.ones((10, 3))
+    data = SpatialData(Q_(arr, "mm"), np.zeros((2, 3), dtype=np.uint32))
+    assert payload_nbytes(data) == 240 + 24
+    assert payload_nbytes({"a": arr, "b": [arr, Q_(arr.copy(), "mm")]}) == 240 + 240
+    assert payload_nbytes(object()) == 0
+
+
+def test_tracing_stopped():
+    """Memory tracing only runs while stages are measured."""
+    profiler = StageProfiler()
+    with profiler.stage("a"):
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+
+def test_observers():
+    """Observers of the widget tree are timed, with the time of nested observers excluded."""
+    slider, checkbox = IntSlider(), Checkbox()
+    box = VBox([slider])
+
+    def slow(change):
+        time.sleep(0.05)
+        checkbox.value = not checkbox.value
+
+    slider.observe(slow, "value")
+    checkbox.observe(lambda change: time.sleep(0.02), "value")
+    profiler = ObserverProfiler(threshold_s=0.04, capacity=3)
+    profiler.instrument(box)
+
+    # children added later are instrumented on the next change of ``children``.
+    box.children = [slider, checkbox]
+    slider.value = 1
+    slider.value = 2
+    stats = profiler.as_dict()
+    assert stats["test_observers.<locals>.slow"]["count"] == 2
+    assert stats["test_observers.<locals>.slow"]["total_s"] >= 0.14
+    assert stats["test_observers.<locals>.slow"]["self_s"] < stats["test_observers.<locals>.slow"]["total_s"] - 0.04
+    lambda_name = next(name for name in stats if "<lambda>" in name)
+    assert stats[lambda_name]["slow"] == 0
+    assert profiler.slow_handlers() == ["test_observers.<locals>.slow"]
+
+    df = profiler.to_dataframe()
+    assert len(df) == 3  # capacity of the ring buffer
+    assert list(df["owner"]) == ["IntSlider", "Checkbox", "IntSlider"]
+
+    # observers can still be removed, also within bulk updates.
+    with bulk_update(box):
+        slider.value = 3
+    slider.unobserve(slow, "value")
+    slider.value = 4
+    assert profiler.as_dict()["test_observers.<locals>.slow"]["count"] == 2
+
+    profiler.enabled = False
+    checkbox.value = not checkbox.value
+    assert sum(s["count"] for s in profiler.as_dict().values()) == 4
+    profiler.reset()
+    assert profiler.to_dataframe().empty
+
+
+class _ObservedSlider(IntSlider):
+    @observe("value")
+    def _on_value(self, change):
+        pass
+
+
+def test_profile_observers():
+    """The profiler of the observers is kept by the top-level widget, class handlers are timed too."""
+    slider = _ObservedSlider()
+    slider.observe(lambda change: None, "value")
+    w = WidgetMyVBox(children=[slider])
+    profiler = w.profile_observers()
+    assert w.profile_observers() is profiler is w.observer_profiler
+    slider.value = 1
+    stats = profiler.as_dict()
+    assert stats["_ObservedSlider._on_value"]["count"] == 1
+    assert sum(s["count"] for s in stats.values()) == 2
+
+    # timed class handlers are still suspended by bulk updates.
+    with bulk_update(w):
+        slider.value = 2
+    assert profiler.as_dict()["_ObservedSlider._on_value"]["count"] == 1
+
+
+def test_comm_meter():
+    """Opened widgets and their messages are recorded per trait, with JSON and buffer bytes."""
+    send = Widget._send
+    with CommMeter() as meter:
+        points = k3d.points(np.zeros((100, 3), dtype=np.float32), name="scan (points)")
+        slider = IntSlider()
+        with meter.interaction("move"):
+            points.positions = np.ones((10, 3), dtype=np.float32)
+            slider.value = 3
+            slider.send({"a": 1}, buffers=[b"xx"])
+    assert Widget._send is send
+    slider.value = 4  # not recorded anymore
+
+    df = meter.to_dataframe()
+    opened = df[(df["method"] == "open") & (df["trait"] == "positions")]
+    assert opened[["model", "feature", "buffer_bytes"]].values.tolist() == [["k3d.Points", "points", 1200]]
+    assert set(df[df["method"] == "open"]["model"]) >= {"k3d.Points", "ipywidgets.IntSlider"}
+
+    moved = df[df["interaction"] == "move"]
+    assert moved[["method", "trait", "buffer_bytes"]].values.tolist() == [
+        ["update", "positions", 120],
+        ["update", "value", 0],
+        ["custom", "<custom>", 2],
+    ]
+    assert moved["json_bytes"].iloc[1] == len("3")
+
+    summary = meter.summary(by=("interaction", "feature")).loc["move"]
+    assert summary.loc["points", "messages"] == 1
+    assert summary.loc["points", "bytes"] > 120
+    assert meter.summary()["share"].sum() == pytest.approx(1)
+
+    meter.reset()
+    assert meter.to_dataframe().empty
+
+
+def test_comm_meter_nested():
+    """Meters can be nested, also with themselves, the widgets are restored after the last one."""
+    send, open_ = Widget._send, Widget.open
+    outer, inner = CommMeter(), CommMeter()
+    with outer:
+        with outer, inner:
+            IntSlider()
+        IntSlider()
+        assert Widget._send is not send
+    assert (Widget._send, Widget.open) == (send, open_)
+
+    def opened(meter):
+        df = meter.to_dataframe()
+        return df[(df["method"] == "open") & (df["model"] == "ipywidgets.IntSlider")]["message"].nunique()
+
+    assert (opened(outer), opened(inner)) == (2, 1)
+
+
+def test_comm_meter_unsupported_ipywidgets(monkeypatch):
+    """Unknown ipywidgets versions are rejected, before any method is patched."""
+    import ipywidgets
+
+    send = Widget._send
+    monkeypatch.setattr(ipywidgets, "__version__", "9.0.0")
+    meter = CommMeter()
+    with pytest.raises(RuntimeError, match="ipywidgets 9.0.0"):
+        meter.start()
+    assert Widget._send is send
+
+    monkeypatch.undo()
+    with meter:
+        IntSlider()
+    assert meter.records
+    assert Widget._send is send
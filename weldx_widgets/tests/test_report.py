@@ -0,0 +1,49 @@
+"""Tests for the static report command line interface."""
+
+import pytest
+
+from weldx.asdf.cli.welding_schema import single_pass_weld_example
+from weldx_widgets.report import main
+
+
+@pytest.fixture
+def weld_dir(tmp_path):
+    """Create a directory with a single pass weld file."""
+    single_pass_weld_example(tmp_path / "weld.wx")
+    return tmp_path
+
+
+def test_report(weld_dir, capsys):
+    """All sections of the report are written."""
+    assert main([str(weld_dir), "--workers", "1"]) == 0
+    out_dir = weld_dir / "reports" / "weld"
+    for name in ("process.png", "groove.png", "measurements.png", "scene.html"):
+        assert (out_dir / name).stat().st_size > 0
+    report = (out_dir / "report.html").read_text()
+    assert 'class="error"' not in report
+    assert "[1/1] weld.wx written" in capsys.readouterr().out
+
+
+def test_report_failure(weld_dir, tmp_path_factory):
+    """Broken files are reported by the exit code, without stopping the remaining files."""
+    (weld_dir / "broken.wx").write_text("no asdf")
+    output = tmp_path_factory.mktemp("reports")
+    assert main([str(weld_dir), "-j", "1", "-o", str(output), "--no-scene"]) == 1
+    assert (output / "weld" / "report.html").exists()
+    assert not (output / "weld" / "scene.html").exists()
+    assert main([str(weld_dir / "missing")]) == 1
+
+
+def test_report_workers(tmp_path, capsys):
+    """Files of the same name in different sub-directories are written by a pool of two workers."""
+    for sub in ("a", "b"):
+        (tmp_path / sub).mkdir()
+        single_pass_weld_example(tmp_path / sub / "weld.wx")
+    output = tmp_path / "out"
+    assert main([str(tmp_path), "-r", "-j", "2", "-o", str(output), "--no-scene"]) == 0
+    for sub in ("a", "b"):
+        report = (output / sub / "weld" / "report.html").read_text()
+        assert 'class="error"' not in report
+    out = capsys.readouterr().out
+    assert "a/weld.wx written" in out
+    assert "b/weld.wx written" in out
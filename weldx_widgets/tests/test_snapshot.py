@@ -0,0 +1,81 @@
+"""Tests for widget state snapshots."""
+
+import json
+import os
+
+import pytest
+
+from weldx import WeldxFile
+from weldx_widgets import WidgetGMAW, WidgetGrooveSelectionTCPMovement, WidgetShieldingGas
+from weldx_widgets.snapshot import SnapshotCache, dump_snapshot, load_snapshot, restore_design
+
+
+def test_gmaw_roundtrip():
+    """Snapshots are compact JSON with unit strings and restore the process type."""
+    w = WidgetGMAW(process_type="II")
+    w.welding_process.pulse_frequency.float_value = 42
+    w.gas.gas_components._add_gas_comp(None)
+    text = dump_snapshot(w)
+    assert json.loads(text)["state"]["welding_process"]["pulse_frequency"] == "42 Hz"
+
+    w2 = WidgetGMAW()
+    load_snapshot(w2, text)
+    assert w2.process_type.value == "Pulsed (II)"
+    assert w2.to_tree() == w.to_tree()
+
+
+def test_groove_roundtrip():
+    """The groove type and its parameters are restored and plotted once."""
+    w = WidgetGrooveSelectionTCPMovement()
+    w.groove_sel.groove_type_dropdown.value = "FFGroove"
+    w.groove_sel.groove_params_dropdowns["code_number"].children[1].value = "3.1.1"
+    w.seam_length.float_value = 120
+
+    w2 = WidgetGrooveSelectionTCPMovement()
+    calls = []
+    create_csm_and_plot = w2.create_csm_and_plot
+    w2.create_csm_and_plot = lambda *args, **kwargs: (calls.append(args), create_csm_and_plot(*args, **kwargs))
+    load_snapshot(w2, dump_snapshot(w))
+    assert len(calls) == 1
+    assert w2.groove_sel.groove_obj.code_number == "3.1.1"
+    assert w2.to_tree()["workpiece"] == w.to_tree()["workpiece"]
+
+
+def test_load_other_widget():
+    """Snapshots of other widget types are rejected."""
+    with pytest.raises(ValueError):
+        load_snapshot(WidgetGMAW(), dump_snapshot(WidgetShieldingGas()))
+
+
+def test_restore_design(tmp_path):
+    """Designs are restored from a snapshot, while the file is unchanged."""
+    filename = tmp_path / "design.wx"
+    w = WidgetGMAW(process_type="UI")
+    WeldxFile(filename, tree=w.to_tree(), mode="rw").close()
+    cache = SnapshotCache(tmp_path / "snapshots")
+
+    assert not restore_design(w, filename, cache)
+    w2 = WidgetGMAW()
+    assert restore_design(w2, filename, cache)
+    assert w2.to_tree() == w.to_tree()
+
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert not restore_design(WidgetGMAW(), filename, cache)
+
+
+def test_snapshot_cache_same_name(tmp_path):
+    """Files of the same name in different directories have their own snapshots."""
+    cache = SnapshotCache(tmp_path / "snapshots")
+    widgets = {}
+    for directory, process_type in (("a", "UI"), ("b", "II")):
+        (tmp_path / directory).mkdir()
+        w = widgets[directory] = WidgetGMAW(process_type=process_type)
+        WeldxFile(tmp_path / directory / "weld.wx", tree=w.to_tree(), mode="rw").close()
+        cache.save(tmp_path / directory / "weld.wx", w)
+    assert cache.path(tmp_path / "a" / "weld.wx", w) != cache.path(tmp_path / "b" / "weld.wx", w)
+
+    for directory, w in widgets.items():
+        w2 = WidgetGMAW()
+        assert cache.restore(tmp_path / directory / "weld.wx", w2)
+        assert w2.to_tree() == w.to_tree()
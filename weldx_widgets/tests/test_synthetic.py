@@ -0,0 +1,45 @@
+"""Tests for the synthetic single pass weld files."""
+
+import numpy as np
+
+from weldx import WeldxFile
+from weldx_widgets.synthetic import generate_single_pass_weld, main
+from weldx_widgets.widget_evaluate import WidgetEvaluateSinglePassWeld
+
+
+def test_generate_single_pass_weld(tmp_path):
+    """The generated file has the requested sizes and can be evaluated."""
+    fn = generate_single_pass_weld(
+        tmp_path / "weld.wx",
+        duration="2 s",
+        sample_rate="1 kHz",
+        tcp_rate="10 Hz",
+        num_scans=3,
+        scan_points=5000,
+        num_coordinate_systems=2,
+    )
+    # the memory-mapped temporary files are removed.
+    assert [p.name for p in tmp_path.iterdir()] == ["weld.wx"]
+
+    with WeldxFile(fn) as wx:
+        assert wx["welding_current"].data.shape == (2001,)
+        csm = wx["coordinate_systems"]
+        assert csm.get_cs("TCP", "workpiece").time.as_quantity().m.shape == (21,)
+        assert {"cs_0", "cs_1", "TCP design"} <= set(csm.coordinate_system_names)
+        for i in range(3):
+            points = csm.get_data(f"scan_{i}").coordinates.data.m
+            assert points.shape == (5000, 3)
+            assert np.isnan(points).any()
+
+    w = WidgetEvaluateSinglePassWeld(WeldxFile(fn), background=False)
+    for i, _ in enumerate(w.tabs):
+        w.selected_index = i
+    assert not w._progress
+
+
+def test_main(tmp_path):
+    """The command line interface writes the file."""
+    fn = tmp_path / "weld.wx"
+    assert main([str(fn), "--duration", "1 s", "--sample-rate", "100 Hz", "--scan-points", "1000", "--scans", "1"]) == 0
+    with WeldxFile(fn) as wx:
+        assert wx["coordinate_systems"].get_data("scan_0").coordinates.shape == (1000, 3)
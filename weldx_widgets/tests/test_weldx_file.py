@@ -0,0 +1,107 @@
+"""Tests for the WeldxFile navigator."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from weldx import WeldxFile
+from weldx.asdf.cli.welding_schema import single_pass_weld_example
+from weldx_widgets.widget_weldx_file import WidgetWeldxFile, _ObjectNode, _thumbnail_mesh, summarize_object
+
+
+@pytest.fixture
+def widget():
+    """Create the navigator of the single pass weld example."""
+    buff, _ = single_pass_weld_example(None)
+    w = WidgetWeldxFile(WeldxFile(buff), page_size=5)
+    yield w
+    plt.close("all")
+
+
+def _child(node, key):
+    return next(n for n in node._nodes if n.key == key)
+
+
+def test_lazy_tree(widget):
+    """Only expanded nodes create the widgets of their children."""
+    root = widget.tree
+    assert root.expanded
+    assert len(root._nodes) == 5
+    root._children_box.children[-1].click()
+    assert len(root._nodes) == len(widget.file)
+
+    workpiece = _child(root, "workpiece")
+    assert workpiece._children_box is None
+    workpiece.toggle()
+    geometry = _child(workpiece, "geometry")
+    geometry.toggle()
+    groove = _child(geometry, "groove_shape")
+    groove.toggle()  # dataclasses are expanded by their fields
+    assert _child(groove, "t").button is None
+
+
+def test_lazy_children(tmp_path):
+    """The children of a node are only accessed per shown page, paths are opened lazily."""
+    accessed = []
+
+    class Recording(dict):
+        def __getitem__(self, key):
+            accessed.append(key)
+            return super().__getitem__(key)
+
+    node = _ObjectNode("node", Recording((i, i) for i in range(12)), page_size=5, expanded=True)
+    assert accessed == list(range(5))
+    node._children_box.children[-1].click()
+    assert accessed == list(range(10))
+
+    single_pass_weld_example(tmp_path / "weld.wx")
+    w = WidgetWeldxFile(tmp_path / "weld.wx")
+    assert w.file._asdffile_kwargs["lazy_tree"]
+    w.close()
+
+
+@pytest.mark.parametrize("key", ["welding_current", "coordinate_systems"])
+def test_previews(widget, key):
+    """Previews are rendered when a node is expanded."""
+    root = widget.tree
+    root._children_box.children[-1].click()
+    node = _child(root, key)
+    assert node.preview is None
+    node.toggle()
+    assert node.preview is not None
+    assert node._children_box.children[0] is node.preview
+
+
+def test_spatial_data_preview(widget):
+    """Spatial data shows a bounding box and a thumbnail."""
+    from weldx_widgets.widget_evaluate import prepare_csm
+
+    csm, _ = prepare_csm(widget.file)
+    node = type(widget.tree)("geometry", csm.get_data("workpiece geometry"), 5, expanded=True)
+    assert node.preview is not None
+
+    # large meshes are reduced to the points of the kept triangles.
+    points = np.arange(30.0).reshape(10, 3)
+    triangles = np.array([[0, 1, 2], [2, 3, 4], [5, 6, 7], [7, 8, 9]])
+    thumbnail_points, thumbnail_triangles = _thumbnail_mesh(points, triangles, max_triangles=2)
+    np.testing.assert_array_equal(thumbnail_triangles, [[0, 1, 2], [3, 4, 5]])
+    np.testing.assert_array_equal(thumbnail_points, points[[0, 1, 2, 5, 6, 7]])
+
+
+def test_header_tab(widget):
+    """The header browser is created when its tab is selected."""
+    assert widget.header_browser is None
+    widget.selected_index = 1
+    assert "TCP" in widget.header_browser.tree
+    assert widget.display() is widget
+    widget.close()
+    assert widget.header_browser.comm is None
+
+
+def test_summaries():
+    """Objects are summarized by type, shape and value."""
+    from weldx import Q_
+
+    assert summarize_object(Q_(3, "mm")) == "3 mm"
+    assert summarize_object(Q_([1.0, 2.0], "mm")) == "Quantity float64 (2,) [mm]"
+    assert summarize_object({"a": 1}) == "dict {1 keys}"
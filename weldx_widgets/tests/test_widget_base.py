@@ -0,0 +1,96 @@
+"""Tests for the base classes of the widgets."""
+
+import numpy as np
+from ipywidgets import IntSlider, Output
+from traitlets import observe
+
+from weldx_widgets.widget_base import WeldxImportExport, WidgetMyVBox, bulk_update
+
+
+class _Counter(IntSlider):
+    """Slider counting the calls of its class handler."""
+
+    calls = 0
+
+    @observe("value")
+    def _count(self, change):
+        self.calls += 1
+
+
+def test_bulk_update_class_handlers():
+    """Handlers defined by widget classes are suspended as well, except those of ipywidgets."""
+    slider = _Counter()
+    recomputed = []
+    with bulk_update(WidgetMyVBox(children=[slider]), lambda: recomputed.append(slider.value)):
+        slider.value = 3
+        assert slider.calls == 0
+    assert recomputed == [3]
+    slider.value = 4
+    assert slider.calls == 1
+
+
+def test_bulk_update_observers_changed():
+    """Observers added or removed within the context stay so, the others are restored in order."""
+    slider = IntSlider()
+    calls = []
+
+    def first(change):
+        calls.append("first")
+
+    def second(change):
+        calls.append("second")
+
+    def added(change):
+        calls.append("added")
+
+    slider.observe(first, "value")
+    slider.observe(second, "value")
+    with bulk_update(slider):
+        slider.value = 1
+        slider.unobserve(first, "value")
+        slider.observe(added, "value")
+    assert calls == []
+    slider.value = 2
+    assert calls == ["second", "added"]
+
+    # nested contexts and removing all observers of a name.
+    calls.clear()
+    with bulk_update(slider), bulk_update(slider):
+        slider.unobserve(second, "value")
+    slider.value = 3
+    assert calls == ["added"]
+    with bulk_update(slider):
+        slider.unobserve_all("value")
+    slider.value = 4
+    assert calls == ["added"]
+
+
+class _Form(WidgetMyVBox, WeldxImportExport):
+    """Widget with plain and other constructor arguments."""
+
+    def __init__(self, name="form", data=None, out=None):
+        self.name = name
+        self.out = out if out is not None else Output()
+        self.value = 0
+        super().__init__(children=[self.out])
+
+    def to_tree(self):
+        return dict(value=self.value)
+
+    def from_tree(self, tree):
+        self.value = tree["value"]
+
+
+def test_copy_init_args():
+    """Only plain constructor arguments are kept and passed to copies."""
+    out = Output()
+    w = _Form("custom", data=np.zeros(10), out=out)
+    w.value = 3
+    assert w._init_args == (("custom",), {})
+
+    clone = w.copy()
+    assert (clone.name, clone.value) == ("custom", 3)
+    assert clone.out is not out
+    assert not hasattr(WidgetMyVBox(), "_init_args")
+    # widgets created with other positional arguments are deep copied.
+    assert _Form(np.zeros(10))._init_args is None
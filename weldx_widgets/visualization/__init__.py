@@ -1,24 +1,48 @@
-"""Visualization tools for weldx types."""
-
-from .csm_k3d import CoordinateSystemManagerVisualizerK3D, SpatialDataVisualizer
-from .csm_mpl import (
-    axes_equal,
-    draw_coordinate_system_matplotlib,
-    new_3d_figure_and_axes,
-    plot_coordinate_system_manager_matplotlib,
-    plot_coordinate_systems,
-    plot_local_coordinate_system_matplotlib,
-    plot_spatial_data_matplotlib,
-)
-
-__all__ = (
-    "CoordinateSystemManagerVisualizerK3D",
-    "SpatialDataVisualizer",
-    "axes_equal",
-    "draw_coordinate_system_matplotlib",
-    "new_3d_figure_and_axes",
-    "plot_coordinate_system_manager_matplotlib",
-    "plot_coordinate_systems",
-    "plot_local_coordinate_system_matplotlib",
-    "plot_spatial_data_matplotlib",
-)
+"""Visualization tools for weldx types.
+
+The tools are imported on first access, so k3d is only loaded if needed.
+"""
+
+import importlib
+
+# public name -> module defining it
+_LAZY_IMPORTS = {
+    "CoordinateSystemManagerVisualizerK3D": ".csm_k3d",
+    "DecimatedLine": ".decimation",
+    "MinMaxPyramid": ".decimation",
+    "SpatialDataVisualizer": ".csm_k3d",
+    "axes_equal": ".csm_mpl",
+    "draw_coordinate_system_matplotlib": ".csm_mpl",
+    "new_3d_figure_and_axes": ".csm_mpl",
+    "plot_coordinate_system_manager_matplotlib": ".csm_mpl",
+    "plot_coordinate_systems": ".csm_mpl",
+    "plot_local_coordinate_system_matplotlib": ".csm_mpl",
+    "plot_spatial_data_matplotlib": ".csm_mpl",
+    "PyramidCache": ".decimation",
+    "SecondsAxis": ".decimation",
+    "default_pyramid_cache": ".decimation",
+    "box": ".primitives",
+    "cone": ".primitives",
+    "cylinder": ".primitives",
+    "merge_meshes": ".primitives",
+    "nozzle": ".primitives",
+    "sphere": ".primitives",
+    "to_spatial_data": ".primitives",
+}
+
+__all__ = tuple(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Import public names on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,7 @@
 """Color related tools."""
 
 from collections.abc import Generator, Sized
+from functools import lru_cache
 from typing import Union
 
 import matplotlib as mpl
@@ -171,15 +172,25 @@ def color_to_rgb_normalized(
     raise TypeError("Unsupported color format.")
 
 
-_color_list = [
-    RGB_RED,
-    RGB_GREEN,
-    RGB_BLUE,
-    RGB_YELLOW,
-    RGB_CYAN,
-    RGB_MAGENTA,
-    *_shuffled_tab20_colors(),
-]
+@lru_cache(maxsize=1)
+def _get_color_list() -> tuple[int, ...]:
+    """Return the predefined colors, computing the shuffled palette on first use."""
+    return (
+        RGB_RED,
+        RGB_GREEN,
+        RGB_BLUE,
+        RGB_YELLOW,
+        RGB_CYAN,
+        RGB_MAGENTA,
+        *_shuffled_tab20_colors(),
+    )
+
+
+def __getattr__(name):
+    """Provide ``_color_list`` without computing it at import."""
+    if name == "_color_list":
+        return list(_get_color_list())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def color_generator_function() -> Generator:
@@ -194,7 +205,7 @@ def color_generator_function() -> Generator:
 
     """
     while True:
-        yield from _color_list
+        yield from _get_color_list()
 
 
 def get_color(
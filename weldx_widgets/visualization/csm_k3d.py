@@ -19,6 +19,8 @@ from weldx.core import TimeSeries
 if TYPE_CHECKING:  # pragma: no cover
     from weldx.transformations.local_cs import LocalCoordinateSystem
 
+from weldx_widgets.profiling import StageProfiler
+
 from .colors import (
     RGB_BLACK,
     RGB_BLUE,
@@ -503,6 +505,7 @@ class CoordinateSystemManagerVisualizerK3D:
         show_vectors: bool = True,
         show_wireframe: bool = True,
         plot_all_obj: bool = False,
+        profiler: StageProfiler = None,
     ):
         """Create a `CoordinateSystemManagerVisualizerK3D`.
 
@@ -548,13 +551,23 @@ class CoordinateSystemManagerVisualizerK3D:
             If `True`, the coordinate systems' axis vectors will be shown initially
         show_wireframe :
             If `True`, spatial data containing mesh data will be drawn as wireframe
+        plot_all_obj :
+            If `True`, labels and points are created for all spatial data
+        profiler :
+            If passed, the stages of the plot creation are recorded by this
+            `weldx_widgets.profiling.StageProfiler`
         """
-        if time is None:
-            time = csm.time_union()
-        if time is not None:
-            csm = csm.interp_time(time=time, time_ref=time_ref)
+        if profiler is None:
+            profiler = StageProfiler(enabled=False)
+        self.profiler = profiler
+
+        with profiler.stage("k3d: interp_time"):
+            if time is None:
+                time = csm.time_union()
+            if time is not None:
+                csm = csm.interp_time(time=time, time_ref=time_ref)
 
-        self._csm = csm.interp_time(time=time, time_ref=time_ref)
+            self._csm = csm.interp_time(time=time, time_ref=time_ref)
         self._current_time_index = 0
 
         if coordinate_systems is None:
@@ -571,43 +584,51 @@ class CoordinateSystemManagerVisualizerK3D:
 
         self._color_generator = color_generator_function()
 
-        self._lcs_vis = {
-            lcs_name: CoordinateSystemVisualizerK3D(
-                self._csm.get_cs(lcs_name, reference_system),
-                plot,
-                lcs_name,
-                color=get_color(lcs_name, colors, self._color_generator),
-                show_origin=show_origins,
-                show_trace=show_traces,
-                show_vectors=show_vectors,
-            )
-            for lcs_name in coordinate_systems
-        }
-        self._data_vis = {
-            data_name: SpatialDataVisualizer(
-                self._csm.get_data(data_name=data_name),
-                data_name,
-                self._csm.get_data_system_name(data_name=data_name),
-                plot,
-                color=get_color(data_name, colors, self._color_generator),
-                show_wireframe=show_wireframe,
-                create_label=plot_all_obj,
-                create_points=plot_all_obj,
-            )
-            for data_name in data_sets
-        }
-        self._update_spatial_data()
+        # the payload of a stage are the k3d objects it adds to the plot.
+        with profiler.stage("k3d: coordinate systems") as stage:
+            num_objects = len(plot.objects)
+            self._lcs_vis = {
+                lcs_name: CoordinateSystemVisualizerK3D(
+                    self._csm.get_cs(lcs_name, reference_system),
+                    plot,
+                    lcs_name,
+                    color=get_color(lcs_name, colors, self._color_generator),
+                    show_origin=show_origins,
+                    show_trace=show_traces,
+                    show_vectors=show_vectors,
+                )
+                for lcs_name in coordinate_systems
+            }
+            stage.payload(plot.objects[num_objects:])
+        with profiler.stage("k3d: spatial data") as stage:
+            num_objects = len(plot.objects)
+            self._data_vis = {
+                data_name: SpatialDataVisualizer(
+                    self._csm.get_data(data_name=data_name),
+                    data_name,
+                    self._csm.get_data_system_name(data_name=data_name),
+                    plot,
+                    color=get_color(data_name, colors, self._color_generator),
+                    show_wireframe=show_wireframe,
+                    create_label=plot_all_obj,
+                    create_points=plot_all_obj,
+                )
+                for data_name in data_sets
+            }
+            self._update_spatial_data()
+            stage.payload(plot.objects[num_objects:])
 
         # create controls
-        self._controls = self._create_controls(
-            time,
-            show_data_labels,
-            show_labels,
-            show_origins,
-            show_traces,
-            show_vectors,
-            show_wireframe,
-        )
+        with profiler.stage("k3d: controls"):
+            self._controls = self._create_controls(
+                time,
+                show_data_labels,
+                show_labels,
+                show_origins,
+                show_traces,
+                show_vectors,
+                show_wireframe,
+            )
 
         # add title
         self._title = None
@@ -0,0 +1,405 @@
+"""Multi-resolution decimation of sampled signals for plotting."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from matplotlib.axes import Axes
+
+from weldx_widgets.cache import content_hash, default_cache_dir, source_hash
+
+__all__ = [
+    "DecimatedLine",
+    "MinMaxPyramid",
+    "PyramidCache",
+    "SecondsAxis",
+    "default_pyramid_cache",
+]
+
+_CHUNK_SAMPLES = 2**20
+
+
+class SecondsAxis:
+    """A time axis stored as integer nanoseconds, read as seconds on access.
+
+    Only the slices read by `MinMaxPyramid` are converted to floats, so long time axes,
+    e.g. of a `pandas.TimedeltaIndex`, are neither copied nor converted at once.
+
+    Parameters
+    ----------
+    ns :
+        Monotonically increasing sample times in nanoseconds.
+    offset :
+        Subtracted from all sample times, e.g. the reference time of absolute times.
+
+    """
+
+    ndim = 1
+    dtype = np.dtype(float)
+
+    def __init__(self, ns: np.ndarray, offset: int = 0):
+        self.ns = ns
+        self.offset = int(offset)
+
+    def __len__(self):
+        """Return the number of samples."""
+        return len(self.ns)
+
+    @property
+    def shape(self) -> tuple[int]:
+        """Return the shape of the axis."""
+        return (len(self.ns),)
+
+    def __getitem__(self, key):
+        """Return the selected sample times in seconds."""
+        return (np.asarray(self.ns[key], dtype=np.int64) - self.offset) / 1e9
+
+    def __array__(self, dtype=None, copy=None):
+        """Convert all sample times to seconds."""
+        return np.asarray(self[:], dtype=dtype)
+
+    def searchsorted(self, values) -> np.ndarray:
+        """Return the indices of the first samples not before the given times in seconds."""
+        ns = np.clip(np.ceil(np.asarray(values, dtype=float) * 1e9), -(2**62), 2**62)
+        return np.searchsorted(self.ns, ns.astype(np.int64) + self.offset)
+
+
+class MinMaxPyramid:
+    """Multi-level min/max/mean envelope of a sampled signal.
+
+    Level ``k`` (starting at ``first_level``) summarizes blocks of ``2**k`` consecutive
+    raw samples by their minimum, maximum and mean. Any time window can therefore be
+    drawn at screen resolution by reading only a few values per pixel from the matching
+    level, instead of the full raw signal. The raw samples are only accessed if a window
+    is shown at a finer resolution than the first level provides.
+
+    The first level is computed chunk-wise from the raw data, so memory-mapped signals
+    are streamed instead of loaded at once. The levels need ``32 / 2**first_level``
+    bytes per raw sample. For signals larger than the available memory, a coarser
+    ``first_level`` keeps the levels small, at the cost of reading up to
+    ``2**first_level`` raw samples per pixel when zooming into short windows.
+
+    Parameters
+    ----------
+    time :
+        Monotonically increasing sample times as floats or a `SecondsAxis`.
+    data :
+        Sample values, same length as ``time``.
+    min_level_size :
+        No coarser levels are built once a level has less blocks than this.
+    first_level :
+        The finest level stored, levels with smaller blocks are served from the raw data.
+
+    """
+
+    def __init__(self, time: np.ndarray, data: np.ndarray, min_level_size: int = 512, first_level: int = 1):
+        if not isinstance(time, SecondsAxis):
+            time = np.asarray(time, dtype=float)
+        data = np.asarray(data)
+        if time.ndim != 1 or data.shape != time.shape:
+            raise ValueError("time and data have to be one-dimensional and of equal length.")
+        if min_level_size < 1:
+            raise ValueError("min_level_size has to be positive.")
+        if first_level < 1:
+            raise ValueError("first_level has to be positive.")
+        self.time = time
+        self.data = data
+        self.first_level = first_level
+        self.levels = self._build_levels(time, data, min_level_size, first_level)
+
+    @classmethod
+    def from_levels(
+        cls, time: np.ndarray, data: np.ndarray, levels: list[np.ndarray], first_level: int = 1
+    ) -> MinMaxPyramid:
+        """Create a pyramid from precomputed levels without reading the raw data.
+
+        Parameters
+        ----------
+        time :
+            Raw sample times, may be a lazily loaded or memory-mapped array.
+        data :
+            Raw sample values, may be a lazily loaded or memory-mapped array.
+        levels :
+            Arrays of shape (4, n) holding the time, minimum, maximum and mean per block,
+            as returned by `MinMaxPyramid.levels`.
+        first_level :
+            The level of the first array of ``levels``.
+
+        """
+        obj = cls.__new__(cls)
+        obj.time = time
+        obj.data = data
+        obj.first_level = first_level
+        obj.levels = list(levels)
+        return obj
+
+    @staticmethod
+    def _reduce_blocks(time, data, block: int) -> np.ndarray:
+        """Summarize blocks of ``block`` raw samples, reading the raw data chunk-wise."""
+        n = len(time)
+        out = np.empty((4, -(-n // block)))
+        step = max(_CHUNK_SAMPLES // block, 1) * block
+        for start in range(0, n, step):
+            t = np.asarray(time[start : start + step])
+            x = np.asarray(data[start : start + step], dtype=float)
+            if len(x) % block:  # pad the last block by repeating the last sample.
+                x = np.concatenate([x, np.full(block - len(x) % block, x[-1])])
+            x = x.reshape(-1, block)
+            sl = slice(start // block, start // block + len(x))
+            out[0, sl] = t[::block]  # a block is located at the time of its first sample.
+            out[1, sl] = np.fmin.reduce(x, axis=1)
+            out[2, sl] = np.fmax.reduce(x, axis=1)
+            out[3, sl] = x.mean(axis=1)
+        return out
+
+    @classmethod
+    def _build_levels(cls, time, data, min_level_size, first_level) -> list[np.ndarray]:
+        if len(time) < 2**first_level * min_level_size:
+            return []
+        levels = [cls._reduce_blocks(time, data, 2**first_level)]
+        t, lo, hi, mean = levels[0]
+        while len(t) >= 2 * min_level_size:
+            if len(t) % 2:  # pad the last block by repeating the last sample.
+                t, lo, hi, mean = (np.append(x, x[-1]) for x in (t, lo, hi, mean))
+            t = t[::2]  # a block is located at the time of its first sample.
+            lo = np.fmin(lo[::2], lo[1::2])
+            hi = np.fmax(hi[::2], hi[1::2])
+            mean = (mean[::2] + mean[1::2]) / 2
+            levels.append(np.stack([t, lo, hi, mean]).astype(float))
+        return levels
+
+    def __len__(self):
+        """Return the number of raw samples."""
+        return len(self.time)
+
+    @property
+    def num_levels(self) -> int:
+        """Return the number of levels including the raw data."""
+        return len(self.levels) + 1
+
+    def level_for(self, num_samples: int, num_pixels: int) -> int:
+        """Return the finest level showing ``num_samples`` with about one block per pixel.
+
+        Parameters
+        ----------
+        num_samples :
+            Number of raw samples within the visible window.
+        num_pixels :
+            Horizontal resolution of the window.
+
+        """
+        if num_samples <= 2 * num_pixels or not self.levels:
+            return 0
+        level = int(np.ceil(np.log2(num_samples / num_pixels)))
+        if level < self.first_level:
+            return 0
+        return min(level, self.first_level + len(self.levels) - 1)
+
+    def _num_samples(self, t_min, t_max) -> int:
+        """Estimate the number of raw samples within a window from the levels."""
+        if not self.levels:
+            i0, i1 = self.time.searchsorted((t_min, t_max))
+            return i1 - i0
+        # descend until the window covers enough blocks for a reasonable estimate.
+        for k in reversed(range(len(self.levels))):
+            i0, i1 = np.searchsorted(self.levels[k][0], (t_min, t_max))
+            if i1 - i0 >= 16:
+                break
+        return (i1 - i0) * 2 ** (k + self.first_level)
+
+    def query(self, t_min: float, t_max: float, num_pixels: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the envelope of the window ``[t_min, t_max]`` at screen resolution.
+
+        The costs are logarithmic in the number of raw samples plus linear in the number
+        of pixels, no matter how many samples the window contains.
+
+        Parameters
+        ----------
+        t_min :
+            Start of the visible window.
+        t_max :
+            End of the visible window.
+        num_pixels :
+            Horizontal resolution of the window.
+
+        Returns
+        -------
+        time, data
+            Raw samples if the window is resolved by the screen, otherwise the
+            interleaved minima and maxima of the blocks within the window.
+
+        """
+        num_pixels = max(int(num_pixels), 1)
+        level = self.level_for(self._num_samples(t_min, t_max), num_pixels)
+        if level == 0:
+            t, lo, hi = self.time, self.data, None
+        else:
+            t, lo, hi, _ = self.levels[level - self.first_level]
+        i0, i1 = t.searchsorted((t_min, t_max))
+        # include one neighbour on each side, so lines continue to the axes limits.
+        sl = slice(max(i0 - 1, 0), i1 + 1)
+        if hi is None:
+            return np.asarray(t[sl]), np.asarray(lo[sl])
+        return np.repeat(t[sl], 2), np.column_stack([lo[sl], hi[sl]]).ravel()
+
+
+class PyramidCache:
+    """On-disk cache of `MinMaxPyramid` levels.
+
+    The levels are stored as ``.npy`` files in a sub-directory and memory-mapped when
+    loaded again, e.g. when reopening the same file in a new kernel. Signals read from
+    a file are identified by the ``source`` passed to `get`, the file and the path of
+    the signal within, so reopening a cached signal does not read its raw data. Other
+    signals are identified by a hash of their contents. If the directory cannot be
+    written, the pyramids are built without being stored.
+
+    Parameters
+    ----------
+    directory :
+        Cache directory. If `None`, pyramids are built on every call without caching,
+        see `default_pyramid_cache`.
+    min_level_size :
+        Passed to `MinMaxPyramid` when building new pyramids.
+    first_level :
+        Passed to `MinMaxPyramid` when building new pyramids.
+
+    """
+
+    def __init__(self, directory: str | Path = None, min_level_size: int = 512, first_level: int = 1):
+        self.directory = None if directory is None else Path(directory)
+        self.min_level_size = min_level_size
+        self.first_level = first_level
+
+    def _path(self, time, data, source) -> Path:
+        if source is None:
+            key = content_hash(time, data)
+        else:
+            filename, node = source
+            key = source_hash(filename, node, np.shape(time), np.shape(data), np.dtype(data.dtype).str)
+        name = f"{key}-{self.min_level_size}"
+        if self.first_level != 1:
+            name += f"-{self.first_level}"
+        return self.directory / name
+
+    def get(self, time: np.ndarray, data: np.ndarray, source: tuple[str | Path, str] = None) -> MinMaxPyramid:
+        """Return the pyramid of a signal, loading it from the cache if possible.
+
+        Pass the file and the path of the signal within as ``source``, if it was read
+        from a file. The entry is invalidated when the file is modified.
+        """
+        if self.directory is None:
+            return MinMaxPyramid(time, data, self.min_level_size, self.first_level)
+        path = self._path(time, data, source)
+        levels = self._load(path)
+        if levels is not None:
+            return MinMaxPyramid.from_levels(time, data, levels, self.first_level)
+
+        pyramid = MinMaxPyramid(time, data, self.min_level_size, self.first_level)
+        self._store(path, pyramid.levels)
+        return pyramid
+
+    @staticmethod
+    def _load(path: Path) -> list[np.ndarray] | None:
+        if not path.is_dir():
+            return None
+        try:
+            num_levels = len(list(path.glob("level_*.npy")))
+            return [np.load(path / f"level_{i}.npy", mmap_mode="r") for i in range(num_levels)]
+        except (OSError, ValueError):  # incomplete or corrupt entry, rebuild it.
+            return None
+
+    def _store(self, path: Path, levels: list[np.ndarray]):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = Path(tempfile.mkdtemp(dir=self.directory, prefix=".tmp-"))
+        except OSError:  # read-only or missing cache directory, keep the pyramid in memory.
+            return
+        try:
+            for i, level in enumerate(levels):
+                np.save(tmp / f"level_{i}.npy", level)
+            os.replace(tmp, path)
+        except OSError:  # another process stored the same entry in the meantime.
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def clear(self):
+        """Remove all cached pyramids."""
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def default_pyramid_cache(first_level: int = 1) -> PyramidCache:
+    """Return a pyramid cache using the default cache directory.
+
+    Pyramids are only stored on disk, if the cache root directory is set by the
+    environment variable ``WELDX_WIDGETS_CACHE_DIR``, in its ``pyramids`` directory
+    (see `weldx_widgets.cache.default_cache_dir`). Otherwise they are built on demand.
+
+    Parameters
+    ----------
+    first_level :
+        Passed to `MinMaxPyramid` when building new pyramids.
+
+    """
+    return PyramidCache(directory=default_cache_dir("pyramids"), first_level=first_level)
+
+
+class DecimatedLine:
+    """A matplotlib line showing a `MinMaxPyramid` at the resolution of its axes.
+
+    The line is re-decimated whenever the x-limits of its axes, or of axes sharing the
+    x-axis with it, change. Zooming into a short window thus shows the raw samples.
+
+    Parameters
+    ----------
+    ax :
+        The axes to plot into.
+    pyramid :
+        The decimated signal.
+    num_pixels :
+        Horizontal resolution used for decimation. Defaults to the width of the axes.
+    plot_kwargs :
+        Passed to `matplotlib.axes.Axes.plot`.
+
+    """
+
+    def __init__(self, ax: Axes, pyramid: MinMaxPyramid, num_pixels: int = None, **plot_kwargs):
+        self.ax = ax
+        self.pyramid = pyramid
+        self._num_pixels = num_pixels
+        self._xlim = self._full_range(pyramid)
+        (self.line,) = ax.plot(*pyramid.query(*self._xlim, self.num_pixels), **plot_kwargs)
+
+        # Depending on the matplotlib version, only the axes being zoomed emits the
+        # event, so we listen to all axes sharing the x-axis.
+        for other in ax.get_shared_x_axes().get_siblings(ax):
+            other.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
+    @staticmethod
+    def _full_range(pyramid):
+        if not len(pyramid):
+            return 0.0, 0.0
+        # prefer the first level, so the raw time array is not touched.
+        t = pyramid.levels[0][0] if pyramid.levels else pyramid.time
+        return float(t[0]), float(pyramid.time[-1])
+
+    @property
+    def num_pixels(self) -> int:
+        """Return the horizontal resolution used for decimation."""
+        if self._num_pixels is not None:
+            return self._num_pixels
+        return max(int(self.ax.bbox.width), 1)
+
+    def _on_xlim_changed(self, ax: Axes):
+        self.update(ax.get_xlim())
+
+    def update(self, xlim: tuple[float, float]):
+        """Re-decimate the line for the given x-limits."""
+        xlim = tuple(sorted(xlim))
+        if xlim == self._xlim:
+            return
+        self._xlim = xlim
+        self.line.set_data(*self.pyramid.query(*xlim, self.num_pixels))
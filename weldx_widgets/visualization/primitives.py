@@ -0,0 +1,233 @@
+"""Triangle meshes of geometric primitives, e.g. to visualize welding tools."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from weldx import Q_, SpatialData
+
+__all__ = [
+    "box",
+    "cone",
+    "cylinder",
+    "merge_meshes",
+    "nozzle",
+    "sphere",
+    "to_spatial_data",
+]
+
+Mesh = tuple[np.ndarray, np.ndarray]
+"""Vertices as float32 array of shape (n, 3) and triangles as uint32 array of shape (m, 3)."""
+
+
+def _read_only(points, triangles) -> Mesh:
+    points = np.ascontiguousarray(points, dtype=np.float32)
+    triangles = np.ascontiguousarray(triangles, dtype=np.uint32)
+    for arr in (points, triangles):
+        # meshes are memoized and thus shared by all callers.
+        arr.setflags(write=False)
+    return points, triangles
+
+
+def _lathe(radii, heights, resolution: int, start=None, end=None, closed=False) -> Mesh:
+    """Revolve a profile around the z-axis.
+
+    Parameters
+    ----------
+    radii :
+        Radius of each ring of the profile.
+    heights :
+        z-coordinate of each ring of the profile.
+    resolution :
+        Number of vertices per ring.
+    start :
+        If given, the first ring is closed by a fan around a vertex on the axis at this height.
+    end :
+        If given, the last ring is closed by a fan around a vertex on the axis at this height.
+    closed :
+        Connect the last ring with the first one.
+
+    """
+    if resolution < 3:
+        raise ValueError("resolution has to be at least 3.")
+    radii = np.asarray(radii, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    num_rings = len(radii)
+
+    angles = np.arange(resolution) * (2 * np.pi / resolution)
+    rings = np.empty((num_rings, resolution, 3))
+    rings[..., 0] = radii[:, np.newaxis] * np.cos(angles)
+    rings[..., 1] = radii[:, np.newaxis] * np.sin(angles)
+    rings[..., 2] = heights[:, np.newaxis]
+    points = [rings.reshape(-1, 3)]
+
+    i = np.arange(resolution)
+    i_next = np.roll(i, -1)
+    j = np.arange(num_rings if closed else num_rings - 1)[:, np.newaxis] * resolution
+    j_next = (j + resolution) % (num_rings * resolution)
+    a, b, c, d = j + i, j + i_next, j_next + i, j_next + i_next
+    # two triangles per quad with normals facing outwards.
+    triangles = [np.stack([np.stack([a, d, c], -1), np.stack([a, b, d], -1)], -2).reshape(-1, 3)]
+
+    pole = num_rings * resolution
+    if start is not None:
+        points.append([[0, 0, start]])
+        triangles.append(np.column_stack([np.full(resolution, pole), i_next, i]))
+        pole += 1
+    if end is not None:
+        last = (num_rings - 1) * resolution
+        points.append([[0, 0, end]])
+        triangles.append(np.column_stack([np.full(resolution, pole), last + i, last + i_next]))
+
+    return _read_only(np.concatenate(points), np.concatenate(triangles))
+
+
+@lru_cache(maxsize=256)
+def cylinder(radius: float, length: float, resolution: int = 16, capped: bool = True) -> Mesh:
+    """Return a cylinder along the z-axis from ``z=0`` to ``z=length``.
+
+    Parameters
+    ----------
+    radius :
+        Radius of the cylinder.
+    length :
+        Length of the cylinder.
+    resolution :
+        Number of vertices of the cross-section.
+    capped :
+        Close both ends of the cylinder.
+
+    """
+    ends = (0, length) if capped else (None, None)
+    return _lathe([radius, radius], [0, length], resolution, *ends)
+
+
+@lru_cache(maxsize=256)
+def cone(radius: float, length: float, resolution: int = 16, capped: bool = True) -> Mesh:
+    """Return a cone with its base at ``z=0`` and its apex at ``z=length``.
+
+    Parameters
+    ----------
+    radius :
+        Radius of the base.
+    length :
+        Height of the cone.
+    resolution :
+        Number of vertices of the base.
+    capped :
+        Close the base of the cone.
+
+    """
+    return _lathe([radius], [0], resolution, start=0 if capped else None, end=length)
+
+
+@lru_cache(maxsize=256)
+def nozzle(
+    inner_radius: float,
+    outer_radius: float,
+    length: float,
+    tip_inner_radius: float = None,
+    tip_outer_radius: float = None,
+    resolution: int = 32,
+) -> Mesh:
+    """Return a hollow, optionally tapered gas nozzle from its tip at ``z=0`` to ``z=length``.
+
+    Parameters
+    ----------
+    inner_radius :
+        Inner radius at the back end of the nozzle.
+    outer_radius :
+        Outer radius at the back end of the nozzle.
+    length :
+        Length of the nozzle.
+    tip_inner_radius :
+        Inner radius at the tip. Defaults to ``inner_radius``.
+    tip_outer_radius :
+        Outer radius at the tip. Defaults to ``outer_radius``.
+    resolution :
+        Number of vertices per ring.
+
+    """
+    if tip_inner_radius is None:
+        tip_inner_radius = inner_radius
+    if tip_outer_radius is None:
+        tip_outer_radius = outer_radius
+    radii = [tip_outer_radius, outer_radius, inner_radius, tip_inner_radius]
+    return _lathe(radii, [0, length, length, 0], resolution, closed=True)
+
+
+@lru_cache(maxsize=256)
+def sphere(radius: float, resolution: int = 16) -> Mesh:
+    """Return a sphere centered at the origin.
+
+    Parameters
+    ----------
+    radius :
+        Radius of the sphere.
+    resolution :
+        Number of vertices per circle of latitude, half as many circles are used.
+
+    """
+    num_circles = max(resolution // 2, 2)
+    theta = np.arange(1, num_circles) * (np.pi / num_circles)
+    return _lathe(radius * np.sin(theta), -radius * np.cos(theta), resolution, start=-radius, end=radius)
+
+
+_BOX_TRIANGLES = np.array(
+    [
+        [0, 1, 3], [0, 3, 2],  # x = 0
+        [4, 6, 7], [4, 7, 5],  # x = 1
+        [0, 4, 5], [0, 5, 1],  # y = 0
+        [2, 3, 7], [2, 7, 6],  # y = 1
+        [0, 2, 6], [0, 6, 4],  # z = 0
+        [1, 5, 7], [1, 7, 3],  # z = 1
+    ]
+)  # fmt: skip
+
+
+@lru_cache(maxsize=256)
+def box(size_x: float, size_y: float, size_z: float) -> Mesh:
+    """Return a box centered at the origin.
+
+    Parameters
+    ----------
+    size_x :
+        Extent of the box in x-direction.
+    size_y :
+        Extent of the box in y-direction.
+    size_z :
+        Extent of the box in z-direction.
+
+    """
+    # corner k has the coordinates of the bits of k, e.g. corner 5 = (1, 0, 1).
+    corners = (np.arange(8)[:, np.newaxis] >> np.array([2, 1, 0]) & 1) - 0.5
+    return _read_only(corners * [size_x, size_y, size_z], _BOX_TRIANGLES)
+
+
+def merge_meshes(*meshes: Mesh) -> Mesh:
+    """Combine several meshes into one, e.g. to show many tools with a single k3d object."""
+    offsets = np.cumsum([0] + [len(points) for points, _ in meshes[:-1]])
+    points = np.concatenate([points for points, _ in meshes])
+    triangles = np.concatenate([triangles + offset for (_, triangles), offset in zip(meshes, offsets)])
+    return _read_only(points, triangles)
+
+
+def to_spatial_data(mesh: Mesh, unit: str = "mm", offset=None) -> SpatialData:
+    """Return a mesh as `weldx.SpatialData`.
+
+    Parameters
+    ----------
+    mesh :
+        The vertices and triangles.
+    unit :
+        Length unit of the vertices.
+    offset :
+        Optional translation of the vertices, e.g. the contact tip distance of a nozzle.
+
+    """
+    points, triangles = mesh
+    if offset is not None:
+        points = (points + np.asarray(offset, dtype=np.float32)).astype(np.float32)
+    return SpatialData(Q_(points, unit), triangles)
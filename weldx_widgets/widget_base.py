@@ -1,8 +1,13 @@
 """Base classes for widgets."""
 
 import abc
+import contextlib
+import functools
+import threading
+from collections.abc import Callable
 
 from ipywidgets import HBox, Layout, Output, VBox
+from traitlets import EventHandler, HasTraits
 
 
 def metaclass_resolver(*classes):
@@ -18,18 +23,72 @@ def metaclass_resolver(*classes):
     return metaclass(cls_name(classes), classes, {})  # class C
 
 
+# constructor arguments of these types are passed to clones (see WidgetBase.copy).
+_PLAIN_TYPES = (type(None), bool, int, float, str)
+
+
+def _clone_args(args, kwargs) -> tuple[tuple, dict] | None:
+    """Return the plain constructor arguments, or `None` if a positional one is not plain.
+
+    Other keyword arguments, e.g. output widgets or large data, are dropped, so they are
+    neither kept alive nor shared with clones.
+    """
+    if not all(isinstance(arg, _PLAIN_TYPES) for arg in args):
+        return None
+    return args, {key: value for key, value in kwargs.items() if isinstance(value, _PLAIN_TYPES)}
+
+
 class _merged_meta(type(abc.ABC)):  # avoid metaclass conflict.
-    pass
+    def __call__(cls, *args, **kwargs):
+        instance = super().__call__(*args, **kwargs)
+        if issubclass(cls, WeldxImportExport):
+            # remember the constructor arguments to clone the widget (see WidgetBase.copy).
+            instance._init_args = _clone_args(args, kwargs)
+        return instance
 
 
 class WidgetBase(abc.ABC, metaclass=_merged_meta):
     """Base class for weldx widgets."""
 
     def copy(self):
-        """Copy the widget."""
-        from copy import deepcopy
-
-        return deepcopy(self)
+        """Copy the widget.
+
+        Widgets supporting ``to_tree`` and ``from_tree`` are cloned structurally: a new
+        widget is created with the plain constructor arguments (`None`, numbers and
+        strings) of this one and filled with its tree in a `bulk_update`. Other keyword
+        arguments take their default. This is much faster than a deep copy of the
+        ipywidgets object graph, which is only used for other widgets and widgets
+        created with other positional arguments.
+        """
+        init_args = getattr(self, "_init_args", None)
+        if init_args is None or not (hasattr(self, "to_tree") and hasattr(self, "from_tree")):
+            from copy import deepcopy
+
+            return deepcopy(self)
+
+        args, kwargs = init_args
+        clone = type(self)(*args, **kwargs)
+        with bulk_update(clone):
+            clone.from_tree(self.to_tree())
+        return clone
+
+    observer_profiler = None
+
+    def profile_observers(self, threshold_s: float = 0.1, capacity: int = 1000):
+        """Time the trait observers of this widget and its descendants.
+
+        Returns the `weldx_widgets.profiling.ObserverProfiler`, also stored as
+        ``observer_profiler``, whose ``as_dict`` and ``to_dataframe`` show the call
+        counts and durations per observer. Calls longer than ``threshold_s`` seconds are
+        flagged as slow, the last ``capacity`` calls are kept. Calling this again
+        returns the existing profiler.
+        """
+        if self.observer_profiler is None:
+            from weldx_widgets.profiling import ObserverProfiler
+
+            self.observer_profiler = ObserverProfiler(threshold_s=threshold_s, capacity=capacity)
+            self.observer_profiler.instrument(self)
+        return self.observer_profiler
 
     def set_visible(self, state: bool):
         """Toggle visibility."""
@@ -106,8 +165,145 @@ class WidgetSimpleOutput(WidgetMyHBox):
         return self.out.__exit__(exc_type, exc_val, exc_tb)
 
 
+_bulk_state = threading.local()
+
+
+def _descendants(widget):
+    """Yield the widget and all widgets reachable through ``children``."""
+    seen = set()
+    stack = [widget]
+    while stack:
+        w = stack.pop()
+        if id(w) in seen or not isinstance(w, HasTraits):
+            continue
+        seen.add(id(w))
+        yield w
+        stack.extend(getattr(w, "children", ()))
+
+
+def _is_suspended(handler) -> bool:
+    """Return if an observer is suspended by `bulk_update`."""
+    # e.g. observers timed by an ObserverProfiler.
+    handler = getattr(handler, "__wrapped__", handler)
+    if isinstance(handler, EventHandler):
+        # the handlers of the ipywidgets classes keep their models consistent, e.g. index and value of selections.
+        return not getattr(handler.func, "__module__", "").startswith(("ipywidgets.", "traitlets."))
+    return True
+
+
+@contextlib.contextmanager
+def _suspend_observers(widget: HasTraits):
+    """Suspend the observers of ``widget``, see `bulk_update`.
+
+    On exit, the suspended observers are added again, unless they were removed within the
+    context. Observers added or removed within the context stay so.
+    """
+    notifiers = widget._trait_notifiers
+    original, suspended = {}, {}
+    for name, kinds in notifiers.items():
+        for kind, handlers in kinds.items():
+            original[name, kind] = list(handlers)
+            suspended[name, kind] = [h for h in handlers if _is_suspended(h)]
+            handlers[:] = [h for h in handlers if not _is_suspended(h)]
+
+    # unobserve has to find suspended observers, which are not in the lists of the widget.
+    previous = widget.__dict__.get("_remove_notifiers")
+    remove_notifiers = previous or functools.partial(type(widget)._remove_notifiers, widget)
+
+    def remove_suspended(handler, name, kind):
+        handlers = suspended.get((name, kind), [])
+        if handler is None:
+            handlers.clear()
+        elif handler in handlers:
+            handlers.remove(handler)
+            return
+        remove_notifiers(handler, name, kind)
+
+    widget._remove_notifiers = remove_suspended
+    try:
+        yield
+    finally:
+        if previous is None:
+            del widget._remove_notifiers
+        else:
+            widget._remove_notifiers = previous
+        # unobserve_all replaces the notifiers or removes the entries of names.
+        if widget._trait_notifiers is notifiers:
+            for (name, kind), handlers in original.items():
+                current = notifiers.get(name, {}).get(kind)
+                if current is None:
+                    continue
+                restored = [h for h in handlers if h in suspended[name, kind] or h in current]
+                current[:] = restored + [h for h in current if h not in handlers]
+
+
+@contextlib.contextmanager
+def bulk_update(widget, recompute: Callable[[], object] = None):
+    """Update a widget and its descendants at once, e.g. when filling them from a tree.
+
+    Within the context, the observers of the widget and its descendants (reached through
+    ``children`` on entering) are not called, and the state changes sent to the
+    frontend are held and sent once per widget (see ``hold_sync``). This includes
+    handlers defined with ``@observe`` by widget classes, except those of the ipywidgets
+    classes, keeping their models consistent. Observers may be added or removed within
+    the context, added observers are called right away. Afterwards ``recompute`` is
+    called once, e.g. to plot the result.
+
+    Nested contexts, also of other widgets, defer their ``recompute`` to the exit of
+    the outermost context, where each distinct function is called once.
+    """
+    pending = getattr(_bulk_state, "pending", None)
+    outermost = pending is None
+    if outermost:
+        pending = _bulk_state.pending = []
+    if recompute is not None and recompute not in pending:
+        pending.append(recompute)
+    try:
+        with contextlib.ExitStack() as stack:
+            for w in _descendants(widget):
+                stack.enter_context(_suspend_observers(w))
+                if hasattr(w, "hold_sync"):
+                    stack.enter_context(w.hold_sync())
+            yield
+    finally:
+        if outermost:
+            del _bulk_state.pending
+    if outermost:
+        for func in pending:
+            func()
+
+
+def _field_state(field):
+    if hasattr(field, "to_snapshot"):
+        return field.to_snapshot()
+    if hasattr(field, "text_value"):  # WidgetLabeledTextInput
+        return field.text_value
+    if isinstance(field, HasTraits) and field.has_trait("value"):
+        return field.value
+    return field
+
+
+def _set_field_state(field, state):
+    if hasattr(field, "from_snapshot"):
+        field.from_snapshot(state)
+    elif hasattr(field, "text_value"):
+        field.text_value = state
+    else:
+        field.value = state
+
+
 class WeldxImportExport(abc.ABC):
-    """Abstract import and export interfaces for weldx data exchange."""
+    """Abstract import and export interfaces for weldx data exchange.
+
+    Besides trees of weldx objects, the widgets can export their state as a snapshot
+    with JSON serializable values only, e.g. quantities as strings like "5 mm". Loading
+    a snapshot needs neither ASDF nor weldx objects, see `weldx_widgets.snapshot`.
+    By default, the snapshot holds the state of the attributes named in
+    ``snapshot_fields``: the snapshots of nested widgets, the text of labeled text
+    inputs, the value of other widgets or the attribute itself.
+    """
+
+    snapshot_fields: tuple[str, ...] = ()
 
     @abc.abstractmethod
     def from_tree(self, tree: dict):
@@ -116,3 +312,21 @@ class WeldxImportExport(abc.ABC):
     @abc.abstractmethod
     def to_tree(self) -> dict:
         """Return a dict containing data from widget."""
+
+    def to_snapshot(self) -> dict:
+        """Return the state of the widget as JSON serializable dict."""
+        if not self.snapshot_fields:
+            raise NotImplementedError(f"{type(self).__name__} does not support snapshots")
+        return {name: _field_state(getattr(self, name)) for name in self.snapshot_fields}
+
+    def from_snapshot(self, snapshot: dict):
+        """Restore the state of the widget from a snapshot."""
+        if not self.snapshot_fields:
+            raise NotImplementedError(f"{type(self).__name__} does not support snapshots")
+        with bulk_update(self):
+            for name in self.snapshot_fields:
+                field = getattr(self, name)
+                if isinstance(field, HasTraits):
+                    _set_field_state(field, snapshot[name])
+                else:
+                    setattr(self, name, snapshot[name])
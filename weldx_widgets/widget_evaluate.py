@@ -10,26 +10,62 @@ That includes:
 
 """
 
-from collections import defaultdict
+import functools
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 from IPython.display import display
-from ipywidgets import Layout, Output, Tab
+from ipywidgets import Button, Layout, Output, Tab, VBox
+from tqdm.auto import tqdm
 
-import weldx
 from weldx import (
     Q_,
     CoordinateSystemManager,
-    Geometry,
     GmawProcess,
-    LinearHorizontalTraceSegment,
     SpatialData,
-    Trace,
     WeldxFile,
 )
+from weldx_widgets.evaluation import TCPDeviation, compare_tcp, repair_scan_points
+from weldx_widgets.figures import figure_registry
+from weldx_widgets.geometry_cache import rasterize_workpiece
+from weldx_widgets.profiling import StageProfiler
+from weldx_widgets.visualization.csm_k3d import CoordinateSystemManagerVisualizerK3D
+from weldx_widgets.visualization.primitives import cylinder, to_spatial_data
 from weldx_widgets.widget_base import WidgetBase, WidgetSimpleOutput, metaclass_resolver
 from weldx_widgets.widget_factory import make_title
-from weldx_widgets.widget_measurement import WidgetMeasurement, WidgetMeasurementChain
+from weldx_widgets.widget_header import WidgetHeaderBrowser
+from weldx_widgets.widget_measurement import (
+    WidgetMeasurement,
+    WidgetMeasurementChain,
+    _file_name,
+    default_pyramid_cache,
+    measurement_pyramids,
+)
+
+# finest decimation level of measurements in lazy mode, i.e. 0.5 bytes per raw sample.
+_LAZY_FIRST_LEVEL = 6
+# scan points repaired at once in lazy mode.
+_LAZY_CHUNK_POINTS = 2**20
+
+
+def open_lazy(filename: str | Path) -> WeldxFile:
+    """Open a weldx file read-only, with lazily loaded and memory-mapped arrays.
+
+    Only the YAML tree is parsed on opening. Objects are converted when they are
+    accessed and their binary blocks are memory-mapped instead of read, so arrays are
+    paged in from disk as far as they are used. Note that weldx copies the values of
+    time series and the coordinates of spatial data into memory, when they are accessed.
+    """
+    return WeldxFile(
+        filename,
+        mode="r",
+        asdffile_kwargs=dict(memmap=True, lazy_load=True, lazy_tree=True),
+    )
 
 
 class WidgetProcessInfo(WidgetSimpleOutput):
@@ -41,7 +77,7 @@ class WidgetProcessInfo(WidgetSimpleOutput):
         children = [make_title("Process parameters"), self.out]
         self.children = children
 
-        with self:
+        with self, figure_registry.track(self):
             from weldx_widgets.widget_gmaw import plot_gmaw
 
             self.fig, self.ax = plot_gmaw(gmaw_process, t)
@@ -71,91 +107,381 @@ cs_colors = {
 }
 
 
-def _clean_nans_from_spatial_data(data: SpatialData):
-    def dims_as_coords(arr):
-        return arr.assign_coords({k: arr[k] for k in arr.dims})
+def _copy_on_write(arr: np.ndarray) -> np.ndarray | None:
+    """Return a writable copy-on-write mapping of a memory-mapped array, otherwise `None`.
+
+    Only the pages written to are copied into memory, the file is not modified.
+    """
+    root = arr
+    while root is not None and not isinstance(root, np.memmap):
+        root = getattr(root, "base", None)
+    if root is None or root.filename is None:
+        return None
+    mapping = np.memmap(root.filename, dtype=np.uint8, mode="c", offset=root.offset, shape=(root.nbytes,))
+    start = arr.__array_interface__["data"][0] - root.__array_interface__["data"][0]
+    return np.ndarray(arr.shape, arr.dtype, buffer=mapping, offset=start, strides=arr.strides)
+
 
+def _clean_nans_from_spatial_data(data: SpatialData, lazy: bool = False) -> int:
+    """Fill invalid scan points (NaN or non-positive z) in place and return their number.
+
+    The points are converted to float32, unless in ``lazy`` mode. They are then
+    repaired chunk-wise in their data type, read-only memory-mapped points within a
+    copy-on-write mapping of their file.
+    """
     coords = data.coordinates
-    coords = dims_as_coords(coords)
+    points = coords.data
+    units = getattr(points, "units", None)
+    if units is not None:
+        points = points.magnitude
+    writable = points
+    if lazy and not points.flags.writeable:
+        writable = _copy_on_write(points)
+        if writable is None:
+            writable = np.array(points)
+    elif not lazy and (points.dtype != np.float32 or not points.flags.writeable):
+        writable = np.array(points, dtype=np.float32)
+    if writable is not points:
+        points = writable
+        data.coordinates = coords.copy(data=Q_(points, units) if units is not None else points)
+
+    axis = coords.dims.index("n") if "n" in coords.dims else -2
+    return repair_scan_points(points, axis=axis, chunk_size=_LAZY_CHUNK_POINTS if lazy else None)
+
+
+def prepare_csm(
+    file: WeldxFile, profiler: StageProfiler = None, lazy: bool = False
+) -> tuple[CoordinateSystemManager, dict[str, int]]:
+    """Return the coordinate systems of a single pass weld file prepared for plotting.
+
+    The scan data is repaired in place and the rasterized workpiece geometries and the
+    welding wire are attached. If a ``profiler`` is passed, these steps are recorded as
+    stages. In ``lazy`` mode, the scans are repaired chunk-wise, without converting them
+    or loading memory-mapped scans into memory.
+
+    Returns
+    -------
+    csm, repaired_scan_points
+        The coordinate system manager and the number of repaired points per scan.
+        The latter is empty, if the file contains no scans.
+
+    """
+    if profiler is None:
+        profiler = StageProfiler(enabled=False)
+    with profiler.stage("csm: load"):
+        inputs = read_csm_inputs(file)
+    return _prepare_csm(**inputs, profiler=profiler, lazy=lazy)
+
+
+def read_csm_inputs(file: WeldxFile) -> dict:
+    """Read the objects of a single pass weld file needed by `prepare_csm`.
+
+    Weldx files are not thread-safe, so the file is only read by this function, while
+    the remaining preparation may run in another thread.
+    """
+    workpiece = file["workpiece"]["geometry"]
+    csm: CoordinateSystemManager = file["coordinate_systems"]
+    try:
+        scans = [csm.get_data(f"scan_{i}") for i in range(0, 2)]
+    except KeyError:
+        scans = []
+    return dict(
+        csm=csm,
+        scans=scans,
+        groove=workpiece["groove_shape"],
+        seam_length=workpiece["seam_length"],
+        welding_wire_diameter=file["process"]["welding_wire"]["diameter"].m,
+    )
+
+
+def _prepare_csm(
+    csm: CoordinateSystemManager,
+    scans,
+    groove,
+    seam_length,
+    welding_wire_diameter,
+    profiler: StageProfiler,
+    lazy: bool = False,
+) -> tuple[CoordinateSystemManager, dict[str, int]]:
+    # clean up scan data (fill up NaNs)
+    with profiler.stage("csm: repair scans") as stage:
+        repaired_scan_points = {f"scan_{i}": _clean_nans_from_spatial_data(scan, lazy) for i, scan in enumerate(scans)}
+        stage.payload(scans)
+
+    # 3D Geometry
+    with profiler.stage("csm: rasterize workpiece") as stage:
+        spatial_data_geo_full = rasterize_workpiece(
+            groove,
+            seam_length,
+            profile_width=Q_(100, "mm"),
+            profile_raster_width=Q_(4, "mm"),
+            trace_raster_width=Q_(60, "mm"),
+        )
+        spatial_data_geo_full.coordinates = spatial_data_geo_full.coordinates.astype("float32")
 
-    positive = coords.sel(c="z") > 0
+        spatial_data_geo_reduced = rasterize_workpiece(
+            groove,
+            seam_length,
+            profile_width=Q_(10, "mm"),
+            profile_raster_width=Q_(4, "mm"),
+            trace_raster_width=Q_(60, "mm"),
+        )
+        stage.payload([spatial_data_geo_full, spatial_data_geo_reduced])
 
-    filtered = coords.where(positive).ffill("n").bfill("n")
+    csm.assign_data(spatial_data_geo_full, "workpiece geometry", "workpiece")
+    csm.assign_data(spatial_data_geo_reduced, "workpiece geometry (reduced)", "workpiece")
 
-    # TODO: ensure we do not manipulate anything with this!
-    data.coordinates = filtered
+    # this name does only exist in KISA (not yet in schema).
+    tcp_cs_name = "TCP" if "TCP" in csm.coordinate_system_names else "tcp_wire"
+    csm.assign_data(
+        to_spatial_data(cylinder(welding_wire_diameter / 2, 20, 16, capped=False)),
+        "welding_wire",
+        tcp_cs_name,
+    )
+    return csm, repaired_scan_points
 
 
 class WidgetEvaluateSinglePassWeld(metaclass_resolver(Tab, WidgetBase)):
-    """Aggregate info of passed file in several tabs."""
+    """Aggregate info of passed file in several tabs.
+
+    The tabs are rendered on demand, when they are selected for the first time.
+    Only the initially selected tab is rendered on construction.
+
+    With ``background`` enabled, the data of the remaining tabs (interpolation, geometry
+    rasterization, NaN cleaning and signal decimation) is prepared in up to
+    ``max_workers`` threads afterwards. A progress bar is shown in each tab
+    until it is prepared, or the error if the preparation failed. The file is read by
+    the calling thread before, as weldx files are not thread-safe, and the widgets
+    itself are always created in the calling thread, when a tab is selected. A tab
+    failing to render shows the error and is rendered again when selected again.
+
+    With ``profile`` enabled, the wall time, peak memory and payload of the data
+    preparation and rendering stages are recorded by ``profiler``, a
+    `weldx_widgets.profiling.StageProfiler`, and shown in an additional "Diagnostics" tab.
+    Pass a `StageProfiler` to record the stages into an existing profiler.
+
+    Files larger than the available memory can be evaluated in ``lazy`` mode. A path
+    passed as ``file``, or the path of a `WeldxFile` read from disk without
+    memory-mapping, is then opened with `open_lazy`, so arrays are memory-mapped and
+    only read as far as needed. The measurements are decimated chunk-wise into coarser
+    pyramids, see `weldx_widgets.visualization.MinMaxPyramid`, and the scans are
+    repaired without converting them, see `prepare_csm`.
+    """
+
+    def __init__(
+        self,
+        file: WeldxFile | str | Path,
+        background: bool = True,
+        max_workers: int = 2,
+        profile: StageProfiler | bool = False,
+        lazy: bool = False,
+    ):
+        if isinstance(file, (str, Path)):
+            file = open_lazy(file) if lazy else WeldxFile(file, mode="r")
+        elif lazy and not file._asdffile_kwargs.get("memmap") and _file_name(file) is not None:
+            file = open_lazy(_file_name(file))
+        self.file = file
+        self.lazy = lazy
+        if not isinstance(profile, StageProfiler):
+            profile = StageProfiler(enabled=bool(profile))
+        self.profiler = profile
+        self._layout = Layout(width="100%", height="800px", min_width="360px")
+        self._scans_available = None
+        self.repaired_scan_points = {}
+        self._prepared = {}
+        self._locks = {key: threading.Lock() for key in ("csm", "measurement_pyramids", "tcp_deviation")}
+        self._progress = {}
+        self._progress_lock = threading.Lock()
+        self._futures = []
+        # the objects read from the file, which are handed to the preparation.
+        self._readers = {
+            "csm": lambda: read_csm_inputs(self.file),
+            "measurements": lambda: (list(self.file["measurements"]), _file_name(self.file)),
+        }
+        self._inputs = {}
+
+        renderers = {
+            "ASDF-header": self._render_header,
+            "Process parameters": self._render_process,
+            "Specimen": self._render_specimen,
+            "CSM-Subsystems": self._render_csm_subsystems,
+            "CSM-Design": self._render_csm_design,
+            "CSM-Real": self._render_csm_real,
+            "Measurement chain": self._render_measurement_chain,
+            "Measurements": self._render_measurements,
+            "Plots": self._render_plots,
+        }
+        if self.profiler:
+            renderers["Diagnostics"] = self._render_diagnostics
+        self._renderers = renderers
+        # data preparation, which is safe to run outside the main thread once its inputs are read.
+        self._preparers = {
+            "CSM-Subsystems": ("csm", lambda: self.csm),
+            "CSM-Design": ("csm", lambda: self.csm),
+            "CSM-Real": ("csm", lambda: self.csm),
+            "Measurements": ("measurements", lambda: self.measurement_pyramids),
+            "Plots": ("csm", lambda: self.tcp_deviation),
+        }
+        self._rendered = set()
+        tabs = {key: Output(layout=self._layout) for key in renderers}
+
+        super().__init__(children=tuple(tabs.values()))
+        for i, key in enumerate(tabs.keys()):
+            self.set_title(i, key)
+        self.tabs = tabs
+
+        self.observe(self._on_tab_selected, names="selected_index")
+        self._on_tab_selected(dict(new=self.selected_index))
+
+        if background:
+            self._prepare_in_background(max_workers)
+
+    def _prepare_in_background(self, max_workers):
+        pending = [key for key in self._preparers if key not in self._rendered]
+        if not pending:
+            return
+        for key in pending:
+            with self.tabs[key]:
+                self._progress[key] = tqdm(total=1, desc=f"Preparing {key}", leave=False)
+        for name in {self._preparers[key][0] for key in pending}:
+            self._input(name)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="weldx_widgets_eval")
+        for key in pending:
+            future = executor.submit(self._preparers[key][1])
+            future.add_done_callback(functools.partial(self._on_prepared, key))
+            self._futures.append(future)
+        # already submitted tasks are finished, the workers exit afterwards.
+        executor.shutdown(wait=False)
+
+    def _on_prepared(self, key, future):
+        with self._progress_lock:
+            progress = self._progress.get(key)
+            if progress is None:  # the tab has been rendered meanwhile.
+                return
+            error = future.exception()
+            if error is None:
+                progress.update(1)
+                return
+            progress.close()
+        # the error is raised again, when the tab is rendered.
+        self.tabs[key].append_stderr(f"Preparing {key} failed: {error!r}\n")
+
+    def _input(self, name):
+        """Return the objects read from the file for the preparation of ``name``."""
+        if name not in self._inputs:
+            self._inputs[name] = self._readers[name]()
+        return self._inputs[name]
+
+    def _cached(self, name, func):
+        """Compute and keep the value of ``func`` once, even if requested from several threads."""
+        with self._locks[name]:
+            if name not in self._prepared:
+                with self.profiler.stage(f"prepare: {name}"):
+                    self._prepared[name] = func()
+            return self._prepared[name]
+
+    def _on_tab_selected(self, change):
+        index = change["new"]
+        if index is not None:
+            self.render_tab(list(self.tabs)[index])
+
+    def render_tab(self, key: str):
+        """Render the tab of the given name, unless it has already been rendered."""
+        if key in self._rendered:
+            return
+        out = self.tabs[key]
+        with self._progress_lock:
+            progress = self._progress.pop(key, None)
+        if progress is not None:
+            progress.close()
+        out.clear_output()
+        try:
+            with self.profiler.stage(f"render: {key}"), figure_registry.track(self):
+                self._renderers[key](out)
+        except Exception:
+            out.append_stderr(traceback.format_exc())
+            raise
+        self._rendered.add(key)
+
+    @property
+    def groove(self):
+        """Return the groove shape of the workpiece."""
+        return self.file["workpiece"]["geometry"]["groove_shape"]
+
+    @property
+    def seam_length(self):
+        """Return the seam length of the workpiece."""
+        return self.file["workpiece"]["geometry"]["seam_length"]
+
+    @property
+    def csm(self) -> CoordinateSystemManager:
+        """Return the coordinate systems of the file with geometry and scan data prepared.
+
+        The preparation is done once, when first needed by one of the tabs.
+        """
+        return self._cached("csm", self._prepare_csm)
+
+    @property
+    def measurement_pyramids(self):
+        """Return the decimation pyramids of the measurement signals."""
+        return self._cached(
+            "measurement_pyramids",
+            lambda: measurement_pyramids(
+                self._input("measurements")[0],
+                default_pyramid_cache(first_level=_LAZY_FIRST_LEVEL if self.lazy else 1),
+                self._input("measurements")[1],
+            ),
+        )
 
-    def __init__(self, file: WeldxFile):
-        layout = Layout(width="100%", height="800px", min_width="360px")
+    @property
+    def tcp_deviation(self) -> TCPDeviation | None:
+        """Return the deviation of the "TCP" from the "TCP design" in the workpiece system.
 
-        def make_output():
-            out = Output(layout=layout)
-            return out
+        Returns `None`, if there is no design TCP in the file.
+        """
+        return self._cached("tcp_deviation", lambda: self._tcp_deviation(self.csm))
 
-        tabs = defaultdict(make_output)
+    def _prepare_csm(self) -> CoordinateSystemManager:
+        with self.profiler.stage("csm: load"):
+            inputs = self._input("csm")
+        csm, self.repaired_scan_points = _prepare_csm(**inputs, profiler=self.profiler, lazy=self.lazy)
+        self._scans_available = bool(self.repaired_scan_points)
+        return csm
 
-        with tabs["ASDF-header"]:
-            display(file.header(False))
+    def _render_header(self, out):
+        with out:
+            display(WidgetHeaderBrowser.from_file(self.file))
 
+    def _render_process(self, out):
         # start and end time of experiment
-        t = (file["TCP"].time[[0, -1]]).as_timedelta()
+        t = (self.file["TCP"].time[[0, -1]]).as_timedelta()
 
-        WidgetProcessInfo(file["process"]["welding_process"], t, out=tabs["Process parameters"])
+        WidgetProcessInfo(self.file["process"]["welding_process"], t, out=out)
 
-        groove = file["workpiece"]["geometry"]["groove_shape"]
-        with tabs["Specimen"]:
+    def _render_specimen(self, out):
+        file = self.file
+        with out:
             print("Material")  # noqa: T201
             print(file["workpiece"]["base_metal"]["common_name"])  # noqa: T201
             print(file["workpiece"]["base_metal"]["standard"])  # noqa: T201
 
-            groove.plot()
+            self.groove.plot()
             plt.show()
 
-            seam_length = file["workpiece"]["geometry"]["seam_length"]
-            print("Seam length:", seam_length)  # noqa: T201
-
-        # 3D Geometry
-        geometry = self._create_geometry(groove, seam_length, Q_(10, "mm"))
-        # #with tabs["Workpiece"]:
-        #     display(geometry.plot(profile_raster_width=Q_(4, "mm"),
-        #                           trace_raster_width=Q_(40, "mm")))
-
-        # Add geometry data to CSM
-        csm: CoordinateSystemManager = file["coordinate_systems"]
+            print("Seam length:", self.seam_length)  # noqa: T201
 
-        # clean up scan data (fill up NaNs)
-        scans_available = True
-        try:
-            foo = [_clean_nans_from_spatial_data(csm.get_data(f"scan_{i}")) for i in range(0, 2)]
-            assert len(foo) == 2
-            # assert csm.get_data("scan_1").coordinates.
-        except KeyError:
-            scans_available = False
-
-        geometry_full_width = self._create_geometry(groove, seam_length, Q_(100, "mm"))
-        spatial_data_geo_full = geometry_full_width.spatial_data(
-            profile_raster_width=Q_(4, "mm"), trace_raster_width=Q_(60, "mm")
-        )
-        spatial_data_geo_full.coordinates = spatial_data_geo_full.coordinates.astype("float32")
-
-        spatial_data_geo_reduced = geometry.spatial_data(
-            profile_raster_width=Q_(4, "mm"), trace_raster_width=Q_(60, "mm")
-        )
-
-        csm.assign_data(spatial_data_geo_full, "workpiece geometry", "workpiece")
-        csm.assign_data(spatial_data_geo_reduced, "workpiece geometry (reduced)", "workpiece")
-
-        with tabs["CSM-Subsystems"]:
+    def _render_csm_subsystems(self, out):
+        csm = self.csm
+        with out:
             csm.plot_graph()
             plt.show()
             self._show_csm_subsystems(csm)
 
-        with tabs["CSM-Design"]:
-            plt_csm_design = csm.plot(
+    def _render_csm_design(self, out):
+        csm = self.csm
+        with out:
+            plt_csm_design = CoordinateSystemManagerVisualizerK3D(
+                csm,
                 reference_system="workpiece",
                 coordinate_systems=csm.coordinate_system_names,
                 data_sets=["workpiece geometry (reduced)"],
@@ -163,57 +489,64 @@ class WidgetEvaluateSinglePassWeld(metaclass_resolver(Tab, WidgetBase)):
                 show_wireframe=True,
                 show_data_labels=False,
                 show_vectors=False,
-                backend="k3d",
+                profiler=self.profiler,
             )
-            plt_csm_design.plot.layout = layout
+            plt_csm_design.plot.layout = self._layout
             plt_csm_design.plot.camera_reset()
             display(plt_csm_design)
             plt_csm_design.plot.camera_reset()
 
-        welding_wire_diameter = file["process"]["welding_wire"]["diameter"].m
-
-        # this name does only exist in KISA (not yet in schema).
-        tcp_cs_name = "TCP" if "TCP" in csm.coordinate_system_names else "tcp_wire"
-        csm.assign_data(
-            self._welding_wire_geo_data(welding_wire_diameter / 2, 20, 16),
-            "welding_wire",
-            tcp_cs_name,
-        )
-
+    def _render_csm_real(self, out):
+        csm = self.csm
         data_sets = ["welding_wire"]
-        if scans_available:
+        if self._scans_available:
             data_sets.append("scan_0")
-        with tabs["CSM-Real"]:
-            plt_real = csm.plot(
+        with out:
+            plt_real = CoordinateSystemManagerVisualizerK3D(
+                csm,
                 reference_system="workpiece",
                 coordinate_systems=csm.coordinate_system_names,
                 data_sets=data_sets,
                 colors=cs_colors,
                 show_data_labels=False,
-                backend="k3d",
+                show_wireframe=False,
+                profiler=self.profiler,
             )
             # plt_real.plot.width="100%"
             display(plt_real)
             plt_real.plot.render()
 
-        # tcp = csm.get_cs("TCP design")
-        # with self:
-        #    print(tcp)
-
-        measurements = file["measurements"]
+    def _render_measurement_chain(self, out):
         # TODO: compute W on the fly and attach it to measurements?
-        WidgetMeasurementChain(measurements, out=tabs["Measurement chain"])
-        WidgetMeasurement(measurements, out=tabs["Measurements"])
+        WidgetMeasurementChain(self.file["measurements"], out=out)
+
+    def _render_measurements(self, out):
+        WidgetMeasurement(self.file["measurements"], out=out, pyramids=self.measurement_pyramids)
 
-        with tabs["Plots"]:
-            tabs["Plots"].clear_output()
-            self._compare_design_tcp(csm)
+    def _render_plots(self, out):
+        tcp_deviation = self.tcp_deviation
+        with out:
+            out.clear_output()
+            if tcp_deviation is not None:
+                self._plot_tcp_deviation(tcp_deviation)
             plt.show()
+            if tcp_deviation is not None:
+                display(tcp_deviation.statistics())
 
-        super().__init__(children=tuple(tabs.values()))
-        for i, key in enumerate(tabs.keys()):
-            self.set_title(i, key)
-        self.tabs = tabs
+    def _render_diagnostics(self, out):
+        table = Output()
+
+        def show(_=None):
+            table.clear_output()
+            with table:
+                display(pd.DataFrame.from_dict(self.profiler.as_dict(), orient="index"))
+                display(self.profiler.to_dataframe())
+
+        refresh = Button(description="Refresh")
+        refresh.on_click(show)
+        show()
+        with out:
+            display(VBox([refresh, table]))
 
     @staticmethod
     def _show_csm_subsystems(csm):
@@ -227,57 +560,35 @@ class WidgetEvaluateSinglePassWeld(metaclass_resolver(Tab, WidgetBase)):
 
     @staticmethod
     def _compare_design_tcp(csm):
+        tcp_deviation = WidgetEvaluateSinglePassWeld._tcp_deviation(csm)
+        if tcp_deviation is not None:
+            WidgetEvaluateSinglePassWeld._plot_tcp_deviation(tcp_deviation)
+
+    @staticmethod
+    def _tcp_deviation(csm) -> TCPDeviation | None:
         # TCP design vs TCP
         if "TCP design" not in csm.coordinate_system_names:
-            return
-        csm_interp = csm.interp_time(csm.time_union())
-        tcp_design_coords = csm_interp.get_cs("TCP design", "workpiece").coordinates
-        tcp_coords = csm_interp.get_cs("TCP", "workpiece").coordinates
+            return None
+        return compare_tcp(csm, "TCP design", "TCP", "workpiece")
 
-        tcp_diff = tcp_design_coords - tcp_coords
-        time = csm_interp.time_union()
-        time = weldx.Time(time - time[0]).as_quantity()
+    @staticmethod
+    def _plot_tcp_deviation(tcp_deviation: TCPDeviation):
+        time, tcp_diff = tcp_deviation.time, tcp_deviation.deviation
+        unit = tcp_deviation.unit
 
         # difference in welding speed
         fig, ax = plt.subplots(1, 2)
-        ax[0].plot(time.m, tcp_diff.data[:, 0])
+        ax[0].plot(time, tcp_diff[:, 0])
         ax[0].set_title("Difference in welding speed")
         ax[0].set_xlabel("time in s")
-        ax[0].set_ylabel("diff in mm")
+        ax[0].set_ylabel(f"diff in {unit}")
 
         # diffs depend on how well the user frame matches
         ax[1].set_title("User frame deviation")
-        ax[1].plot(time.m, tcp_diff.data[:, 1], label="y")
-        ax[1].plot(time.m, tcp_diff.data[:, 2], label="z")
+        ax[1].plot(time, tcp_diff[:, 1], label="y")
+        ax[1].plot(time, tcp_diff[:, 2], label="z")
         ax[1].legend()
 
         ax[1].set_xlabel("time in s")
-        ax[1].set_ylabel("diff in mm")
-
-    @staticmethod
-    def _welding_wire_geo_data(radius, length, cross_section_resolution=8):
-        import numpy as np
-
-        points = []
-        triangles = []
-        for i in range(cross_section_resolution):
-            angle = i / cross_section_resolution * np.pi * 2
-            x = np.cos(angle) * radius
-            y = np.sin(angle) * radius
-            points.append([x, y, 0])
-            points.append([x, y, length])
-
-            idx = 2 * i
-            triangles.append([idx, idx + 1, idx + 3])
-            triangles.append([idx, idx + 3, idx + 2])
-
-        triangles[-2][2] = 1
-        triangles[-1][1] = 1
-        triangles[-1][2] = 0
-
-        return SpatialData(Q_(points, "mm").astype("float32"), np.array(triangles, dtype="uint32"))
-
-    @staticmethod
-    def _create_geometry(groove, seam_length, width):
-        trace = Trace(LinearHorizontalTraceSegment(seam_length))
-        return Geometry(groove.to_profile(width_default=width), trace)
+        ax[1].set_ylabel(f"diff in {unit}")
+        return fig
@@ -1,13 +1,17 @@
 """Factory for commonly used widget elements."""
 
 import contextlib
+import functools
+import re
 
 import numpy as np
+import pint
 from ipywidgets import HTML, BoundedFloatText, Label, Layout, Text
-from traitlets import All, HasTraits
+from ipywidgets.widgets.widget_string import TextStyle
+from traitlets import All, HasTraits, validate
 
 from weldx import Q_, TimeSeries
-from weldx_widgets.widget_base import WidgetMyHBox
+from weldx_widgets.widget_base import WidgetBase, WidgetMyHBox, metaclass_resolver
 
 plot_layout = Layout(width="60%", height="550px")
 button_layout = Layout(
@@ -19,6 +23,12 @@ textbox_layout = Layout(width="65px", height="30px")  # used for units
 description_layout = Layout(width="35%", height="30px")
 
 layout_generic_output = Layout(width="50%", height="300px")
+# the style is shared by all quantity widgets, so they do not create a style model each. The layout is
+# copied per widget, as it holds the visibility (see WidgetBase.set_visible).
+quantity_layout = Layout(width="auto", height="30px")
+quantity_style = TextStyle(description_width="150px")
+
+_QUANTITY_PATTERN = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*")
 
 
 def copy_layout(layout):
@@ -136,6 +146,202 @@ class WidgetFloatWithUnit(WidgetMyHBox):
         """Wrap the quantity as weldx.TimeSeries."""
         return TimeSeries(self.quantity)
 
+    def to_snapshot(self) -> str:
+        """Return value and unit as text like "5 mm", the value of a `WidgetQuantity`."""
+        return _format_quantity(self.float_value, self._unit.value)
+
+    def from_snapshot(self, snapshot: str):
+        """Restore value and unit from a text like "5 mm"."""
+        magnitude, unit = _split_quantity(snapshot)
+        self.float_value = magnitude
+        if unit:
+            self._unit.value = unit
+
+
+@functools.lru_cache(maxsize=256)
+def parse_unit(unit: str) -> pint.Unit:
+    """Return the unit of the given string, parsing every distinct string only once."""
+    return Q_(1, unit).units
+
+
+def _split_quantity(text: str) -> tuple[float, str]:
+    match = _QUANTITY_PATTERN.fullmatch(text)
+    if match is None:
+        raise ValueError(f"{text!r} is not a number followed by a unit.")
+    magnitude, unit = match.groups()
+    return float(magnitude), unit
+
+
+def parse_quantity(text: str) -> tuple[float, pint.Unit]:
+    """Split a text like ``"5 mm"`` or ``"1.2e-3m/s"`` into its magnitude and unit.
+
+    A number without unit is dimensionless. Raises a `ValueError`, if the text does not
+    start with a number or the unit is unknown.
+    """
+    magnitude, unit = _split_quantity(text)
+    try:
+        return magnitude, parse_unit(unit)
+    except (pint.errors.PintError, AttributeError, TypeError) as e:
+        raise ValueError(f"unknown unit {unit!r}") from e
+
+
+class _QuantityPartObserver:
+    """Call ``handler`` for changes of the text, which change the magnitude or unit."""
+
+    __slots__ = ("handler", "index")
+
+    def __init__(self, handler, index: int):
+        self.handler = handler
+        self.index = index  # 0: magnitude, 1: unit.
+
+    def __call__(self, change):
+        if change.get("name") == "value" and change.get("type") == "change":
+            try:
+                if parse_quantity(change["old"])[self.index] == parse_quantity(change["new"])[self.index]:
+                    return None
+            except ValueError:
+                pass
+        return self.handler(change)
+
+    # compare equal to the handler, so it can be passed to unobserve.
+    def __eq__(self, other):
+        if isinstance(other, _QuantityPartObserver):
+            return self.handler == other.handler and self.index == other.index
+        return self.handler == other
+
+    def __hash__(self):
+        return hash(self.handler)
+
+
+def _format_quantity(magnitude: float, unit) -> str:
+    magnitude = float(magnitude)
+    number = str(int(magnitude)) if magnitude.is_integer() and abs(magnitude) < 1e15 else repr(magnitude)
+    unit = f"{unit:~}" if isinstance(unit, pint.Unit) else str(unit)
+    return f"{number} {unit}" if unit else number
+
+
+class WidgetQuantity(metaclass_resolver(Text, WidgetBase)):
+    """Compact widget of a float with unit, entered as text like "5 mm" into one field.
+
+    It can be used in place of `WidgetFloatWithUnit`, but needs a single widget model
+    instead of eight. The unit of the text is parsed once per distinct unit string.
+    A number entered without unit keeps the current unit. Invalid input and units of
+    another dimension are rejected and values are clipped to ``min`` and ``max``, which
+    is ``2**32`` like the bound of `WidgetFloatWithUnit`. The ``unit`` and ``quantity``
+    setters may change the dimension.
+    Observers of the value or unit are called with the changed text, if the magnitude
+    or unit has changed respectively.
+    """
+
+    _any_dimension = False
+
+    def __init__(self, text, unit, value: float = 0.0, min=0):
+        self.min = min
+        self.max = 2**32
+        super().__init__(
+            value=_format_quantity(value, unit),
+            description=text,
+            placeholder="value unit",
+            continuous_update=False,
+            layout=copy_layout(quantity_layout),
+            style=quantity_style,
+        )
+
+    @validate("value")
+    def _validate_value(self, proposal):
+        value = proposal["value"]
+        try:
+            magnitude, unit = parse_quantity(value)
+        except ValueError:
+            if self.value:
+                return self.value
+            raise
+        if self.value:
+            current = parse_quantity(self.value)[1]
+            if not _split_quantity(value)[1]:
+                unit = current
+                value = _format_quantity(magnitude, unit)
+            elif unit.dimensionality != current.dimensionality and not self._any_dimension:
+                return self.value
+        if self.min is not None and magnitude < self.min:
+            return _format_quantity(self.min, unit)
+        if self.max is not None and magnitude > self.max:
+            return _format_quantity(self.max, unit)
+        return value
+
+    def observe_float_value(self, handler, names="value", type="change"):
+        self.observe(_QuantityPartObserver(handler, 0), names, type)
+
+    observe_float_value.__doc__ = HasTraits.observe.__doc__
+
+    def observe_unit(self, handler, names="value", type="change"):
+        self.observe(_QuantityPartObserver(handler, 1), names, type)
+
+    observe_unit.__doc__ = HasTraits.observe.__doc__
+
+    @contextlib.contextmanager
+    def silence_events(self):
+        """Do not listen to events within this context."""
+        with temporarily_unobserve_all(self):
+            yield
+
+    @property
+    def text(self):
+        """Return description/label value."""
+        return self.description
+
+    @text.setter
+    def text(self, value):
+        self.description = value
+
+    @property
+    def unit(self) -> Q_:
+        """Return unit of this float."""
+        return Q_(1, parse_quantity(self.value)[1])
+
+    @unit.setter
+    def unit(self, value):
+        self._set_value(_format_quantity(self.float_value, Q_(value).units))
+
+    @property
+    def float_value(self) -> float:
+        """Return float value."""
+        return parse_quantity(self.value)[0]
+
+    @float_value.setter
+    def float_value(self, value):
+        self.value = _format_quantity(value, parse_quantity(self.value)[1])
+
+    @property
+    def quantity(self) -> Q_:
+        """Return wrapped quantity of this float."""
+        return Q_(*parse_quantity(self.value))
+
+    @quantity.setter
+    def quantity(self, value):
+        self._set_value(_format_quantity(np.asarray(value.magnitude).item(), value.units))
+
+    def _set_value(self, value: str):
+        """Set the text, allowing units of another dimension."""
+        self._any_dimension = True
+        try:
+            self.value = value
+        finally:
+            self._any_dimension = False
+
+    def as_time_series(self) -> TimeSeries:
+        """Wrap the quantity as weldx.TimeSeries."""
+        return TimeSeries(self.quantity)
+
+
+def make_float_with_unit(text, unit, value: float = 0.0, min=0, compact: bool = False):
+    """Return a `WidgetQuantity` if ``compact``, otherwise a `WidgetFloatWithUnit`.
+
+    Both widgets share the interface to access and observe value and unit.
+    """
+    cls = WidgetQuantity if compact else WidgetFloatWithUnit
+    return cls(text, unit, value=value, min=min)
+
 
 def make_title(text, heading_level=3):
     """Return an HTML formatted heading."""
@@ -5,17 +5,17 @@ from ipywidgets import Button, Dropdown, HBox, IntSlider, Layout, Output
 
 from weldx import Q_
 from weldx.tags.aws import GasComponent, ShieldingGasForProcedure, ShieldingGasType
-from weldx_widgets.widget_base import WidgetMyVBox
+from weldx_widgets.widget_base import WeldxImportExport, WidgetMyVBox
 from weldx_widgets.widget_factory import (
-    WidgetFloatWithUnit,
     button_layout,
     description_layout,
+    make_float_with_unit,
 )
 
 __all__ = ["WidgetShieldingGas"]
 
 
-class WidgetSimpleGasSelection(WidgetMyVBox):
+class WidgetSimpleGasSelection(WidgetMyVBox, WeldxImportExport):
     """Models a simple gas component.
 
     A gas component is a list of gases (element, percentage)
@@ -43,7 +43,7 @@ class WidgetSimpleGasSelection(WidgetMyVBox):
 
     def _clear(self):
         self.children = [self.children[0]]
-        # self.components.clear()
+        self.components.clear()
 
     def _create_gas_dropdown(self, index=0, percentage=100):
         gas_dropdown = Dropdown(
@@ -110,28 +110,40 @@ class WidgetSimpleGasSelection(WidgetMyVBox):
 
     def from_tree(self, tree):
         gc_list: list[GasComponent] = tree["gas_component"]
+        self._set_components([(self._mapping.inverse[gc.gas_chemical_name], gc.gas_percentage.m) for gc in gc_list])
+
+    def _set_components(self, components):
         self._clear()
-        for gc in gc_list:
+        for gas_name, percentage in components:
             # create widget for gas element with percentage, then add to components dict
-            gas_name = gc.gas_chemical_name
-            mapped = self._mapping.inverse[gas_name]
-            index_first_avail = self.gas_list.index(mapped)
-
-            percentage = gc.gas_percentage.m
+            index_first_avail = self.gas_list.index(gas_name)
 
             box = self._create_gas_dropdown(index_first_avail, percentage=percentage)
 
             self.children += (box,)
-            self.components[mapped] = box
+            self.components[gas_name] = box
+
+    def to_snapshot(self) -> dict:
+        """Return gas names and percentages."""
+        return dict(components=[[name, box.children[1].value] for name, box in self.components.items()])
+
+    def from_snapshot(self, snapshot: dict):
+        """Restore gas components from a snapshot."""
+        self._set_components(snapshot["components"])
 
 
-class WidgetShieldingGas(WidgetMyVBox):
-    """Widget to combine flow rate with a gas selection."""
+class WidgetShieldingGas(WidgetMyVBox, WeldxImportExport):
+    """Widget to combine flow rate with a gas selection.
+
+    With ``compact=True``, the flow rate is entered into a `WidgetQuantity` field.
+    """
+
+    snapshot_fields = ("flowrate", "gas_components")
 
     # TODO: this could in principle be used multiple times for all positions
     #  e.g. torch, trailing, backing
-    def __init__(self, position="torch"):
-        self.flowrate = WidgetFloatWithUnit("Flow rate", "l/min", value=20)
+    def __init__(self, position="torch", compact: bool = False):
+        self.flowrate = make_float_with_unit("Flow rate", "l/min", value=20, compact=compact)
         self.gas_components = WidgetSimpleGasSelection()
 
         children = [self.gas_components, self.flowrate]
@@ -1,6 +1,5 @@
 """Widget to edit weldx.GMAW process data."""
 
-from functools import lru_cache
 from typing import Union
 
 from bidict import bidict
@@ -8,14 +7,14 @@ from ipywidgets import Dropdown
 from matplotlib import pylab as plt
 
 from weldx import Q_, GmawProcess, Time, TimeSeries
-from weldx_widgets import WidgetShieldingGas
 from weldx_widgets.generic import WidgetTimeSeries
-from weldx_widgets.widget_base import WeldxImportExport, WidgetMyVBox
+from weldx_widgets.widget_base import WeldxImportExport, WidgetMyVBox, bulk_update
 from weldx_widgets.widget_factory import (
-    WidgetFloatWithUnit,
     WidgetLabeledTextInput,
+    make_float_with_unit,
     make_title,
 )
+from weldx_widgets.widget_gas import WidgetShieldingGas
 
 _DEFAULT_FIGWIDTH = 12
 
@@ -52,16 +51,18 @@ def from_scalar_timeseries_to_q(ts: TimeSeries) -> Q_:
     return Q_(ts.data, ts.units)
 
 
-class BaseProcess(WidgetMyVBox):
+class BaseProcess(WidgetMyVBox, WeldxImportExport):
     """Widget for base process."""
 
-    def __init__(self, tag: str, meta=None):
+    snapshot_fields = ("manufacturer", "power_source", "wire_feedrate", "tag", "meta")
+
+    def __init__(self, tag: str, meta=None, compact: bool = False):
         self.tag = tag
         self.meta = meta
 
         self.manufacturer = WidgetLabeledTextInput("Manufacturer", "Fronius")
         self.power_source = WidgetLabeledTextInput("Power source", "TPS 500i")
-        self.wire_feedrate = WidgetFloatWithUnit(text="Wire feed rate", value=10, min=0, unit="m/min")
+        self.wire_feedrate = make_float_with_unit(text="Wire feed rate", value=10, min=0, unit="m/min", compact=compact)
         children = [
             self.manufacturer,
             self.power_source,
@@ -91,22 +92,24 @@ class BaseProcess(WidgetMyVBox):
         self.meta = process.meta
 
 
-class ProcessPulsed(WidgetMyVBox):
+class ProcessPulsed(WidgetMyVBox, WeldxImportExport):
     """Widget for pulsed processes."""
 
-    def __init__(self, kind="UI"):
-        self.pulse_duration = WidgetFloatWithUnit("Pulse duration", value=5.0, unit="ms")
-        self.pulse_frequency = WidgetFloatWithUnit("Pulse frequency", value=100.0, unit="Hz")
-        self.base_current = WidgetFloatWithUnit("Base current", value=60.0, unit="A")
+    snapshot_fields = ("base_process", "pulse_duration", "pulse_frequency", "base_current", "pulsed_dim")
+
+    def __init__(self, kind="UI", compact: bool = False):
+        self.pulse_duration = make_float_with_unit("Pulse duration", value=5.0, unit="ms", compact=compact)
+        self.pulse_frequency = make_float_with_unit("Pulse frequency", value=100.0, unit="Hz", compact=compact)
+        self.base_current = make_float_with_unit("Base current", value=60.0, unit="A", compact=compact)
 
         if kind == "UI":
-            self.pulsed_dim = WidgetFloatWithUnit("Pulse voltage", "V", 40)
+            self.pulsed_dim = make_float_with_unit("Pulse voltage", "V", 40, compact=compact)
         elif kind == "II":
-            self.pulsed_dim = WidgetFloatWithUnit("Pulse current", "A", 300)
+            self.pulsed_dim = make_float_with_unit("Pulse current", "A", 300, compact=compact)
         else:
             raise ValueError(f"unknown kind: {kind}")
         self.kind = kind
-        self.base_process = BaseProcess("CLOOS/pulse", {"modulation": self.kind})
+        self.base_process = BaseProcess("CLOOS/pulse", {"modulation": self.kind}, compact=compact)
 
         if self.kind == "UI":
             desc = "voltage/current"
@@ -160,14 +163,16 @@ class ProcessPulsed(WidgetMyVBox):
             self.pulsed_dim.quantity = from_scalar_timeseries_to_q(params["pulse_current"])
 
 
-class ProcessSpray(WidgetMyVBox):
+class ProcessSpray(WidgetMyVBox, WeldxImportExport):
     """Widget for spray process."""
 
-    def __init__(self):
-        self.base_process = BaseProcess("CLOOS/spray_arc")
+    snapshot_fields = ("base_process", "voltage", "impedance", "characteristic")
+
+    def __init__(self, compact: bool = False):
+        self.base_process = BaseProcess("CLOOS/spray_arc", compact=compact)
         self.voltage = WidgetTimeSeries(base_data="40.0, 20.0", base_unit="V", time_data="0.0, 10.0", time_unit="s")
-        self.impedance = WidgetFloatWithUnit(text="Impedance", value=10, unit="percent")
-        self.characteristic = WidgetFloatWithUnit("Characteristic", value=5, unit="V/A")
+        self.impedance = make_float_with_unit(text="Impedance", value=10, unit="percent", compact=compact)
+        self.characteristic = make_float_with_unit("Characteristic", value=5, unit="V/A", compact=compact)
 
         super().__init__(
             children=[
@@ -206,13 +211,14 @@ class ProcessSpray(WidgetMyVBox):
         self.characteristic.quantity = from_scalar_timeseries_to_q(parameters["characteristic"])
 
 
-class WidgetWire(WidgetMyVBox):
+class WidgetWire(WidgetMyVBox, WeldxImportExport):
     """Widget for welding wire."""
 
     heading_level = 4
+    snapshot_fields = ("diameter", "wire_class", "metadata")
 
-    def __init__(self):
-        self.diameter = WidgetFloatWithUnit("Diameter", unit="mm", min=0, value=1.2)
+    def __init__(self, compact: bool = False):
+        self.diameter = make_float_with_unit("Diameter", unit="mm", min=0, value=1.2, compact=compact)
         self.wire_class = WidgetLabeledTextInput("Class", "G 42 2 C/M G4Si1")
 
         # TODO: consider a tree like editing widget for metadata.
@@ -243,7 +249,12 @@ class WidgetWire(WidgetMyVBox):
 
 
 class WidgetGMAW(WidgetMyVBox, WeldxImportExport):
-    """Widget to handle gas metal arc welding process parameters."""
+    """Widget to handle gas metal arc welding process parameters.
+
+    With ``compact=True``, values with units are entered into `WidgetQuantity` fields.
+    """
+
+    snapshot_fields = ("process_type", "welding_process", "gas", "welding_wire")
 
     def _set_gui_mapping(self):
         self.translate = bidict(
@@ -255,8 +266,9 @@ class WidgetGMAW(WidgetMyVBox, WeldxImportExport):
             }
         )
 
-    def __init__(self, process_type="spray"):
+    def __init__(self, process_type="spray", compact: bool = False):
         self._set_gui_mapping()  # set up translation mapping.
+        self.compact = compact
         index = list(self.translate.values()).index(process_type)
         self.process_type = Dropdown(
             options=list(self.translate.keys()),
@@ -264,9 +276,10 @@ class WidgetGMAW(WidgetMyVBox, WeldxImportExport):
             description="Process type",
         )
         self.process_type.observe(self._create_process_widgets, names="value")
-        self.gas = WidgetShieldingGas()
+        self._process_widgets = {}
+        self.gas = WidgetShieldingGas(compact=compact)
         self._welding_process = WidgetMyVBox()
-        self.welding_wire = WidgetWire()
+        self.welding_wire = WidgetWire(compact=compact)
 
         children = [
             make_title("GMAW process parameters"),
@@ -286,7 +299,7 @@ class WidgetGMAW(WidgetMyVBox, WeldxImportExport):
     def _create_process_widgets(self, change):
         new = change["new"]
         arg = self.translate[new]
-        box = WidgetGMAW._cached_process_widgets(arg)
+        box = self._cached_process_widgets(arg)
         self._welding_process.children = (box,)
 
     @property
@@ -294,13 +307,15 @@ class WidgetGMAW(WidgetMyVBox, WeldxImportExport):
         """Return welding process widget."""
         return self._welding_process.children[0]
 
-    @staticmethod
-    @lru_cache(None)
-    def _cached_process_widgets(process):
-        if process == "spray":
-            return ProcessSpray()
-
-        return ProcessPulsed(kind=process)
+    def _cached_process_widgets(self, process):
+        # keep the state of process widgets when switching the process type.
+        if process not in self._process_widgets:
+            if process == "spray":
+                widget = ProcessSpray(compact=self.compact)
+            else:
+                widget = ProcessPulsed(kind=process, compact=self.compact)
+            self._process_widgets[process] = widget
+        return self._process_widgets[process]
 
     def from_tree(self, tree: dict):
         """Fill widget from tree."""
@@ -315,11 +330,21 @@ class WidgetGMAW(WidgetMyVBox, WeldxImportExport):
             process_type = "Spray"
         else:
             raise NotImplementedError(f"unknown process type: {welding_process.base_process}")
-        self.process_type.value = process_type
-
-        self.welding_process.from_tree(process)
-        self.gas.from_tree(process)
-        self.welding_wire.from_tree(process)
+        with bulk_update(self):
+            self.process_type.value = process_type
+            # the observer of the process type is suspended during the bulk update.
+            self._create_process_widgets(dict(new=process_type))
+
+            self.welding_process.from_tree(process)
+            self.gas.from_tree(process)
+            self.welding_wire.from_tree(process)
+
+    def from_snapshot(self, snapshot: dict):
+        """Restore the widget from a snapshot, including the process type."""
+        with bulk_update(self):
+            self.process_type.value = snapshot["process_type"]
+            self._create_process_widgets(dict(new=snapshot["process_type"]))
+            super().from_snapshot(snapshot)
 
     def to_tree(self):
         """Return GMAW process parameters."""
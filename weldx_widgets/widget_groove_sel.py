@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import contextlib
 import re
 import tempfile
 from typing import TYPE_CHECKING, Callable, Union
@@ -10,9 +9,8 @@ from typing import TYPE_CHECKING, Callable, Union
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from IPython import get_ipython
 from IPython.display import display
-from ipywidgets import HTML, Button, Dropdown, HBox, Label, Layout, Output, Tab
+from ipywidgets import HTML, Button, Dropdown, HBox, Image, Label, Layout, Output, Tab
 
 import weldx
 from weldx import Geometry, SpatialData
@@ -23,12 +21,21 @@ from weldx.welding.groove.iso_9692_1 import (
     _groove_type_to_name,
     get_groove,
 )
+from weldx_widgets.figures import ThumbnailCache, enable_widget_backend, figure_registry
 from weldx_widgets.generic import download_button
-from weldx_widgets.widget_base import WeldxImportExport, WidgetMyHBox, WidgetMyVBox
+from weldx_widgets.geometry_cache import rasterize_workpiece
+from weldx_widgets.widget_base import (
+    WeldxImportExport,
+    WidgetMyHBox,
+    WidgetMyVBox,
+    _field_state,
+    _set_field_state,
+    bulk_update,
+)
 from weldx_widgets.widget_factory import (
-    WidgetFloatWithUnit,
     WidgetLabeledTextInput,
     description_layout,
+    make_float_with_unit,
     make_title,
     textbox_layout,
 )
@@ -67,7 +74,7 @@ class WidgetCADExport(WidgetMyVBox):
 RuntimeWarning: invalid value encountered in true_divide
     """
 
-    def __init__(self):
+    def __init__(self, compact: bool = False):
         title = make_title("Export geometry to CAD file [optional]", heading_level=4)
 
         # if the format changes, we have to update the file_pattern mask
@@ -88,17 +95,19 @@ RuntimeWarning: invalid value encountered in true_divide
         # program directly to his/her computer.
         self._html_dl_button = HTML()
 
-        self.profile_raster_width = WidgetFloatWithUnit(
+        self.profile_raster_width = make_float_with_unit(
             "Profile raster width",
             value=2,
             unit="mm",
             # tooltip="Target distance between the individual points of a profile",
+            compact=compact,
         )
-        self.trace_raster_width = WidgetFloatWithUnit(
+        self.trace_raster_width = make_float_with_unit(
             "Trace raster width",
             value=30,
             unit="mm",
             # tooltip="Target distance between the individual profiles on the trace",
+            compact=compact,
         )
 
         children = [
@@ -149,13 +158,15 @@ RuntimeWarning: invalid value encountered in true_divide
             )
 
 
-class WidgetMetal(WidgetMyVBox):
+class WidgetMetal(WidgetMyVBox, WeldxImportExport):
     """Widget to select metal type and parameters."""
 
-    def __init__(self):
+    snapshot_fields = ("common_name", "standard", "thickness")
+
+    def __init__(self, compact: bool = False):
         self.common_name = WidgetLabeledTextInput("Common name", "S355J2+N")
         self.standard = WidgetLabeledTextInput("Standard", "DIN EN 10225-2:2011")
-        self.thickness = WidgetFloatWithUnit("Thickness", value=30, unit="mm")
+        self.thickness = make_float_with_unit("Thickness", value=30, unit="mm", compact=compact)
         children = [
             make_title("Base metal", heading_level=4),
             self.common_name,
@@ -196,23 +207,42 @@ def get_ff_grove_code_numbers():
     ]
 
 
+groove_thumbnails = ThumbnailCache()
+
+
+def groove_thumbnail(groove: IsoBaseGroove) -> bytes:
+    """Return a PNG of the groove profile, cached by groove type and parameters."""
+    key = (type(groove).__name__, str(getattr(groove, "code_number", None)), *sorted(groove.param_strings()))
+    return groove_thumbnails.get(key, lambda ax: groove.plot(line_style="-", ax=ax))
+
+
 # TODO: nice group layout for all widgets
 # TODO: reset button parameters (defaults).
 class WidgetGrooveSelection(WidgetMyVBox, WeldxImportExport):
-    """Widget to select groove type."""
+    """Widget to select groove type.
+
+    By default, the groove is plotted into an interactive ipympl figure. Dashboards
+    showing many selectors can pass ``thumbnail=True`` instead, to show the groove as
+    a PNG image, which is cached by the groove parameters (see `groove_thumbnails`)
+    and needs no live figure per selector. With ``compact=True``, each parameter is
+    entered into a single `WidgetQuantity` text field instead of a `WidgetFloatWithUnit`.
+    """
 
-    def __init__(self):
+    def __init__(self, thumbnail: bool = False, compact: bool = False):
+        self.thumbnail = thumbnail
+        self.compact = compact
         self._groove_obj = None
 
         self.out = Output()  # layout=Layout(width="100%"))
-        self.groove_params_dropdowns = None
+        # pool of parameter widgets by parameter name, created on first use.
+        self.groove_params_dropdowns = dict()
+        self._parameter_observers = []
 
         # create figure for groove visualization
         self._create_plot()
 
         self.groove_params = WidgetMyVBox([])
         self.groove_type_dropdown = self._create_groove_dropdown()
-        self._groove_obj_cache = {}  # store ISOBaseGroove objects mapped to type.
 
         self.groove_selection = WidgetMyVBox(
             [
@@ -249,21 +279,19 @@ class WidgetGrooveSelection(WidgetMyVBox, WeldxImportExport):
 
     @groove_obj.setter
     def groove_obj(self, value: IsoBaseGroove):
-        self._groove_obj = value
-
-        self.groove_selection.children[0].value = _groove_type_to_name[self.groove_obj.__class__]
-        # update fields according to data in new groove object.
-        gui_params = self.groove_params_dropdowns
-
-        # inhibit notifications during updating the parameters (or we would call the
-        # _update_plot method for every setting!)
-        with contextlib.ExitStack() as stack:
-            for k, v in self.groove_obj.parameters().items():
-                mapped_k = self._groove_obj._mapping[k]
-                widget: WidgetFloatWithUnit = gui_params[mapped_k]
-                stack.enter_context(widget.silence_events())
-
+        name = _groove_type_to_name[value.__class__]
+        # show the parameter widgets of the groove first, so they are updated in bulk.
+        self._update_params_to_selection(dict(new=name))
+        # update fields according to data in new groove object, but plot only once
+        # afterwards (or we would call the _update_plot method for every setting!)
+        with bulk_update(self, self._plot_groove):
+            self._groove_obj = value
+            self.groove_type_dropdown.value = name
+            for k, v in value.parameters().items():
+                widget = self._parameter_widget(value._mapping[k])
                 widget.quantity = v
+            if "code_number" in value._mapping:
+                self._parameter_widget("code_number").children[1].value = value.code_number
 
     def from_tree(self, tree: dict):
         """Fill widget from tree."""
@@ -273,16 +301,39 @@ class WidgetGrooveSelection(WidgetMyVBox, WeldxImportExport):
         """Return groove parameters."""
         return dict(groove_shape=self.groove_obj)
 
+    def to_snapshot(self) -> dict:
+        """Return the groove type and the values of its parameter widgets."""
+        parameters = {}
+        for child in self.groove_params.children:
+            widget = child.children[1] if child.mapping == "code_number" else child
+            parameters[child.mapping] = _field_state(widget)
+        return dict(groove_type=self.groove_type_dropdown.value, parameters=parameters)
+
+    def from_snapshot(self, snapshot: dict):
+        """Restore groove type and parameters from a snapshot and plot the groove once."""
+        self._update_params_to_selection(dict(new=snapshot["groove_type"]))
+        with bulk_update(self, self._update_plot):
+            self.groove_type_dropdown.value = snapshot["groove_type"]
+            for item, value in snapshot["parameters"].items():
+                widget = self._parameter_widget(item)
+                if item == "code_number":
+                    widget = widget.children[1]
+                _set_field_state(widget, value)
+
     def _create_plot(self):
+        if self.thumbnail:
+            self.fig = self.ax = None
+            self._image = Image(format="png", layout=Layout(width="100%"))
+            self.out = self._image
+            return
+
         # ensure we have the proper matplotlib backend.
-        ip = get_ipython()
-        if ip:
-            ip.run_line_magic("matplotlib", "widget")
+        enable_widget_backend()
 
         # TODO: fig size should match size of self.out see
         #  https://stackoverflow.com/questions/61272384/how-to-resize-matplotlib
         #  -figure-to-match-ipywidgets-output-size-automatically
-        with self.out:
+        with self.out, figure_registry.track(self, replace=True):
             self.fig, self.ax = plt.subplots(1, 1)  # , figsize=(5, 4), dpi=100)
             canvas = self.fig.canvas
             # canvas.toolbar_visible = False
@@ -294,38 +345,48 @@ class WidgetGrooveSelection(WidgetMyVBox, WeldxImportExport):
                 canvas.layout.width = "100%"
             plt.show()
 
-    def _create_groove_dropdown(self):
-        # get all attribute mappings (human-readable names)
-        attrs = {attr for groove in _groove_name_to_type for attr in _groove_name_to_type[groove]._mapping.values()}
+    @staticmethod
+    def _observe_parameter(widget, item, observer: Callable):
+        if item == "code_number":
+            widget.children[1].observe(observer, "value")
+        else:
+            widget.observe_float_value(observer, "value")
 
-        # create dict with hboxes of all attributes
-        self.groove_params_dropdowns = dict()
+    def _parameter_widget(self, item: str):
+        """Return the widget of a groove parameter, creating it when first needed."""
         param_widgets = self.groove_params_dropdowns
-        for item in attrs:
-            if item == "code_number":  # only the case for FFGroove
-                dropdown = Dropdown(
-                    options=get_ff_grove_code_numbers(),
-                    layout=description_layout,
-                )
-                param_widgets[item] = HBox([Label("Code number", layout=description_layout), dropdown])
+        if item in param_widgets:
+            return param_widgets[item]
+
+        if item == "code_number":  # only the case for FFGroove
+            dropdown = Dropdown(
+                options=get_ff_grove_code_numbers(),
+                layout=description_layout,
+            )
+            widget = HBox([Label("Code number", layout=description_layout), dropdown])
+        else:
+            # replace underscores with spaces, first letter uppercase, translate.
+            t = f"{(item[0].upper() + item[1:]).replace('_', ' ')}"
+            matches = re.match("(.*)([0-9]+)", t)
+            if matches:
+                t = matches.group(1)
+                number = matches.group(2)
+                text = f"{t} {number}"
             else:
-                # replace underscores with spaces, first letter uppercase, translate.
-                t = f"{(item[0].upper() + item[1:]).replace('_', ' ')}"
-                matches = re.match("(.*)([0-9]+)", t)
-                if matches:
-                    t = matches.group(1)
-                    number = matches.group(2)
-                    text = f"{t} {number}"
-                else:
-                    text = t
-                if "angle" in item:
-                    param_widgets[item] = WidgetFloatWithUnit(text=text, unit="°", value=45)
-                elif "workpiece_thickness" in item:
-                    param_widgets[item] = WidgetFloatWithUnit(text=text, unit="mm", value=15)
-                else:
-                    param_widgets[item] = WidgetFloatWithUnit(text=text, unit="mm", value=5)
-            param_widgets[item].mapping = item
+                text = t
+            if "angle" in item:
+                widget = make_float_with_unit(text=text, unit="°", value=45, compact=self.compact)
+            elif "workpiece_thickness" in item:
+                widget = make_float_with_unit(text=text, unit="mm", value=15, compact=self.compact)
+            else:
+                widget = make_float_with_unit(text=text, unit="mm", value=5, compact=self.compact)
+        widget.mapping = item
+        for observer in self._parameter_observers:
+            self._observe_parameter(widget, item, observer)
+        param_widgets[item] = widget
+        return widget
 
+    def _create_groove_dropdown(self):
         groove_list = list(_groove_name_to_type.keys())
         margin = 5
         groove_type_dropdown = Dropdown(
@@ -342,33 +403,28 @@ class WidgetGrooveSelection(WidgetMyVBox, WeldxImportExport):
         return groove_type_dropdown
 
     def add_parameter_observer(self, observer: Callable):
-        """Add observers to groove parameters."""
-        for _key, box in self.groove_params_dropdowns.items():
-            box.children[1].observe(observer, "value")
-            # if key != "code_number":
-            #    box.children[2].observe(observer, "value")
+        """Add observers to groove parameters, including those created later."""
+        self._parameter_observers.append(observer)
+        for key, box in self.groove_params_dropdowns.items():
+            self._observe_parameter(box, key, observer)
 
     def _update_plot(self, *args):
         groove_type = self.groove_type_dropdown.value
-        groove_obj = self._groove_obj_cache.get(groove_type, None)
-
         groove_params = dict(groove_type=groove_type)
         for child in self.groove_params.children:
             param_key = child.mapping
             if param_key == "code_number":
                 groove_params[param_key] = child.children[1].value
             else:
-                magnitude = child.children[1].value
-                unit = child.children[2].value
-                groove_params[param_key] = Q_(magnitude, unit)
+                groove_params[param_key] = child.quantity
 
-        if groove_obj is None:
-            self._groove_obj = get_groove(**groove_params)
-            self._groove_obj_cache[groove_type] = groove_obj
-        else:
-            for attr, value in groove_params.items():
-                setattr(groove_obj, attr, value)
-            self.groove_obj = groove_obj
+        self._groove_obj = get_groove(**groove_params)
+        self._plot_groove()
+
+    def _plot_groove(self):
+        if self.thumbnail:
+            self._image.value = groove_thumbnail(self.groove_obj)
+            return
 
         # TODO: re-plot can be avoided (e.g. set_xydata?)
         if self.ax.lines:
@@ -382,30 +438,33 @@ class WidgetGrooveSelection(WidgetMyVBox, WeldxImportExport):
     def _update_params_to_selection(self, change):
         selection = change["new"]
         self.groove_params.children = [
-            slider
-            for key, slider in self.groove_params_dropdowns.items()
-            if key in (_groove_name_to_type[selection]._mapping[x] for x in _groove_name_to_type[selection]._mapping)
+            self._parameter_widget(item) for item in _groove_name_to_type[selection]._mapping.values()
         ]
 
 
-class WidgetGrooveSelectionTCPMovement(WidgetMyVBox):
-    """Widget to combine groove type and tcp movement."""
+class WidgetGrooveSelectionTCPMovement(WidgetMyVBox, WeldxImportExport):
+    """Widget to combine groove type and tcp movement.
+
+    With ``compact=True``, values with units are entered into `WidgetQuantity` fields.
+    """
+
+    snapshot_fields = ("groove_sel", "seam_length", "weld_speed", "tcp_y", "tcp_z", "base_metal")
 
-    def __init__(self):
+    def __init__(self, compact: bool = False):
         self.last_plot: CoordinateSystemManagerVisualizerK3D | None = None
-        self.groove_sel = WidgetGrooveSelection()
+        self.groove_sel = WidgetGrooveSelection(compact=compact)
 
-        self.seam_length = WidgetFloatWithUnit("Seam length", value=300, min=0, unit="mm")
+        self.seam_length = make_float_with_unit("Seam length", value=300, min=0, unit="mm", compact=compact)
         self.seam_length.observe_float_value(self.create_csm_and_plot)
         self.seam_length.observe_unit(self.create_csm_and_plot)
 
-        self.tcp_y = WidgetFloatWithUnit("TCP-y", unit="mm")
-        self.tcp_z = WidgetFloatWithUnit("TCP-z", unit="mm")
+        self.tcp_y = make_float_with_unit("TCP-y", unit="mm", compact=compact)
+        self.tcp_z = make_float_with_unit("TCP-z", unit="mm", compact=compact)
         # TODO: compute weld speed accordingly to chosen groove area!
         # TODO: consider setting it read-only??
-        self.weld_speed = WidgetFloatWithUnit("weld speed", value=6, unit="mm/s")
-        self.base_metal = WidgetMetal()
-        self.geometry_export = WidgetCADExport()
+        self.weld_speed = make_float_with_unit("weld speed", value=6, unit="mm/s", compact=compact)
+        self.base_metal = WidgetMetal(compact=compact)
+        self.geometry_export = WidgetCADExport(compact=compact)
         self.additional_params = (
             make_title("Welding parameters", 4),
             self.seam_length,
@@ -448,9 +507,6 @@ class WidgetGrooveSelectionTCPMovement(WidgetMyVBox):
         trace_segment = weldx.LinearHorizontalTraceSegment(self.seam_length.quantity)
         trace = weldx.Trace(trace_segment)
 
-        # create 3d workpiece geometry from the groove profile and trace objects
-        geometry = weldx.Geometry(self.groove_sel.groove_obj.to_profile(width_default=Q_(5, "mm")), trace)
-
         # rasterize geometry
         profile_raster_width = self.geometry_export.profile_raster_width.quantity
         trace_raster_width = self.geometry_export.trace_raster_width.quantity
@@ -465,8 +521,14 @@ class WidgetGrooveSelectionTCPMovement(WidgetMyVBox):
             lcs=trace.coordinate_system,
         )
 
-        # add the geometry data of the specimen
-        sp_specimen = geometry.spatial_data(profile_raster_width, trace_raster_width)
+        # add the geometry data of the specimen, created from the groove profile and trace
+        sp_specimen = rasterize_workpiece(
+            self.groove_sel.groove_obj,
+            self.seam_length.quantity,
+            Q_(5, "mm"),
+            profile_raster_width,
+            trace_raster_width,
+        )
         sp_specimen.plot(backend="k3d")
         csm.assign_data(
             sp_specimen,
@@ -544,11 +606,20 @@ class WidgetGrooveSelectionTCPMovement(WidgetMyVBox):
         return tree
 
     def from_tree(self, tree: dict):
-        """Set widget groups state from given tree."""
+        """Set widget groups state from given tree.
+
+        The groove and the TCP movement are plotted once, after all parameters are set.
+        """
         self.csm = tree.get("coordinates_design", None)
         workpiece = tree["workpiece"]
         geom = workpiece["geometry"]
 
-        self.seam_length.quantity = geom["seam_length"]
-        self.groove_sel.from_tree(geom)
-        self.base_metal.from_tree(workpiece)
+        with bulk_update(self, self.create_csm_and_plot):
+            self.seam_length.quantity = geom["seam_length"]
+            self.groove_sel.from_tree(geom)
+            self.base_metal.from_tree(workpiece)
+
+    def from_snapshot(self, snapshot: dict):
+        """Restore the parameters from a snapshot and plot groove and TCP movement once."""
+        with bulk_update(self, self.create_csm_and_plot):
+            super().from_snapshot(snapshot)
@@ -0,0 +1,244 @@
+"""Lazily expanded browser of the ASDF header of weldx files."""
+
+from __future__ import annotations
+
+import abc
+import html
+import os
+from collections.abc import Callable, Mapping, Sequence
+
+from ipywidgets import HTML, Button, Layout, VBox
+
+from weldx import WeldxFile
+from weldx_widgets.widget_base import WidgetMyVBox
+from weldx_widgets.widget_factory import button_layout
+
+__all__ = [
+    "WidgetHeaderBrowser",
+    "load_header",
+    "summarize_node",
+]
+
+_NDARRAY_TAG = "core/ndarray-"
+_MAX_VALUE_LENGTH = 80
+
+
+def load_header(file: WeldxFile) -> dict:
+    """Return the YAML tree of a weldx file as stored, without converting any objects.
+
+    The nodes are plain Python types or `asdf.tagged.Tagged` instances carrying their
+    YAML tag. Binary blocks are not read, arrays are only described by their ndarray
+    nodes. Changes to the file, which have not been written yet, are not included.
+    """
+    import asdf.util
+
+    fh = file.file_handle
+    name = getattr(fh, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return asdf.util.load_yaml(name, tagged=True)
+    # e.g. in-memory files, the position of the shared handle is restored.
+    pos = fh.tell()
+    try:
+        fh.seek(0)
+        return asdf.util.load_yaml(fh, tagged=True)
+    finally:
+        fh.seek(pos)
+
+
+def _tag(node) -> str:
+    """Return the tag of a node without the URI prefix, e.g. ``asdf/core/ndarray-1.1.0``."""
+    tag = getattr(node, "_tag", None)
+    if not tag:
+        return ""
+    return tag.rsplit(":", 1)[-1]
+
+
+def _is_ndarray(node) -> bool:
+    return isinstance(node, Mapping) and _NDARRAY_TAG in _tag(node)
+
+
+def _is_expandable(node) -> bool:
+    return isinstance(node, (Mapping, list)) and bool(len(node)) and not _is_ndarray(node)
+
+
+def summarize_node(node) -> str:
+    """Return a one-line description of a header node.
+
+    Arrays are described by their data type, shape and the block (or file) they are
+    stored in, containers by their tag and number of items and scalars by their value.
+    """
+    tag = _tag(node)
+    if _is_ndarray(node):
+        shape = tuple(node.get("shape", ()))
+        summary = f"ndarray {node.get('datatype', '?')} {shape}"
+        source = node.get("source")
+        if isinstance(source, int):
+            return f"{summary}, block {source}"
+        if source is not None:
+            return f"{summary}, external {source}"
+        return f"{summary}, inline"
+
+    prefix = f"<{tag}> " if tag else ""
+    if isinstance(node, Mapping):
+        return f"{prefix}{{{len(node)} keys}}"
+    if isinstance(node, list):
+        return f"{prefix}[{len(node)} items]"
+    value = repr(str(node) if isinstance(node, str) else node)
+    if len(value) > _MAX_VALUE_LENGTH:
+        value = value[: _MAX_VALUE_LENGTH - 3] + "..."
+    return prefix + value
+
+
+def _child_items(node) -> list:
+    if isinstance(node, Mapping):
+        return list(node.items())
+    return list(enumerate(node))
+
+
+class _ChildItems(Sequence):
+    """The keys and values of the children of a node, getting values only when indexed."""
+
+    def __init__(self, keys: Sequence, get: Callable):
+        self._keys = keys
+        self._get = get
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [(key, self._get(key)) for key in self._keys[index]]
+        key = self._keys[index]
+        return key, self._get(key)
+
+
+class _LazyNode(WidgetMyVBox):
+    """A node of a tree, creating the widgets of its children when first expanded.
+
+    Subclasses define how nodes are summarized, if and how they are expanded and
+    optionally render a preview, which is shown above the children.
+    """
+
+    def __init__(self, key, node, page_size: int, expanded: bool = False):
+        self.key = key
+        self.node = node
+        self.page_size = page_size
+        self.expanded = False
+        self.preview = None
+        self._children_box = None
+        self._nodes = []
+        self._items = None
+        self._label = f"{key}: {self.summarize(node)}"
+
+        if self.is_expandable(node):
+            self.button = Button(description=f"▸ {self._label}", tooltip=self.tooltip(node))
+            self.button.layout = button_layout
+            self.button.on_click(self.toggle)
+            children = [self.button]
+        else:
+            self.button = None
+            children = [HTML(f"&nbsp;&nbsp;{html.escape(self._label)}")]
+        super().__init__(children=children)
+        if expanded and self.button is not None:
+            self.toggle()
+
+    @staticmethod
+    @abc.abstractmethod
+    def summarize(node) -> str:
+        """Return the one-line description of a node."""
+
+    @staticmethod
+    @abc.abstractmethod
+    def is_expandable(node) -> bool:
+        """Return if the node has children or a preview."""
+
+    @staticmethod
+    @abc.abstractmethod
+    def child_items(node) -> Sequence[tuple]:
+        """Return the keys and values of the children of a node.
+
+        The sequence is only sliced per shown page, so its values may be computed lazily,
+        see `_ChildItems`.
+        """
+
+    @staticmethod
+    def tooltip(node) -> str:
+        """Return the tooltip of an expandable node."""
+        return ""
+
+    def render_preview(self):
+        """Return a widget previewing the node or `None`."""
+        return None
+
+    def _show_next_page(self, _=None):
+        if self._items is None:
+            self._items = self.child_items(self.node)
+        items = self._items
+        start = len(self._nodes)
+        stop = min(start + self.page_size, len(items))
+        self._nodes += [type(self)(k, v, self.page_size) for k, v in items[start:stop]]
+
+        children = ([self.preview] if self.preview is not None else []) + self._nodes
+        remaining = len(items) - stop
+        if remaining:
+            more = Button(description=f"show {min(remaining, self.page_size)} more of {remaining}")
+            more.layout = button_layout
+            more.on_click(self._show_next_page)
+            children.append(more)
+        self._children_box.children = children
+
+    def toggle(self, _=None):
+        """Expand or collapse the node."""
+        if self._children_box is None:
+            self._children_box = VBox(layout=Layout(margin="0 0 0 20px"))
+            self.preview = self.render_preview()
+            self._show_next_page()
+        self.expanded = not self.expanded
+        arrow = "▾" if self.expanded else "▸"
+        self.button.description = f"{arrow} {self._label}"
+        self.children = [self.button, self._children_box] if self.expanded else [self.button]
+
+    def close(self):
+        """Close the node and the nodes created for its children."""
+        for node in self._nodes:
+            node.close()
+        super().close()
+
+
+class _HeaderNode(_LazyNode):
+    summarize = staticmethod(summarize_node)
+    is_expandable = staticmethod(_is_expandable)
+    child_items = staticmethod(_child_items)
+
+    @staticmethod
+    def tooltip(node) -> str:
+        return getattr(node, "_tag", None) or ""
+
+
+class WidgetHeaderBrowser(WidgetMyVBox):
+    """Browse the ASDF header of a weldx file.
+
+    Nodes are expanded on click, only then their children are created. Long lists and
+    mappings are shown in pages of ``page_size`` items. Arrays are summarized by their
+    shape, data type and block index, their data is never loaded.
+
+    Parameters
+    ----------
+    tree :
+        The header tree, e.g. as returned by `load_header`.
+    page_size :
+        Number of children shown at once per node.
+    title :
+        Label of the root node.
+
+    """
+
+    def __init__(self, tree: dict, page_size: int = 50, title: str = "ASDF header"):
+        self.tree = tree
+        self.root = _HeaderNode(title, tree, page_size, expanded=True)
+        super().__init__(children=[self.root])
+
+    @classmethod
+    def from_file(cls, file: WeldxFile, page_size: int = 50) -> WidgetHeaderBrowser:
+        """Create a browser of the header of the given file, see `load_header`."""
+        return cls(load_header(file), page_size=page_size)
@@ -1,9 +1,21 @@
 """Widget to wrap around a measurement."""
 
+import os
+
+import numpy as np
+import pandas as pd
 from matplotlib import pylab as plt
 
 import weldx
 from weldx.constants import WELDX_UNIT_REGISTRY as ureg
+from weldx_widgets.figures import figure_registry
+from weldx_widgets.visualization.decimation import (
+    DecimatedLine,
+    MinMaxPyramid,
+    PyramidCache,
+    SecondsAxis,
+    default_pyramid_cache,
+)
 from weldx_widgets.widget_base import WidgetSimpleOutput
 from weldx_widgets.widget_factory import make_title
 
@@ -22,15 +34,82 @@ def ipympl_style(fig, toolbar=True):
         pass
 
 
-def plot_signal(signal: weldx.measurement.Signal, name, limits=None, ax=None):
-    """Plot a single weldx signal."""
-    if not ax:
-        fig, ax = plt.subplots(figsize=(_DEFAULT_FIGWIDTH, 6))
+def signal_pyramid(
+    signal: weldx.measurement.Signal, cache: PyramidCache = None, source: tuple = None
+) -> MinMaxPyramid | None:
+    """Return the decimation pyramid of a one-dimensional signal, otherwise `None`.
 
+    If a ``cache`` is given, the decimation levels are taken from or stored in it. The
+    ``source`` of signals read from a file is passed to `PyramidCache.get`.
+    """
     data = signal.data
-    time = weldx.Time(data.time).as_quantity()
+    values = data.data.m
+    if np.ndim(values) != 1 or data.time is None:
+        return None
+    time = _seconds(data.time)
+    if cache is not None:
+        return cache.get(time, values, source)
+    return MinMaxPyramid(time, values)
+
+
+def _seconds(time: weldx.Time) -> SecondsAxis:
+    """Return a time axis in seconds, without converting it at once.
+
+    Like `weldx.Time.as_quantity`, absolute times are relative to the reference time.
+    """
+    index = time.as_pandas_index()
+    if isinstance(index, pd.DatetimeIndex):
+        return SecondsAxis(index.asi8, pd.Timestamp(time.reference_time).value)
+    return SecondsAxis(index.asi8)
+
+
+def _file_name(file) -> str | None:
+    """Return the path of a weldx file opened from disk, otherwise `None`."""
+    name = getattr(file.file_handle, "name", None)
+    return name if isinstance(name, str) and os.path.isfile(name) else None
+
+
+def measurement_pyramids(measurements, cache: PyramidCache = None, filename=None) -> list[MinMaxPyramid | None]:
+    """Return the decimation pyramids of the last signals of the given measurements.
 
-    ax.plot(time.m, data.data.m)
+    Pass the ``filename`` of the file holding the measurements, so cached pyramids are
+    found without hashing the signals.
+    """
+    pyramids = []
+    for i, m in enumerate(measurements):
+        source = None if filename is None else (filename, f"measurements/{i}")
+        pyramids.append(signal_pyramid(m.measurement_chain.signals[-1], cache, source))
+    return pyramids
+
+
+def plot_signal(
+    signal: weldx.measurement.Signal,
+    name,
+    limits=None,
+    ax=None,
+    decimate=True,
+    cache: PyramidCache = None,
+    pyramid: MinMaxPyramid = None,
+):
+    """Plot a single weldx signal.
+
+    One-dimensional signals are decimated to the resolution of the axes and
+    re-decimated on zoom, unless ``decimate`` is `False`.
+    Returns the `DecimatedLine` in that case, otherwise `None`.
+    The decimation ``pyramid`` may be passed, if it has already been computed.
+    """
+    if not ax:
+        fig, ax = plt.subplots(figsize=(_DEFAULT_FIGWIDTH, 6))
+
+    line = None
+    if decimate and pyramid is None:
+        pyramid = signal_pyramid(signal, cache)
+    if decimate and pyramid is not None:
+        line = DecimatedLine(ax, pyramid)
+    else:
+        data = signal.data
+        time = weldx.Time(data.time).as_quantity()
+        ax.plot(time.m, data.data.m)
     ax.set_ylabel(f"{name} / {ureg.Unit(signal.units):~}")
     ax.set_xlabel("time / s")
     ax.grid()
@@ -39,17 +118,35 @@ def plot_signal(signal: weldx.measurement.Signal, name, limits=None, ax=None):
         ax.set_xlim(limits)
 
     ipympl_style(ax.figure)
+    return line
 
 
 def plot_measurements(
     measurement_data,
     axes,
     limits=None,
+    lines=None,
+    cache: PyramidCache = None,
+    pyramids: list[MinMaxPyramid | None] = None,
 ):
-    """Plot several measurements sharing time axis."""
+    """Plot several measurements sharing time axis.
+
+    If a list is passed as ``lines``, the decimated lines are appended to it.
+    """
+    if pyramids is None:
+        pyramids = [None] * len(measurement_data)
     for i, measurement in enumerate(measurement_data):
         last_signal = measurement.measurement_chain.signals[-1]
-        plot_signal(last_signal, measurement.name, ax=axes[i], limits=limits)
+        line = plot_signal(
+            last_signal,
+            measurement.name,
+            ax=axes[i],
+            limits=limits,
+            cache=cache,
+            pyramid=pyramids[i],
+        )
+        if line is not None and lines is not None:
+            lines.append(line)
         axes[i].set_xlabel(None)
 
     axes[-1].set_xlabel("time / s")
@@ -58,20 +155,43 @@ def plot_measurements(
 
 
 class WidgetMeasurement(WidgetSimpleOutput):
-    """Widget to wrap around a measurement."""
-
-    def __init__(self, measurements: list["weldx.measurement.Measurement"], out=None):
+    """Widget to wrap around a measurement.
+
+    The signals are plotted decimated to screen resolution. Zooming into the shared
+    time axis re-decimates the visible window only, down to the raw samples.
+    By default, the decimation levels are only cached on disk, if the cache root
+    directory is set by the environment variable ``WELDX_WIDGETS_CACHE_DIR`` (see
+    `default_pyramid_cache`). Pass a `PyramidCache` to use a custom cache directory,
+    `False` to skip caching, and the ``filename`` the measurements were read from, so
+    cached levels are found without reading the raw signals.
+    Already computed ``pyramids`` (see `measurement_pyramids`) can be passed as well.
+    """
+
+    def __init__(
+        self,
+        measurements: list["weldx.measurement.Measurement"],
+        out=None,
+        cache: PyramidCache | bool = True,
+        pyramids: list[MinMaxPyramid | None] = None,
+        filename=None,
+    ):
         super().__init__(out=out)
+        if cache is True:
+            cache = default_pyramid_cache()
+        self.cache = cache or None
+        if pyramids is None and self.cache is not None:
+            pyramids = measurement_pyramids(measurements, self.cache, filename)
 
         n = len(measurements)
+        self.lines: list[DecimatedLine] = []
 
-        with self:
+        with self, figure_registry.track(self):
             self.fig, self.axes = plt.subplots(
                 nrows=n,
                 sharex="all",
                 figsize=(_DEFAULT_FIGWIDTH, 2.5 * n),
             )
-            plot_measurements(measurements, axes=self.axes)
+            plot_measurements(measurements, axes=self.axes, lines=self.lines, cache=self.cache, pyramids=pyramids)
             ipympl_style(self.fig)
             self.fig.tight_layout()
             plt.show()
@@ -82,7 +202,7 @@ class WidgetMeasurementChain(WidgetSimpleOutput):
 
     def __init__(self, measurements, out=None):
         super().__init__(out=out)
-        with self:
+        with self, figure_registry.track(self):
             fig, ax = plt.subplots(nrows=len(measurements), figsize=(_DEFAULT_FIGWIDTH, 18))
             for i, measurement in enumerate(measurements):
                 measurement.measurement_chain.plot(ax[i])
@@ -1,25 +1,234 @@
 """Widget to handle a WeldxFile."""
 
-from weldx import WeldxFile
+from __future__ import annotations
 
-__all__ = ["WidgetWeldxFile"]
+import dataclasses
+import functools
+from collections.abc import Callable, Mapping
+from pathlib import Path
 
+import matplotlib.pyplot as plt
+import numpy as np
+import pint
+from IPython.display import display
+from ipywidgets import Output, Tab
 
-class WidgetWeldxFile:
-    """Widget to handle a WeldxFile.
+from weldx import CoordinateSystemManager, SpatialData, TimeSeries, WeldxFile
+from weldx_widgets.figures import figure_registry
+from weldx_widgets.widget_base import WidgetBase, metaclass_resolver
+from weldx_widgets.widget_header import WidgetHeaderBrowser, _ChildItems, _LazyNode
 
-    this should aid:
-    * the creation (filename, uri, buffer, url_parameter?)
-    * visualization (header, saved objects?)
-    * saving/updating
+__all__ = ["WidgetWeldxFile", "register_preview"]
 
-    consider a prime widget like ipytree to handle the tree like structure and
-    provide useful elements within the tree (e.g. plots of U, I), CSM tree visualization
+_PREVIEWS: dict[type, Callable] = {}
+_MAX_VALUE_LENGTH = 80
+_SPARKLINE_SAMPLES = 500
+_THUMBNAIL_POINTS = 100_000
+_THUMBNAIL_TRIANGLES = 100_000
+
+
+def register_preview(cls: type):
+    """Register a function rendering a preview of instances of ``cls`` in the tree.
+
+    The function is called with the object and has to return a widget. It is only
+    called when the node of the object is expanded for the first time.
+    """
+
+    def decorator(func):
+        _PREVIEWS[cls] = func
+        return func
+
+    return decorator
+
+
+def _find_preview(obj) -> Callable | None:
+    for cls in type(obj).__mro__:
+        if cls in _PREVIEWS:
+            return _PREVIEWS[cls]
+    return None
+
+
+def _stride(length: int, num_samples: int) -> slice:
+    """Return a slice selecting about ``num_samples`` evenly strided items of a sequence."""
+    return slice(None, None, max(length // num_samples, 1))
+
+
+def _thumbnail_mesh(points: np.ndarray, triangles, max_triangles: int = _THUMBNAIL_TRIANGLES):
+    """Return the points and triangles of a mesh reduced to about ``max_triangles`` triangles.
+
+    Only the points of the kept triangles are returned, the triangles are renumbered
+    accordingly.
+    """
+    triangles = np.asarray(triangles[_stride(len(triangles), max_triangles)])
+    used, inverse = np.unique(triangles, return_inverse=True)
+    return np.asarray(points[used], dtype=np.float32), inverse.reshape(triangles.shape).astype(np.uint32)
+
+
+@register_preview(TimeSeries)
+def _preview_time_series(ts: TimeSeries):
+    out = Output()
+    with out:
+        if ts.is_expression or ts.time is None:
+            print(ts.data)  # noqa: T201
+            return out
+        # only the sampled points of the time axis are converted.
+        samples = _stride(len(ts.time), _SPARKLINE_SAMPLES)
+        time = ts.time[samples].as_quantity().m
+        values = np.asarray(ts.data.m[samples])
+        fig, ax = plt.subplots(figsize=(4, 1))
+        ax.plot(time, values.reshape(len(values), -1), linewidth=0.8)
+        ax.set_xlabel("time / s")
+        ax.set_ylabel(f"{ts.units:~}")
+        for spine in ("top", "right"):
+            ax.spines[spine].set_visible(False)
+        plt.show()
+    return out
+
+
+@register_preview(SpatialData)
+def _preview_spatial_data(data: SpatialData):
+    import k3d
+
+    coordinates = data.coordinates.data
+    points = np.asarray(coordinates.m).reshape(-1, 3)
+    out = Output()
+    with out:
+        lower, upper = np.nanmin(points, axis=0), np.nanmax(points, axis=0)
+        unit = f"{coordinates.u:~}"
+        print(f"{len(points)} points", end="")  # noqa: T201
+        if data.triangles is not None:
+            print(f", {len(data.triangles)} triangles", end="")  # noqa: T201
+        print(f"\nbounding box: {lower} to {upper} {unit}")  # noqa: T201
+
+        plot = k3d.plot(height=240, grid_visible=False, menu_visibility=False, camera_auto_fit=True)
+        # the thumbnail is sent to the frontend, large meshes and point clouds are reduced.
+        if data.triangles is not None:
+            plot += k3d.mesh(*_thumbnail_mesh(points, data.triangles), wireframe=True)
+        else:
+            thumbnail = np.asarray(points[_stride(len(points), _THUMBNAIL_POINTS)], dtype=np.float32)
+            plot += k3d.points(thumbnail, point_size=float(np.nanmax(upper - lower)) / 200 or 0.1)
+        display(plot)
+    return out
+
+
+@register_preview(CoordinateSystemManager)
+def _preview_csm(csm: CoordinateSystemManager):
+    out = Output()
+    with out:
+        fig, ax = plt.subplots(figsize=(5, 4))
+        csm.plot_graph(ax=ax)
+        plt.show()
+    return out
+
+
+def summarize_object(obj) -> str:
+    """Return a one-line description of an object of a weldx file without loading arrays."""
+    name = type(obj).__name__
+    if isinstance(obj, Mapping):
+        return f"{name} {{{len(obj)} keys}}"
+    if isinstance(obj, (list, tuple)):
+        return f"{name} [{len(obj)} items]"
+    scalar_quantity = isinstance(obj, pint.Quantity) and np.ndim(obj.m) == 0
+    if scalar_quantity or isinstance(obj, (str, int, float, bool, type(None))):
+        value = f"{obj:~}" if scalar_quantity else repr(obj)
+        if len(value) > _MAX_VALUE_LENGTH:
+            value = value[: _MAX_VALUE_LENGTH - 3] + "..."
+        return value
+    shape = getattr(obj, "shape", None)
+    if isinstance(shape, tuple):
+        dtype = getattr(obj, "dtype", None)
+        summary = f"{name} {dtype} {shape}" if dtype is not None else f"{name} {shape}"
+        units = getattr(obj, "units", None)
+        return f"{summary} [{units:~}]" if isinstance(units, pint.Unit) else summary
+    return name
+
+
+class _ObjectNode(_LazyNode):
+    summarize = staticmethod(summarize_object)
+
+    @staticmethod
+    def is_expandable(node) -> bool:
+        if isinstance(node, (Mapping, list, tuple)):
+            return bool(len(node))
+        return dataclasses.is_dataclass(node) or _find_preview(node) is not None
+
+    @staticmethod
+    def child_items(node) -> _ChildItems:
+        # the children are only accessed, i.e. converted by lazy files, per shown page.
+        if isinstance(node, Mapping):
+            return _ChildItems(list(node.keys()), node.__getitem__)
+        if isinstance(node, (list, tuple)):
+            return _ChildItems(range(len(node)), node.__getitem__)
+        if dataclasses.is_dataclass(node):
+            return _ChildItems([f.name for f in dataclasses.fields(node)], functools.partial(getattr, node))
+        return _ChildItems([], None)
+
+    @staticmethod
+    def tooltip(node) -> str:
+        return f"{type(node).__module__}.{type(node).__qualname__}"
+
+    def render_preview(self):
+        preview = _find_preview(self.node)
+        if preview is None:
+            return None
+        with figure_registry.track(self):
+            return preview(self.node)
+
+
+class WidgetWeldxFile(metaclass_resolver(Tab, WidgetBase)):
+    """Navigate the contents of a WeldxFile.
+
+    The "Tree" tab shows the objects of the file as a tree, whose nodes are created when
+    their parent is expanded. Expanding a `weldx.TimeSeries`, `weldx.SpatialData` or
+    `weldx.CoordinateSystemManager` shows a preview: a sparkline, the bounding box and a
+    k3d thumbnail or the graph of coordinate systems. Previews for further types can be
+    added with `register_preview`. Arrays are only read by the previews, time series
+    only at the sampled points.
+
+    The objects of a page of children are accessed when it is shown. Only files opened
+    with ``lazy_tree=True`` convert the objects at this point, other files are converted
+    completely when opened. Paths are therefore opened lazily, see
+    `weldx_widgets.widget_evaluate.open_lazy`.
+
+    The "Header" tab shows the stored ASDF header with a `WidgetHeaderBrowser`.
+
+    Parameters
+    ----------
+    wx_file :
+        The file to navigate or its path.
+    page_size :
+        Number of children shown at once per node.
 
     """
 
-    def __init__(self, wx_file: WeldxFile):
+    def __init__(self, wx_file: WeldxFile | str | Path, page_size: int = 50):
+        if isinstance(wx_file, (str, Path)):
+            from weldx_widgets.widget_evaluate import open_lazy
+
+            wx_file = open_lazy(wx_file)
         self.file = wx_file
+        self.page_size = page_size
+        self.tree = _ObjectNode("file", wx_file, page_size, expanded=True)
+        self._header_out = Output()
+        self.header_browser = None
+
+        super().__init__(children=[self.tree, self._header_out])
+        self.set_title(0, "Tree")
+        self.set_title(1, "Header")
+        self.observe(self._on_tab_selected, names="selected_index")
+
+    def _on_tab_selected(self, change):
+        if change["new"] == 1 and self.header_browser is None:
+            self.header_browser = WidgetHeaderBrowser.from_file(self.file, page_size=self.page_size)
+            with self._header_out:
+                display(self.header_browser)
+
+    def close(self):
+        """Close the widget, the nodes of the tree and the figures of their previews."""
+        self.tree.close()
+        if self.header_browser is not None:
+            self.header_browser.close()
+        super().close()
 
     def show_header(self):
         """Show ASDF header."""
@@ -27,4 +236,5 @@ class WidgetWeldxFile:
 
     def display(self):
         """Show the file."""
-        raise NotImplementedError
+        display(self)
+        return self